@@ -0,0 +1,326 @@
+"""Initial schema
+
+Revision ID: 5f2c8e1a9b3d
+Revises: 
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5f2c8e1a9b3d'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('academic_years',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('year', sa.String(length=20), nullable=False),
+    sa.Column('start_date', sa.String(length=10), nullable=False),
+    sa.Column('end_date', sa.String(length=10), nullable=False),
+    sa.Column('is_current', sa.Boolean(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('year')
+    )
+    op.create_index(op.f('ix_academic_years_id'), 'academic_years', ['id'], unique=False)
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('email', sa.String(length=255), nullable=False),
+    sa.Column('username', sa.String(length=100), nullable=False),
+    sa.Column('hashed_password', sa.String(length=255), nullable=False),
+    sa.Column('first_name', sa.String(length=100), nullable=False),
+    sa.Column('last_name', sa.String(length=100), nullable=False),
+    sa.Column('phone', sa.String(length=20), nullable=True),
+    sa.Column('role', sa.Enum('SUPER_ADMIN', 'ADMIN', 'TEACHER', 'STUDENT', 'PARENT', 'STAFF', name='userrole'), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('is_verified', sa.Boolean(), nullable=True),
+    sa.Column('profile_photo', sa.String(length=255), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('last_login', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+    op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
+    op.create_index(op.f('ix_users_username'), 'users', ['username'], unique=True)
+    op.create_table('parents',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('occupation', sa.String(length=255), nullable=True),
+    sa.Column('annual_income', sa.String(length=50), nullable=True),
+    sa.Column('address_line1', sa.String(length=255), nullable=True),
+    sa.Column('address_line2', sa.String(length=255), nullable=True),
+    sa.Column('city', sa.String(length=100), nullable=True),
+    sa.Column('state', sa.String(length=100), nullable=True),
+    sa.Column('pincode', sa.String(length=10), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id')
+    )
+    op.create_index(op.f('ix_parents_id'), 'parents', ['id'], unique=False)
+    op.create_table('teachers',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('employee_id', sa.String(length=50), nullable=False),
+    sa.Column('qualification', sa.String(length=255), nullable=True),
+    sa.Column('specialization', sa.String(length=255), nullable=True),
+    sa.Column('experience_years', sa.Integer(), nullable=True),
+    sa.Column('joining_date', sa.Date(), nullable=False),
+    sa.Column('address_line1', sa.String(length=255), nullable=True),
+    sa.Column('address_line2', sa.String(length=255), nullable=True),
+    sa.Column('city', sa.String(length=100), nullable=True),
+    sa.Column('state', sa.String(length=100), nullable=True),
+    sa.Column('pincode', sa.String(length=10), nullable=True),
+    sa.Column('emergency_contact_name', sa.String(length=255), nullable=True),
+    sa.Column('emergency_contact_phone', sa.String(length=20), nullable=True),
+    sa.Column('emergency_contact_relation', sa.String(length=50), nullable=True),
+    sa.Column('is_class_teacher', sa.Boolean(), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id')
+    )
+    op.create_index(op.f('ix_teachers_employee_id'), 'teachers', ['employee_id'], unique=True)
+    op.create_index(op.f('ix_teachers_id'), 'teachers', ['id'], unique=False)
+    op.create_table('classes',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('level', sa.Integer(), nullable=False),
+    sa.Column('academic_year_id', sa.Integer(), nullable=False),
+    sa.Column('class_teacher_id', sa.Integer(), nullable=True),
+    sa.Column('max_students', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['academic_year_id'], ['academic_years.id'], ),
+    sa.ForeignKeyConstraint(['class_teacher_id'], ['teachers.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_classes_id'), 'classes', ['id'], unique=False)
+    op.create_table('sections',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('class_id', sa.Integer(), nullable=False),
+    sa.Column('max_students', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['class_id'], ['classes.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_sections_id'), 'sections', ['id'], unique=False)
+    op.create_table('subjects',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('code', sa.String(length=20), nullable=False),
+    sa.Column('class_id', sa.Integer(), nullable=False),
+    sa.Column('description', sa.String(length=500), nullable=True),
+    sa.Column('credits', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['class_id'], ['classes.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('code')
+    )
+    op.create_index(op.f('ix_subjects_id'), 'subjects', ['id'], unique=False)
+    op.create_table('assessments',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('subject_id', sa.Integer(), nullable=False),
+    sa.Column('teacher_id', sa.Integer(), nullable=False),
+    sa.Column('assessment_type', sa.Enum('ASSIGNMENT', 'QUIZ', 'TEST', 'MID_TERM', 'FINAL_EXAM', 'PROJECT', 'PRACTICAL', 'PRESENTATION', 'HOMEWORK', name='assessmenttype'), nullable=False),
+    sa.Column('total_marks', sa.Float(), nullable=False),
+    sa.Column('passing_marks', sa.Float(), nullable=True),
+    sa.Column('weightage', sa.Float(), nullable=True),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('due_date', sa.Date(), nullable=True),
+    sa.Column('duration_minutes', sa.Integer(), nullable=True),
+    sa.Column('is_published', sa.Boolean(), nullable=True),
+    sa.Column('instructions', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['subject_id'], ['subjects.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['teacher_id'], ['teachers.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_assessments_id'), 'assessments', ['id'], unique=False)
+    op.create_table('students',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('admission_number', sa.String(length=50), nullable=False),
+    sa.Column('roll_number', sa.String(length=50), nullable=True),
+    sa.Column('date_of_birth', sa.Date(), nullable=False),
+    sa.Column('gender', sa.Enum('MALE', 'FEMALE', 'OTHER', name='gender'), nullable=False),
+    sa.Column('blood_group', sa.Enum('A_POSITIVE', 'A_NEGATIVE', 'B_POSITIVE', 'B_NEGATIVE', 'AB_POSITIVE', 'AB_NEGATIVE', 'O_POSITIVE', 'O_NEGATIVE', name='bloodgroup'), nullable=True),
+    sa.Column('nationality', sa.String(length=100), nullable=True),
+    sa.Column('religion', sa.String(length=100), nullable=True),
+    sa.Column('category', sa.String(length=50), nullable=True),
+    sa.Column('address_line1', sa.String(length=255), nullable=True),
+    sa.Column('address_line2', sa.String(length=255), nullable=True),
+    sa.Column('city', sa.String(length=100), nullable=True),
+    sa.Column('state', sa.String(length=100), nullable=True),
+    sa.Column('pincode', sa.String(length=10), nullable=True),
+    sa.Column('country', sa.String(length=100), nullable=True),
+    sa.Column('medical_conditions', sa.Text(), nullable=True),
+    sa.Column('allergies', sa.Text(), nullable=True),
+    sa.Column('medications', sa.Text(), nullable=True),
+    sa.Column('emergency_contacts', sa.JSON(), nullable=True),
+    sa.Column('class_id', sa.Integer(), nullable=True),
+    sa.Column('section_id', sa.Integer(), nullable=True),
+    sa.Column('admission_date', sa.Date(), nullable=False),
+    sa.Column('previous_school', sa.String(length=255), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=True),
+    sa.ForeignKeyConstraint(['class_id'], ['classes.id'], ),
+    sa.ForeignKeyConstraint(['section_id'], ['sections.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id')
+    )
+    op.create_index(op.f('ix_students_admission_number'), 'students', ['admission_number'], unique=True)
+    op.create_index(op.f('ix_students_id'), 'students', ['id'], unique=False)
+    op.create_table('subject_teachers',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('subject_id', sa.Integer(), nullable=False),
+    sa.Column('teacher_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['subject_id'], ['subjects.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['teacher_id'], ['teachers.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_subject_teachers_id'), 'subject_teachers', ['id'], unique=False)
+    op.create_table('attendance',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('student_id', sa.Integer(), nullable=False),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('status', sa.Enum('PRESENT', 'ABSENT', 'LATE', 'HALF_DAY', 'SICK_LEAVE', 'EXCUSED', name='attendancestatus'), nullable=False),
+    sa.Column('check_in_time', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('check_out_time', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('remarks', sa.Text(), nullable=True),
+    sa.Column('marked_by', sa.Integer(), nullable=True),
+    sa.Column('marked_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('period_number', sa.Integer(), nullable=True),
+    sa.Column('subject_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['marked_by'], ['teachers.id'], ),
+    sa.ForeignKeyConstraint(['student_id'], ['students.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['subject_id'], ['subjects.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_attendance_date'), 'attendance', ['date'], unique=False)
+    op.create_index(op.f('ix_attendance_id'), 'attendance', ['id'], unique=False)
+    op.create_table('attendance_reports',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('student_id', sa.Integer(), nullable=False),
+    sa.Column('month', sa.Integer(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('total_days', sa.Integer(), nullable=True),
+    sa.Column('present_days', sa.Integer(), nullable=True),
+    sa.Column('absent_days', sa.Integer(), nullable=True),
+    sa.Column('late_days', sa.Integer(), nullable=True),
+    sa.Column('sick_leave_days', sa.Integer(), nullable=True),
+    sa.Column('excused_days', sa.Integer(), nullable=True),
+    sa.Column('attendance_percentage', sa.String(length=10), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['student_id'], ['students.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_attendance_reports_id'), 'attendance_reports', ['id'], unique=False)
+    op.create_table('grades',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('student_id', sa.Integer(), nullable=False),
+    sa.Column('assessment_id', sa.Integer(), nullable=False),
+    sa.Column('subject_id', sa.Integer(), nullable=False),
+    sa.Column('teacher_id', sa.Integer(), nullable=False),
+    sa.Column('marks_obtained', sa.Float(), nullable=True),
+    sa.Column('grade', sa.Enum('A_PLUS', 'A', 'B_PLUS', 'B', 'C_PLUS', 'C', 'D', 'F', name='gradescale'), nullable=True),
+    sa.Column('percentage', sa.Float(), nullable=True),
+    sa.Column('is_absent', sa.Boolean(), nullable=True),
+    sa.Column('remarks', sa.Text(), nullable=True),
+    sa.Column('feedback', sa.Text(), nullable=True),
+    sa.Column('submitted_on', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('graded_on', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['assessment_id'], ['assessments.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['student_id'], ['students.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['subject_id'], ['subjects.id'], ),
+    sa.ForeignKeyConstraint(['teacher_id'], ['teachers.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_grades_id'), 'grades', ['id'], unique=False)
+    op.create_table('parent_students',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('parent_id', sa.Integer(), nullable=False),
+    sa.Column('student_id', sa.Integer(), nullable=False),
+    sa.Column('relation', sa.String(length=50), nullable=False),
+    sa.Column('is_primary_contact', sa.Boolean(), nullable=True),
+    sa.ForeignKeyConstraint(['parent_id'], ['parents.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['student_id'], ['students.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_parent_students_id'), 'parent_students', ['id'], unique=False)
+    op.create_table('report_cards',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('student_id', sa.Integer(), nullable=False),
+    sa.Column('class_id', sa.Integer(), nullable=False),
+    sa.Column('academic_year_id', sa.Integer(), nullable=False),
+    sa.Column('term', sa.String(length=50), nullable=False),
+    sa.Column('total_marks', sa.Float(), nullable=True),
+    sa.Column('marks_obtained', sa.Float(), nullable=True),
+    sa.Column('percentage', sa.Float(), nullable=True),
+    sa.Column('grade', sa.String(length=10), nullable=True),
+    sa.Column('rank', sa.Integer(), nullable=True),
+    sa.Column('attendance_percentage', sa.Float(), nullable=True),
+    sa.Column('total_days', sa.Integer(), nullable=True),
+    sa.Column('present_days', sa.Integer(), nullable=True),
+    sa.Column('conduct_grade', sa.String(length=50), nullable=True),
+    sa.Column('teacher_remarks', sa.Text(), nullable=True),
+    sa.Column('principal_remarks', sa.Text(), nullable=True),
+    sa.Column('is_published', sa.Boolean(), nullable=True),
+    sa.Column('published_date', sa.Date(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['academic_year_id'], ['academic_years.id'], ),
+    sa.ForeignKeyConstraint(['class_id'], ['classes.id'], ),
+    sa.ForeignKeyConstraint(['student_id'], ['students.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_report_cards_id'), 'report_cards', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_report_cards_id'), table_name='report_cards')
+    op.drop_table('report_cards')
+    op.drop_index(op.f('ix_parent_students_id'), table_name='parent_students')
+    op.drop_table('parent_students')
+    op.drop_index(op.f('ix_grades_id'), table_name='grades')
+    op.drop_table('grades')
+    op.drop_index(op.f('ix_attendance_reports_id'), table_name='attendance_reports')
+    op.drop_table('attendance_reports')
+    op.drop_index(op.f('ix_attendance_id'), table_name='attendance')
+    op.drop_index(op.f('ix_attendance_date'), table_name='attendance')
+    op.drop_table('attendance')
+    op.drop_index(op.f('ix_subject_teachers_id'), table_name='subject_teachers')
+    op.drop_table('subject_teachers')
+    op.drop_index(op.f('ix_students_id'), table_name='students')
+    op.drop_index(op.f('ix_students_admission_number'), table_name='students')
+    op.drop_table('students')
+    op.drop_index(op.f('ix_assessments_id'), table_name='assessments')
+    op.drop_table('assessments')
+    op.drop_index(op.f('ix_subjects_id'), table_name='subjects')
+    op.drop_table('subjects')
+    op.drop_index(op.f('ix_sections_id'), table_name='sections')
+    op.drop_table('sections')
+    op.drop_index(op.f('ix_classes_id'), table_name='classes')
+    op.drop_table('classes')
+    op.drop_index(op.f('ix_teachers_id'), table_name='teachers')
+    op.drop_index(op.f('ix_teachers_employee_id'), table_name='teachers')
+    op.drop_table('teachers')
+    op.drop_index(op.f('ix_parents_id'), table_name='parents')
+    op.drop_table('parents')
+    op.drop_index(op.f('ix_users_username'), table_name='users')
+    op.drop_index(op.f('ix_users_id'), table_name='users')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_table('users')
+    op.drop_index(op.f('ix_academic_years_id'), table_name='academic_years')
+    op.drop_table('academic_years')
+
+    bind = op.get_bind()
+    for enum_name in ("gradescale", "attendancestatus", "bloodgroup", "gender", "assessmenttype", "userrole"):
+        sa.Enum(name=enum_name).drop(bind, checkfirst=True)
@@ -0,0 +1,42 @@
+"""Student search trigram indexes
+
+Revision ID: a7d41c6e2f90
+Revises: 5f2c8e1a9b3d
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7d41c6e2f90'
+down_revision = '5f2c8e1a9b3d'
+branch_labels = None
+depends_on = None
+
+TRIGRAM_INDEXES = [
+    ("ix_users_first_name_trgm", "users", "first_name"),
+    ("ix_users_last_name_trgm", "users", "last_name"),
+    ("ix_users_email_trgm", "users", "email"),
+    ("ix_students_admission_number_trgm", "students", "admission_number"),
+]
+
+
+def upgrade() -> None:
+    # pg_trgm is a trusted extension (PostgreSQL 13+), no superuser needed
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRIGRAM_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(TRIGRAM_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,68 @@
+"""Attendance and grade composite indexes and uniqueness
+
+Revision ID: c3e9b5d17a42
+Revises: a7d41c6e2f90
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3e9b5d17a42'
+down_revision = 'a7d41c6e2f90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Remove duplicates the application-level checks let through, keeping the
+    # first row written, so the unique indexes can be built
+    op.execute(
+        """
+        DELETE FROM attendance a
+        USING attendance b
+        WHERE a.student_id = b.student_id
+          AND a.date = b.date
+          AND coalesce(a.period_number, 0) = coalesce(b.period_number, 0)
+          AND a.id > b.id
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM grades a
+        USING grades b
+        WHERE a.assessment_id = b.assessment_id
+          AND a.student_id = b.student_id
+          AND a.id > b.id
+        """
+    )
+
+    op.create_index(
+        'uq_attendance_student_date_period',
+        'attendance',
+        ['student_id', 'date', sa.text('coalesce(period_number, 0)')],
+        unique=True,
+    )
+    op.create_index('ix_attendance_student_date', 'attendance', ['student_id', 'date', 'id'], unique=False)
+
+    op.create_unique_constraint('uq_grades_assessment_student', 'grades', ['assessment_id', 'student_id'])
+    op.create_index('ix_grades_student_subject', 'grades', ['student_id', 'subject_id', 'id'], unique=False)
+
+    op.create_index('ix_assessments_date', 'assessments', ['date', 'id'], unique=False)
+    op.create_index('ix_assessments_teacher_date', 'assessments', ['teacher_id', 'date', 'id'], unique=False)
+    op.create_index('ix_assessments_subject_date', 'assessments', ['subject_id', 'date', 'id'], unique=False)
+
+    op.create_index('ix_students_class_section', 'students', ['class_id', 'section_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_students_class_section', table_name='students')
+    op.drop_index('ix_assessments_subject_date', table_name='assessments')
+    op.drop_index('ix_assessments_teacher_date', table_name='assessments')
+    op.drop_index('ix_assessments_date', table_name='assessments')
+    op.drop_index('ix_grades_student_subject', table_name='grades')
+    op.drop_constraint('uq_grades_assessment_student', 'grades', type_='unique')
+    op.drop_index('ix_attendance_student_date', table_name='attendance')
+    op.drop_index('uq_attendance_student_date_period', table_name='attendance')
@@ -0,0 +1,112 @@
+"""Partition attendance by month
+
+Revision ID: e61f0a8c4b27
+Revises: c3e9b5d17a42
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'e61f0a8c4b27'
+down_revision = 'c3e9b5d17a42'
+branch_labels = None
+depends_on = None
+
+# Months created ahead of the current one; scripts/manage_attendance_partitions.py keeps this going
+MONTHS_AHEAD = 3
+
+COLUMNS = (
+    "id, student_id, date, status, check_in_time, check_out_time, remarks, "
+    "marked_by, marked_at, period_number, subject_id"
+)
+
+
+def _create_attendance_table(partitioned: bool) -> None:
+    op.create_table('attendance',
+    sa.Column('id', sa.Integer(), server_default=sa.text("nextval('attendance_id_seq'::regclass)"), nullable=False),
+    sa.Column('student_id', sa.Integer(), nullable=False),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('status', postgresql.ENUM(name='attendancestatus', create_type=False), nullable=False),
+    sa.Column('check_in_time', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('check_out_time', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('remarks', sa.Text(), nullable=True),
+    sa.Column('marked_by', sa.Integer(), nullable=True),
+    sa.Column('marked_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('period_number', sa.Integer(), nullable=True),
+    sa.Column('subject_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['marked_by'], ['teachers.id'], ),
+    sa.ForeignKeyConstraint(['student_id'], ['students.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['subject_id'], ['subjects.id'], ),
+    sa.PrimaryKeyConstraint('id', 'date') if partitioned else sa.PrimaryKeyConstraint('id'),
+    **({'postgresql_partition_by': 'RANGE (date)'} if partitioned else {})
+    )
+
+
+def _create_attendance_indexes() -> None:
+    op.create_index('ix_attendance_date', 'attendance', ['date'], unique=False)
+    op.create_index('ix_attendance_id', 'attendance', ['id'], unique=False)
+    op.create_index(
+        'uq_attendance_student_date_period',
+        'attendance',
+        ['student_id', 'date', sa.text('coalesce(period_number, 0)')],
+        unique=True,
+    )
+    op.create_index('ix_attendance_student_date', 'attendance', ['student_id', 'date', 'id'], unique=False)
+
+
+def _swap_out_current_table() -> None:
+    """Rename the current table and free its index names."""
+    op.execute("ALTER TABLE attendance RENAME TO attendance_old")
+    op.execute("ALTER TABLE attendance_old RENAME CONSTRAINT attendance_pkey TO attendance_old_pkey")
+    for index in ('ix_attendance_date', 'ix_attendance_id', 'uq_attendance_student_date_period', 'ix_attendance_student_date'):
+        op.drop_index(index, table_name='attendance_old')
+
+
+def _copy_back_and_drop_old() -> None:
+    op.execute(f"INSERT INTO attendance ({COLUMNS}) SELECT {COLUMNS} FROM attendance_old")
+    op.execute("ALTER SEQUENCE attendance_id_seq OWNED BY attendance.id")
+    op.drop_table('attendance_old')
+
+
+def upgrade() -> None:
+    _swap_out_current_table()
+    _create_attendance_table(partitioned=True)
+
+    # One partition per month from the oldest row through MONTHS_AHEAD months
+    # from now, plus a default partition so an unplanned date never fails
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            partition_start date := date_trunc('month', coalesce((SELECT min(date) FROM attendance_old), current_date));
+            last_start date := date_trunc('month', current_date) + interval '{MONTHS_AHEAD} months';
+        BEGIN
+            WHILE partition_start <= last_start LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF attendance FOR VALUES FROM (%L) TO (%L)',
+                    'attendance_y' || to_char(partition_start, 'YYYY') || 'm' || to_char(partition_start, 'MM'),
+                    partition_start,
+                    (partition_start + interval '1 month')::date
+                );
+                partition_start := (partition_start + interval '1 month')::date;
+            END LOOP;
+        END
+        $$
+        """
+    )
+    op.execute("CREATE TABLE attendance_default PARTITION OF attendance DEFAULT")
+
+    # Indexes on the parent are created on every partition
+    _create_attendance_indexes()
+    _copy_back_and_drop_old()
+
+
+def downgrade() -> None:
+    _swap_out_current_table()
+    _create_attendance_table(partitioned=False)
+    _create_attendance_indexes()
+    _copy_back_and_drop_old()
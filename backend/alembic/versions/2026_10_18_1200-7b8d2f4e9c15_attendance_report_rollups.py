@@ -0,0 +1,53 @@
+"""Attendance report rollups
+
+Revision ID: 7b8d2f4e9c15
+Revises: e61f0a8c4b27
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7b8d2f4e9c15'
+down_revision = 'e61f0a8c4b27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('attendance_reports', sa.Column('half_day_days', sa.Integer(), server_default='0', nullable=True))
+
+    # Nothing wrote attendance_reports before, so rebuild it from scratch
+    op.execute("DELETE FROM attendance_reports")
+    op.create_unique_constraint(
+        'uq_attendance_reports_student_month', 'attendance_reports', ['student_id', 'year', 'month']
+    )
+    op.execute(
+        """
+        INSERT INTO attendance_reports (
+            student_id, year, month, total_days, present_days, absent_days, late_days,
+            half_day_days, sick_leave_days, excused_days, attendance_percentage
+        )
+        SELECT
+            student_id,
+            CAST(extract(year FROM date) AS integer),
+            CAST(extract(month FROM date) AS integer),
+            count(*),
+            count(*) FILTER (WHERE status = 'PRESENT'),
+            count(*) FILTER (WHERE status = 'ABSENT'),
+            count(*) FILTER (WHERE status = 'LATE'),
+            count(*) FILTER (WHERE status = 'HALF_DAY'),
+            count(*) FILTER (WHERE status = 'SICK_LEAVE'),
+            count(*) FILTER (WHERE status = 'EXCUSED'),
+            CAST(round(count(*) FILTER (WHERE status = 'PRESENT') * 100.0 / count(*), 2) AS varchar)
+        FROM attendance
+        GROUP BY 1, 2, 3
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_attendance_reports_student_month', 'attendance_reports', type_='unique')
+    op.drop_column('attendance_reports', 'half_day_days')
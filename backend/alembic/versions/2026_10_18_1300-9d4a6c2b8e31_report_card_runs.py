@@ -0,0 +1,73 @@
+"""Report card runs and per-term uniqueness
+
+Revision ID: 9d4a6c2b8e31
+Revises: 7b8d2f4e9c15
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9d4a6c2b8e31'
+down_revision = '7b8d2f4e9c15'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keep the most recent report card per student and term
+    op.execute(
+        """
+        DELETE FROM report_cards a
+        USING report_cards b
+        WHERE a.student_id = b.student_id
+          AND a.academic_year_id = b.academic_year_id
+          AND a.term = b.term
+          AND a.id < b.id
+        """
+    )
+    op.create_unique_constraint(
+        'uq_report_cards_student_term', 'report_cards', ['student_id', 'academic_year_id', 'term']
+    )
+
+    op.create_table('report_card_runs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('academic_year_id', sa.Integer(), nullable=False),
+    sa.Column('term', sa.String(length=50), nullable=False),
+    sa.Column('start_date', sa.Date(), nullable=False),
+    sa.Column('end_date', sa.Date(), nullable=False),
+    sa.Column('class_ids', sa.JSON(), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('total_classes', sa.Integer(), nullable=True),
+    sa.Column('completed_classes', sa.Integer(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['academic_year_id'], ['academic_years.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_report_card_runs_id'), 'report_card_runs', ['id'], unique=False)
+
+    op.create_table('report_card_run_classes',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('run_id', sa.Integer(), nullable=False),
+    sa.Column('class_id', sa.Integer(), nullable=False),
+    sa.Column('student_count', sa.Integer(), nullable=False),
+    sa.Column('completed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['class_id'], ['classes.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['run_id'], ['report_card_runs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('run_id', 'class_id', name='uq_report_card_run_classes_run_class')
+    )
+    op.create_index(op.f('ix_report_card_run_classes_id'), 'report_card_run_classes', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_report_card_run_classes_id'), table_name='report_card_run_classes')
+    op.drop_table('report_card_run_classes')
+    op.drop_index(op.f('ix_report_card_runs_id'), table_name='report_card_runs')
+    op.drop_table('report_card_runs')
+    op.drop_constraint('uq_report_cards_student_term', 'report_cards', type_='unique')
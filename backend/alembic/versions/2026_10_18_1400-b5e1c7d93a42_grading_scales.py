@@ -0,0 +1,84 @@
+"""Configurable grading scales; letter grades as text
+
+Revision ID: b5e1c7d93a42
+Revises: 9d4a6c2b8e31
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b5e1c7d93a42'
+down_revision = '9d4a6c2b8e31'
+branch_labels = None
+depends_on = None
+
+# Enum member names of the old gradescale type and the letters they stood for
+LETTERS = [
+    ('A_PLUS', 'A+'),
+    ('A', 'A'),
+    ('B_PLUS', 'B+'),
+    ('B', 'B'),
+    ('C_PLUS', 'C+'),
+    ('C', 'C'),
+    ('D', 'D'),
+    ('F', 'F'),
+]
+
+
+def upgrade() -> None:
+    op.create_table('grading_scales',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('class_id', sa.Integer(), nullable=True),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['class_id'], ['classes.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('class_id', name='uq_grading_scales_class')
+    )
+    op.create_index(op.f('ix_grading_scales_id'), 'grading_scales', ['id'], unique=False)
+    op.create_index(
+        'uq_grading_scales_default', 'grading_scales', [sa.text('(class_id IS NULL)')],
+        unique=True, postgresql_where=sa.text('class_id IS NULL'),
+    )
+
+    op.create_table('grading_scale_bands',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('scale_id', sa.Integer(), nullable=False),
+    sa.Column('letter', sa.String(length=10), nullable=False),
+    sa.Column('min_percentage', sa.Float(), nullable=False),
+    sa.Column('grade_points', sa.Float(), nullable=True),
+    sa.ForeignKeyConstraint(['scale_id'], ['grading_scales.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('scale_id', 'min_percentage', name='uq_grading_scale_bands_scale_min')
+    )
+    op.create_index(op.f('ix_grading_scale_bands_id'), 'grading_scale_bands', ['id'], unique=False)
+
+    # Letters come from configurable scales now, so store them as text
+    to_letter = ' '.join(f"WHEN '{name}' THEN '{letter}'" for name, letter in LETTERS)
+    op.execute(
+        f"ALTER TABLE grades ALTER COLUMN grade TYPE VARCHAR(10) "
+        f"USING CASE grade::text {to_letter} END"
+    )
+    op.execute("DROP TYPE gradescale")
+
+
+def downgrade() -> None:
+    names = ', '.join(f"'{name}'" for name, _ in LETTERS)
+    op.execute(f"CREATE TYPE gradescale AS ENUM ({names})")
+    # Letters outside the built-in scale cannot be represented and are cleared
+    to_name = ' '.join(f"WHEN '{letter}' THEN '{name}'::gradescale" for name, letter in LETTERS)
+    op.execute(
+        f"ALTER TABLE grades ALTER COLUMN grade TYPE gradescale "
+        f"USING CASE grade {to_name} END"
+    )
+
+    op.drop_index(op.f('ix_grading_scale_bands_id'), table_name='grading_scale_bands')
+    op.drop_table('grading_scale_bands')
+    op.drop_index('uq_grading_scales_default', table_name='grading_scales')
+    op.drop_index(op.f('ix_grading_scales_id'), table_name='grading_scales')
+    op.drop_table('grading_scales')
@@ -0,0 +1,31 @@
+"""Per-student data versions for conditional GETs
+
+Revision ID: c3f8a1e6d274
+Revises: b5e1c7d93a42
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3f8a1e6d274'
+down_revision = 'b5e1c7d93a42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('student_data_versions',
+    sa.Column('student_id', sa.Integer(), nullable=False),
+    sa.Column('grades_version', sa.BigInteger(), nullable=False),
+    sa.Column('attendance_version', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['student_id'], ['students.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('student_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('student_data_versions')
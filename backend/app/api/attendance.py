@@ -1,20 +1,39 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, extract
-from sqlalchemy.orm import selectinload
-from typing import List, Optional
+from sqlalchemy.exc import IntegrityError
+from typing import List, Literal, Optional
+from collections import Counter
 from datetime import date, datetime
 
-from ..core.database import get_db
-from ..core.security import get_current_user, require_role
+from ..core.config import settings
+from ..core.database import get_db, get_read_db
+from ..core.pagination import DEFAULT_PAGE_SIZE, keyset_paginate, set_next_cursor
+from ..core.response_cache import attendance_date_tag, cache_scope, response_cache, student_attendance_tag
+from ..core.security import Principal, get_current_principal, get_current_user, require_role
+from ..core.serialization import rows_response
 from ..models.user import User, UserRole
 from ..models.attendance import Attendance, AttendanceStatus
-from ..models.student import Student
+from ..services.attendance import (
+    attendance_by_date_query,
+    attendance_range_stats_query,
+    attendance_stats_query,
+    attendance_summaries,
+    bulk_mark_attendance,
+    count_summary_students,
+    range_status_counts,
+    summarize_status_counts,
+)
+from ..services.attendance_rollups import apply_attendance_changes
+from ..services.data_versions import bump_versions, etag_matches, student_etag
+from ..services.exports import attendance_export_query, export_response
 from ..schemas.attendance import (
     AttendanceCreate,
     AttendanceBulkCreate,
+    AttendanceBulkResponse,
     AttendanceUpdate,
     AttendanceResponse,
+    AttendanceDateRecord,
     AttendanceStatsResponse,
     StudentAttendanceSummary,
     DateRangeAttendanceRequest,
@@ -27,6 +46,7 @@ router = APIRouter(prefix="/attendance", tags=["Attendance"])
 async def mark_attendance(
     attendance_data: AttendanceCreate,
     current_user: User = Depends(require_role("super_admin", "admin", "teacher")),
+    principal: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """Mark attendance for a single student"""
@@ -57,202 +77,269 @@ async def mark_attendance(
         period_number=attendance_data.period_number,
         subject_id=attendance_data.subject_id,
         check_in_time=attendance_data.check_in_time or datetime.now(),
-        marked_by=current_user.teacher_profile[0].id if current_user.role == UserRole.TEACHER else None,
+        marked_by=principal.teacher_id if current_user.role == UserRole.TEACHER else None,
     )
     
     db.add(new_attendance)
-    await db.commit()
+    try:
+        await db.flush()
+        await apply_attendance_changes(
+            db, [(new_attendance.student_id, new_attendance.date, new_attendance.status, 1)]
+        )
+        await bump_versions(db, "attendance", [new_attendance.student_id])
+        await db.commit()
+    except IntegrityError as exc:
+        # Lost a race against a concurrent mark for the same slot
+        await db.rollback()
+        if "uq_attendance_student_date_period" not in str(exc.orig):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Attendance already marked for this date and period"
+        )
     await db.refresh(new_attendance)
+    await response_cache.invalidate(
+        student_attendance_tag(new_attendance.student_id), attendance_date_tag(new_attendance.date)
+    )
     
     return new_attendance
 
 
-@router.post("/bulk", status_code=status.HTTP_201_CREATED)
+@router.post("/bulk", response_model=AttendanceBulkResponse, status_code=status.HTTP_201_CREATED)
 async def mark_bulk_attendance(
     attendance_data: AttendanceBulkCreate,
     current_user: User = Depends(require_role("super_admin", "admin", "teacher")),
+    principal: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """Mark attendance for multiple students at once"""
-    created_count = 0
-    
-    for record in attendance_data.attendance_records:
-        # Check if already exists
-        result = await db.execute(
-            select(Attendance).where(
-                and_(
-                    Attendance.student_id == record["student_id"],
-                    Attendance.date == attendance_data.date,
-                    Attendance.period_number == attendance_data.period_number
-                )
-            )
-        )
-        existing = result.scalar_one_or_none()
-        
-        if not existing:
-            new_attendance = Attendance(
-                student_id=record["student_id"],
-                date=attendance_data.date,
-                status=AttendanceStatus(record["status"]),
-                period_number=attendance_data.period_number,
-                subject_id=attendance_data.subject_id,
-                check_in_time=datetime.now(),
-                marked_by=current_user.teacher_profile[0].id if current_user.role == UserRole.TEACHER else None,
-            )
-            db.add(new_attendance)
-            created_count += 1
-    
+    results = await bulk_mark_attendance(
+        db,
+        attendance_date=attendance_data.date,
+        records=attendance_data.attendance_records,
+        period_number=attendance_data.period_number,
+        subject_id=attendance_data.subject_id,
+        marked_by=principal.teacher_id if current_user.role == UserRole.TEACHER else None,
+    )
     await db.commit()
+    await response_cache.invalidate(
+        attendance_date_tag(attendance_data.date),
+        *(student_attendance_tag(r["student_id"]) for r in results if r["result"] == "created"),
+    )
+    
+    created_count = sum(1 for r in results if r["result"] == "created")
+    skipped_count = sum(1 for r in results if r["result"] == "skipped")
     
-    return {"message": f"Attendance marked for {created_count} students"}
+    return {
+        "message": f"Attendance marked for {created_count} students",
+        "created": created_count,
+        "skipped": skipped_count,
+        "conflicts": len(results) - created_count - skipped_count,
+        "results": results,
+    }
 
 
-@router.get("/date/{attendance_date}")
+@router.get("/date/{attendance_date}", response_model=List[AttendanceDateRecord])
 async def get_attendance_by_date(
+    request: Request,
     attendance_date: date,
     class_id: Optional[int] = None,
     section_id: Optional[int] = None,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get attendance records for a specific date"""
-    query = select(Attendance).options(
-        selectinload(Attendance.student).selectinload(Student.user)
-    ).where(Attendance.date == attendance_date)
+    """Get attendance records for a specific date
     
-    if class_id:
-        query = query.join(Student).where(Student.class_id == class_id)
-    if section_id:
-        query = query.join(Student).where(Student.section_id == section_id)
+    Flat rows from a column projection, serialized straight to JSON.
+    """
+    cache_key, cached = await response_cache.lookup(
+        request, cache_scope(current_user.role), [attendance_date_tag(attendance_date)]
+    )
+    if cached:
+        return cached
     
-    result = await db.execute(query)
-    records = result.scalars().all()
+    result = await db.execute(attendance_by_date_query(attendance_date, class_id, section_id))
+    records = result.all()
     
-    return records
+    return await response_cache.store(cache_key, rows_response(records, AttendanceDateRecord))
 
 
-@router.get("/student/{student_id}")
+@router.get("/student/{student_id}", response_model=List[AttendanceResponse])
 async def get_student_attendance(
+    request: Request,
     student_id: int,
+    response: Response,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    principal: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get attendance records for a specific student"""
+    """Get attendance records for a specific student, newest first
+    
+    Without ``limit`` or ``cursor`` every record is returned; otherwise pages
+    of ``limit`` (default 100) follow ``X-Next-Cursor``. Sends an ``ETag``; a matching ``If-None-Match`` gets ``304`` after one
+    version lookup, without loading any attendance.
+    """
     # Check authorization
-    if current_user.role == UserRole.STUDENT and current_user.student_profile[0].id != student_id:
+    if current_user.role == UserRole.STUDENT and principal.student_id != student_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to view this student's attendance"
         )
     
-    query = select(Attendance).where(Attendance.student_id == student_id)
+    # Read the version before the rows, so the tag can only be older than them
+    etag = await student_etag(db, request, "attendance", student_id)
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    
+    # The ETag is part of the key: a version bumped by another worker or a
+    # job misses entries cached under the old one
+    cache_key, cached = await response_cache.lookup(
+        request, f"{cache_scope(current_user.role)}|{etag}", [student_attendance_tag(student_id)]
+    )
+    if cached:
+        cached.headers["ETag"] = etag
+        return cached
+    
+    query = select(*Attendance.__table__.columns).where(Attendance.student_id == student_id)
     
     if start_date:
         query = query.where(Attendance.date >= start_date)
     if end_date:
         query = query.where(Attendance.date <= end_date)
     
-    query = query.order_by(Attendance.date.desc())
+    # Newest first, keyset on (date, id)
+    if cursor and limit is None:
+        limit = DEFAULT_PAGE_SIZE
+    query = keyset_paginate(query, [Attendance.date, Attendance.id], cursor, limit, descending=True)
     
     result = await db.execute(query)
-    records = result.scalars().all()
+    records = result.all()
+    set_next_cursor(response, records, limit, lambda record: [record.date, record.id])
     
-    return records
+    return await response_cache.store(cache_key, rows_response(records, AttendanceResponse), response)
 
 
-@router.get("/stats/{attendance_date}", response_model=AttendanceStatsResponse)
-async def get_attendance_stats(
-    attendance_date: date,
+@router.get("/stats/range", response_model=AttendanceStatsResponse)
+async def get_attendance_range_stats(
+    start_date: date,
+    end_date: date,
     class_id: Optional[int] = None,
     section_id: Optional[int] = None,
+    breakdown: Optional[Literal["class", "section"]] = None,
     current_user: User = Depends(require_role("super_admin", "admin", "teacher")),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get attendance statistics for a specific date"""
-    query = select(Attendance).where(Attendance.date == attendance_date)
-    
-    if class_id:
-        query = query.join(Student).where(Student.class_id == class_id)
-    if section_id:
-        query = query.join(Student).where(Student.section_id == section_id)
+    """Get attendance statistics for a date range
     
-    result = await db.execute(query)
-    records = result.scalars().all()
+    Whole months are read from the monthly rollups; ``total_students`` counts
+    attendance marks in the range.
+    """
+    if end_date < start_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end_date must not be before start_date"
+        )
     
-    total = len(records)
-    present = sum(1 for r in records if r.status == AttendanceStatus.PRESENT)
-    absent = sum(1 for r in records if r.status == AttendanceStatus.ABSENT)
-    late = sum(1 for r in records if r.status == AttendanceStatus.LATE)
-    sick = sum(1 for r in records if r.status == AttendanceStatus.SICK_LEAVE)
-    excused = sum(1 for r in records if r.status == AttendanceStatus.EXCUSED)
-    half_day = sum(1 for r in records if r.status == AttendanceStatus.HALF_DAY)
+    result = await db.execute(
+        attendance_range_stats_query(start_date, end_date, class_id, section_id, breakdown)
+    )
     
-    percentage = (present / total * 100) if total > 0 else 0
+    totals = Counter()
+    groups = {}
+    for row in result:
+        counts = range_status_counts(row)
+        totals.update(counts)
+        if breakdown:
+            key = (row.class_id, row.section_id if breakdown == "section" else None)
+            groups.setdefault(key, Counter()).update(counts)
     
-    return {
-        "total_students": total,
-        "present": present,
-        "absent": absent,
-        "late": late,
-        "sick_leave": sick,
-        "excused": excused,
-        "half_day": half_day,
-        "attendance_percentage": round(percentage, 2)
-    }
+    return _stats_response(totals, groups, breakdown)
 
 
-@router.post("/summary")
-async def get_attendance_summary(
-    date_range: DateRangeAttendanceRequest,
+@router.get("/export")
+async def export_attendance(
+    start_date: date,
+    end_date: date,
+    class_id: Optional[int] = None,
+    section_id: Optional[int] = None,
+    format: Literal["csv", "xlsx"] = "csv",
     current_user: User = Depends(require_role("super_admin", "admin", "teacher")),
-    db: AsyncSession = Depends(get_db)
 ):
-    """Get attendance summary for students within a date range"""
-    query = select(Student).options(selectinload(Student.user))
+    """Export attendance marks for a date range as CSV or XLSX
     
-    if date_range.class_id:
-        query = query.where(Student.class_id == date_range.class_id)
-    if date_range.section_id:
-        query = query.where(Student.section_id == date_range.section_id)
+    Rows are read through a server-side cursor in fixed-size chunks, so
+    memory use does not grow with the size of the export.
+    """
+    if end_date < start_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end_date must not be before start_date"
+        )
     
-    result = await db.execute(query)
-    students = result.scalars().all()
+    return await export_response(
+        attendance_export_query(start_date, end_date, class_id, section_id),
+        format,
+        f"attendance-{start_date}-{end_date}",
+    )
+
+
+@router.get("/stats/{attendance_date}", response_model=AttendanceStatsResponse)
+async def get_attendance_stats(
+    attendance_date: date,
+    class_id: Optional[int] = None,
+    section_id: Optional[int] = None,
+    breakdown: Optional[Literal["class", "section"]] = None,
+    current_user: User = Depends(require_role("super_admin", "admin", "teacher")),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Get attendance statistics for a specific date"""
+    result = await db.execute(
+        attendance_stats_query(attendance_date, class_id, section_id, breakdown)
+    )
     
-    summaries = []
+    totals = Counter()
+    groups = {}
+    for row in result:
+        totals[row.status] += row.count
+        if breakdown:
+            key = (row.class_id, row.section_id if breakdown == "section" else None)
+            groups.setdefault(key, Counter())[row.status] += row.count
     
-    for student in students:
-        attendance_query = select(Attendance).where(
-            and_(
-                Attendance.student_id == student.id,
-                Attendance.date >= date_range.start_date,
-                Attendance.date <= date_range.end_date
-            )
+    return _stats_response(totals, groups, breakdown)
+
+
+@router.post("/summary", response_model=List[StudentAttendanceSummary])
+async def get_attendance_summary(
+    date_range: DateRangeAttendanceRequest,
+    current_user: User = Depends(require_role("super_admin", "admin", "teacher")),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Get attendance summary for students within a date range
+    
+    Answered in the request for up to ``ATTENDANCE_SUMMARY_MAX_STUDENTS``
+    students; larger selections get ``422`` and must be submitted to
+    ``POST /jobs/attendance-summary``, whose result is downloaded when ready.
+    """
+    students = await count_summary_students(db, date_range.class_id, date_range.section_id)
+    if students > settings.ATTENDANCE_SUMMARY_MAX_STUDENTS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Summary covers {students} students, more than {settings.ATTENDANCE_SUMMARY_MAX_STUDENTS}; "
+                   f"submit it to {settings.API_V1_PREFIX}/jobs/attendance-summary instead"
         )
-        
-        att_result = await db.execute(attendance_query)
-        records = att_result.scalars().all()
-        
-        total_days = len(records)
-        present_days = sum(1 for r in records if r.status == AttendanceStatus.PRESENT)
-        absent_days = sum(1 for r in records if r.status == AttendanceStatus.ABSENT)
-        late_days = sum(1 for r in records if r.status == AttendanceStatus.LATE)
-        
-        percentage = (present_days / total_days * 100) if total_days > 0 else 0
-        
-        summaries.append({
-            "student_id": student.id,
-            "student_name": f"{student.user.first_name} {student.user.last_name}",
-            "admission_number": student.admission_number,
-            "total_days": total_days,
-            "present_days": present_days,
-            "absent_days": absent_days,
-            "late_days": late_days,
-            "attendance_percentage": round(percentage, 2)
-        })
-    
-    return summaries
+    
+    return await attendance_summaries(
+        db,
+        date_range.start_date,
+        date_range.end_date,
+        class_id=date_range.class_id,
+        section_id=date_range.section_id,
+    )
 
 
 @router.put("/{attendance_id}", response_model=AttendanceResponse)
@@ -274,12 +361,21 @@ async def update_attendance(
             detail="Attendance record not found"
         )
     
+    previous_status = attendance.status
     update_data = attendance_data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(attendance, field, value)
     
+    if attendance.status != previous_status:
+        await apply_attendance_changes(db, [
+            (attendance.student_id, attendance.date, previous_status, -1),
+            (attendance.student_id, attendance.date, attendance.status, 1),
+        ])
+    
+    await bump_versions(db, "attendance", [attendance.student_id])
     await db.commit()
     await db.refresh(attendance)
+    await response_cache.invalidate(student_attendance_tag(attendance.student_id), attendance_date_tag(attendance.date))
     
     return attendance
 
@@ -303,6 +399,26 @@ async def delete_attendance(
         )
     
     await db.delete(attendance)
+    await apply_attendance_changes(db, [(attendance.student_id, attendance.date, attendance.status, -1)])
+    await bump_versions(db, "attendance", [attendance.student_id])
     await db.commit()
+    await response_cache.invalidate(student_attendance_tag(attendance.student_id), attendance_date_tag(attendance.date))
     
     return None
+
+
+# ========== Helper Functions ==========
+
+def _stats_response(totals: Counter, groups: dict, breakdown: Optional[str]) -> dict:
+    """Build the stats response from per-status counts"""
+    stats = summarize_status_counts(totals)
+    
+    if breakdown:
+        stats["breakdown"] = [
+            {"class_id": group_class_id, "section_id": group_section_id, **summarize_status_counts(counts)}
+            for (group_class_id, group_section_id), counts in sorted(
+                groups.items(), key=lambda item: (item[0][0] or 0, item[0][1] or 0)
+            )
+        ]
+    
+    return stats
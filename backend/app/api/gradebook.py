@@ -1,26 +1,72 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from fastapi.responses import FileResponse
+from starlette.background import BackgroundTask
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
-from typing import List, Optional
-from datetime import datetime
+from typing import List, Literal, Optional
+from datetime import date, datetime
+from pathlib import Path
+import os
+import tempfile
 
-from ..core.database import get_db
-from ..core.security import get_current_user, require_role
+from ..core.config import settings
+from ..core.database import get_db, get_read_db
+from ..core.pagination import DEFAULT_PAGE_SIZE, keyset_paginate, set_next_cursor
+from ..core.response_cache import (
+    GRADES_TAG,
+    assessment_tag,
+    cache_scope,
+    response_cache,
+    student_grades_tag,
+)
+from ..core.security import Principal, get_current_principal, get_current_user, require_role
+from ..core.serialization import rows_response
 from ..models.user import User, UserRole
-from ..models.gradebook import Assessment, Grade, AssessmentType, GradeScale
+from ..models.gradebook import Assessment, Grade, GradingScale, GradingScaleBand, ReportCard, ReportCardRun, AssessmentType
 from ..models.student import Student
-from ..models.academic import Subject
+from ..models.academic import Class, Subject
 from ..schemas.gradebook import (
     AssessmentCreate,
     AssessmentUpdate,
     AssessmentResponse,
     GradeCreate,
     GradeBulkCreate,
+    GradeBulkResponse,
+    GradeStreamResponse,
     GradeUpdate,
     GradeResponse,
+    AssessmentGradeRecord,
+    StudentGradeRecord,
     StudentGradesSummary,
+    GradebookMatrixResponse,
+    ReportCardResponse,
+    ReportCardGenerateRequest,
+    ReportCardRunResponse,
+    GradingScaleCreate,
+    GradingScaleUpdate,
+    GradingScaleResponse,
+)
+from ..services.data_versions import bump_versions, etag_matches, student_etag
+from ..services.exports import export_response, grade_sheet_query
+from ..services.gradebook_matrix import build_gradebook_matrix, gradebook_matrix_query
+from ..services.gradebook import (
+    assessment_grades_query,
+    ingest_grades,
+    ingest_grade_stream,
+    iter_lines,
+    student_grades_query,
 )
+from ..services.grading_scales import (
+    classes_for_scale,
+    invalidate_scale,
+    regrade_assessment,
+    scale_for_class,
+)
+from ..services.jobs import submit_job
+from ..services.report_card_export import export_report_cards
+from ..services.report_cards import create_run
 
 router = APIRouter(prefix="/gradebook", tags=["Gradebook"])
 
@@ -31,13 +77,14 @@ router = APIRouter(prefix="/gradebook", tags=["Gradebook"])
 async def create_assessment(
     assessment_data: AssessmentCreate,
     current_user: User = Depends(require_role("super_admin", "admin", "teacher")),
+    principal: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """Create a new assessment (Test, Quiz, Assignment, etc.)"""
     # Get teacher ID
     teacher_id = None
     if current_user.role == UserRole.TEACHER:
-        teacher_id = current_user.teacher_profile[0].id
+        teacher_id = principal.teacher_id
     else:
         # For admin, we need to specify teacher_id in the request or default
         teacher_id = 1  # You might want to handle this differently
@@ -67,16 +114,19 @@ async def create_assessment(
 
 @router.get("/assessments", response_model=List[AssessmentResponse])
 async def list_assessments(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
     subject_id: Optional[int] = None,
     assessment_type: Optional[AssessmentType] = None,
     is_published: Optional[bool] = None,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    principal: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """List all assessments with filters"""
-    query = select(Assessment)
+    query = select(*Assessment.__table__.columns)
     
     if subject_id:
         query = query.where(Assessment.subject_id == subject_id)
@@ -87,23 +137,34 @@ async def list_assessments(
     
     # Teachers see only their assessments
     if current_user.role == UserRole.TEACHER:
-        query = query.where(Assessment.teacher_id == current_user.teacher_profile[0].id)
+        query = query.where(Assessment.teacher_id == principal.teacher_id)
     
-    query = query.offset(skip).limit(limit).order_by(Assessment.date.desc())
+    # Keyset pagination on (date, id), newest first; skip only without a cursor
+    if skip and not cursor:
+        query = query.offset(skip)
+    query = keyset_paginate(query, [Assessment.date, Assessment.id], cursor, limit, descending=True)
     
     result = await db.execute(query)
-    assessments = result.scalars().all()
+    assessments = result.all()
+    set_next_cursor(response, assessments, limit, lambda a: [a.date, a.id])
     
-    return assessments
+    return rows_response(assessments, AssessmentResponse, response)
 
 
 @router.get("/assessments/{assessment_id}", response_model=AssessmentResponse)
 async def get_assessment(
+    request: Request,
     assessment_id: int,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get assessment details by ID"""
+    cache_key, cached = await response_cache.lookup(
+        request, cache_scope(current_user.role), [assessment_tag(assessment_id)]
+    )
+    if cached:
+        return cached
+    
     result = await db.execute(
         select(Assessment).where(Assessment.id == assessment_id)
     )
@@ -115,7 +176,7 @@ async def get_assessment(
             detail="Assessment not found"
         )
     
-    return assessment
+    return await response_cache.store(cache_key, AssessmentResponse.model_validate(assessment))
 
 
 @router.put("/assessments/{assessment_id}", response_model=AssessmentResponse)
@@ -123,9 +184,14 @@ async def update_assessment(
     assessment_id: int,
     assessment_data: AssessmentUpdate,
     current_user: User = Depends(require_role("super_admin", "admin", "teacher")),
+    principal: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
-    """Update an assessment"""
+    """Update an assessment
+    
+    Changing ``total_marks`` re-grades the assessment's existing grades with
+    one set-based update in the same transaction.
+    """
     result = await db.execute(
         select(Assessment).where(Assessment.id == assessment_id)
     )
@@ -139,18 +205,27 @@ async def update_assessment(
     
     # Teachers can only update their own assessments
     if current_user.role == UserRole.TEACHER:
-        if assessment.teacher_id != current_user.teacher_profile[0].id:
+        if assessment.teacher_id != principal.teacher_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not authorized to update this assessment"
             )
     
     update_data = assessment_data.model_dump(exclude_unset=True)
+    total_marks_changed = update_data.get("total_marks", assessment.total_marks) != assessment.total_marks
     for field, value in update_data.items():
         setattr(assessment, field, value)
     
+    if total_marks_changed:
+        await db.flush()
+        await regrade_assessment(db, assessment.id)
+    
+    # Student grade lists embed the assessment
+    student_ids = await _graded_student_ids(db, assessment.id)
+    await bump_versions(db, "grades", student_ids)
     await db.commit()
     await db.refresh(assessment)
+    await response_cache.invalidate(assessment_tag(assessment.id), *map(student_grades_tag, student_ids))
     
     return assessment
 
@@ -159,6 +234,7 @@ async def update_assessment(
 async def delete_assessment(
     assessment_id: int,
     current_user: User = Depends(require_role("super_admin", "admin", "teacher")),
+    principal: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """Delete an assessment"""
@@ -175,14 +251,17 @@ async def delete_assessment(
     
     # Teachers can only delete their own assessments
     if current_user.role == UserRole.TEACHER:
-        if assessment.teacher_id != current_user.teacher_profile[0].id:
+        if assessment.teacher_id != principal.teacher_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not authorized to delete this assessment"
             )
     
+    student_ids = await _graded_student_ids(db, assessment.id)
+    await bump_versions(db, "grades", student_ids)
     await db.delete(assessment)
     await db.commit()
+    await response_cache.invalidate(assessment_tag(assessment.id), *map(student_grades_tag, student_ids))
     
     return None
 
@@ -193,13 +272,14 @@ async def delete_assessment(
 async def create_grade(
     grade_data: GradeCreate,
     current_user: User = Depends(require_role("super_admin", "admin", "teacher")),
+    principal: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """Create a grade for a student"""
     # Get teacher ID
     teacher_id = None
     if current_user.role == UserRole.TEACHER:
-        teacher_id = current_user.teacher_profile[0].id
+        teacher_id = principal.teacher_id
     else:
         teacher_id = 1  # Handle differently for admin
     
@@ -232,12 +312,13 @@ async def create_grade(
             detail="Assessment not found"
         )
     
-    # Calculate percentage and letter grade
+    # Calculate percentage and letter grade on the student's class scale
     percentage = None
     letter_grade = None
     if grade_data.marks_obtained is not None and not grade_data.is_absent:
         percentage = (grade_data.marks_obtained / assessment.total_marks) * 100
-        letter_grade = calculate_letter_grade(percentage)
+        class_id = await db.scalar(select(Student.class_id).where(Student.id == grade_data.student_id))
+        letter_grade = (await scale_for_class(db, class_id)).letter(percentage)
     
     new_grade = Grade(
         student_id=grade_data.student_id,
@@ -254,128 +335,199 @@ async def create_grade(
     )
     
     db.add(new_grade)
-    await db.commit()
+    await bump_versions(db, "grades", [grade_data.student_id])
+    try:
+        await db.commit()
+    except IntegrityError as exc:
+        # Lost a race against a concurrent insert for the same student
+        await db.rollback()
+        if "uq_grades_assessment_student" not in str(exc.orig):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Grade already exists for this student and assessment"
+        )
     await db.refresh(new_grade)
+    await response_cache.invalidate(student_grades_tag(new_grade.student_id))
     
     return new_grade
 
 
-@router.post("/grades/bulk", status_code=status.HTTP_201_CREATED)
+@router.post("/grades/bulk", response_model=GradeBulkResponse, status_code=status.HTTP_201_CREATED)
 async def create_bulk_grades(
     grade_data: GradeBulkCreate,
     current_user: User = Depends(require_role("super_admin", "admin", "teacher")),
+    principal: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """Create grades for multiple students at once"""
     teacher_id = None
     if current_user.role == UserRole.TEACHER:
-        teacher_id = current_user.teacher_profile[0].id
+        teacher_id = principal.teacher_id
     else:
         teacher_id = 1
     
-    # Get assessment
-    assessment_result = await db.execute(
-        select(Assessment).where(Assessment.id == grade_data.assessment_id)
+    assessment = await _get_assessment_or_404(db, grade_data.assessment_id)
+    
+    results = await ingest_grades(db, assessment, grade_data.subject_id, teacher_id, grade_data.grades)
+    await db.commit()
+    await response_cache.invalidate(
+        *(student_grades_tag(r["student_id"]) for r in results if r["result"] == "created")
     )
-    assessment = assessment_result.scalar_one_or_none()
     
-    if not assessment:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Assessment not found"
-        )
+    created_count = sum(1 for r in results if r["result"] == "created")
+    skipped_count = sum(1 for r in results if r["result"] == "skipped")
     
-    created_count = 0
+    return {
+        "message": f"Grades created for {created_count} students",
+        "created": created_count,
+        "skipped": skipped_count,
+        "invalid": len(results) - created_count - skipped_count,
+        "results": results,
+    }
+
+
+@router.post("/grades/bulk/stream", response_model=GradeStreamResponse, status_code=status.HTTP_201_CREATED)
+async def stream_bulk_grades(
+    request: Request,
+    assessment_id: int,
+    subject_id: int,
+    current_user: User = Depends(require_role("super_admin", "admin", "teacher")),
+    principal: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_db)
+):
+    """Create grades from a streamed NDJSON or CSV body of any size
     
-    for grade_record in grade_data.grades:
-        # Check if grade already exists
-        result = await db.execute(
-            select(Grade).where(
-                and_(
-                    Grade.student_id == grade_record["student_id"],
-                    Grade.assessment_id == grade_data.assessment_id
-                )
-            )
-        )
-        existing_grade = result.scalar_one_or_none()
-        
-        if not existing_grade:
-            marks_obtained = grade_record.get("marks_obtained")
-            is_absent = grade_record.get("is_absent", False)
-            
-            percentage = None
-            letter_grade = None
-            if marks_obtained is not None and not is_absent:
-                percentage = (marks_obtained / assessment.total_marks) * 100
-                letter_grade = calculate_letter_grade(percentage)
-            
-            new_grade = Grade(
-                student_id=grade_record["student_id"],
-                assessment_id=grade_data.assessment_id,
-                subject_id=grade_data.subject_id,
-                teacher_id=teacher_id,
-                marks_obtained=marks_obtained,
-                grade=letter_grade,
-                percentage=percentage,
-                is_absent=is_absent,
-                remarks=grade_record.get("remarks"),
-                graded_on=datetime.now(),
-            )
-            db.add(new_grade)
-            created_count += 1
+    Rows are read and written in chunks, so the request body is never held in
+    memory as a whole. Send ``Content-Type: text/csv`` with a header row
+    (``student_id,marks_obtained,is_absent,remarks``) for CSV, otherwise one
+    JSON object per line is expected.
+    """
+    teacher_id = None
+    if current_user.role == UserRole.TEACHER:
+        teacher_id = principal.teacher_id
+    else:
+        teacher_id = 1
     
-    await db.commit()
+    assessment = await _get_assessment_or_404(db, assessment_id)
+    
+    content_type = request.headers.get("content-type", "")
+    return await ingest_grade_stream(
+        db,
+        assessment,
+        subject_id,
+        teacher_id,
+        iter_lines(request.stream()),
+        csv_format=content_type.startswith("text/csv"),
+    )
+
+
+@router.get("/grades/export")
+async def export_grade_sheet(
+    assessment_id: Optional[int] = None,
+    subject_id: Optional[int] = None,
+    class_id: Optional[int] = None,
+    format: Literal["csv", "xlsx"] = "csv",
+    current_user: User = Depends(require_role("super_admin", "admin", "teacher")),
+):
+    """Export the grade sheet of an assessment or subject as CSV or XLSX
+    
+    Rows are read through a server-side cursor in fixed-size chunks, so
+    memory use does not grow with the size of the export.
+    """
+    if not assessment_id and not subject_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="assessment_id or subject_id is required"
+        )
     
-    return {"message": f"Grades created for {created_count} students"}
+    name = f"assessment-{assessment_id}" if assessment_id else f"subject-{subject_id}"
+    return await export_response(
+        grade_sheet_query(assessment_id, subject_id, class_id),
+        format,
+        f"grades-{name}",
+    )
 
 
-@router.get("/grades/student/{student_id}")
+@router.get("/grades/student/{student_id}", response_model=List[StudentGradeRecord])
 async def get_student_grades(
+    request: Request,
     student_id: int,
+    response: Response,
     subject_id: Optional[int] = None,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    principal: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get all grades for a specific student"""
+    """Get all grades for a specific student, most recently graded first
+    
+    Flat rows with the assessment title and marks and the subject name.
+    Without ``limit`` or ``cursor`` every grade is returned; otherwise pages
+    of ``limit`` (default 100) follow ``X-Next-Cursor``. Sends an ``ETag``;
+    a matching ``If-None-Match`` gets ``304`` after one version lookup,
+    without loading any grades.
+    """
     # Check authorization
     if current_user.role == UserRole.STUDENT:
-        if current_user.student_profile[0].id != student_id:
+        if principal.student_id != student_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not authorized to view this student's grades"
             )
     
-    query = select(Grade).options(
-        selectinload(Grade.assessment),
-        selectinload(Grade.subject)
-    ).where(Grade.student_id == student_id)
-    
-    if subject_id:
-        query = query.where(Grade.subject_id == subject_id)
+    # Read the version before the rows, so the tag can only be older than them
+    etag = await student_etag(db, request, "grades", student_id)
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     
-    query = query.order_by(Grade.graded_on.desc())
+    # The ETag is part of the key: a version bumped by another worker or a
+    # job misses entries cached under the old one
+    cache_key, cached = await response_cache.lookup(
+        request, f"{cache_scope(current_user.role)}|{etag}", [GRADES_TAG, student_grades_tag(student_id)]
+    )
+    if cached:
+        cached.headers["ETag"] = etag
+        return cached
+    
+    # Most recently graded first, keyset on (graded_on, id); ungraded rows
+    # fall back to their creation time so the key has no NULLs
+    if cursor and limit is None:
+        limit = DEFAULT_PAGE_SIZE
+    graded_on = func.coalesce(Grade.graded_on, Grade.created_at)
+    query = keyset_paginate(
+        student_grades_query(student_id, subject_id), [graded_on, Grade.id], cursor, limit, descending=True
+    )
     
     result = await db.execute(query)
-    grades = result.scalars().all()
+    grades = result.all()
+    set_next_cursor(response, grades, limit, lambda grade: [grade.graded_on or grade.created_at, grade.id])
     
-    return grades
+    return await response_cache.store(cache_key, rows_response(grades, StudentGradeRecord), response)
 
 
-@router.get("/grades/assessment/{assessment_id}")
+@router.get("/grades/assessment/{assessment_id}", response_model=List[AssessmentGradeRecord])
 async def get_assessment_grades(
     assessment_id: int,
+    response: Response,
+    limit: int = Query(500, ge=1, le=1000),
+    cursor: Optional[str] = None,
     current_user: User = Depends(require_role("super_admin", "admin", "teacher")),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get all grades for a specific assessment"""
-    query = select(Grade).options(
-        selectinload(Grade.student).selectinload(Student.user)
-    ).where(Grade.assessment_id == assessment_id)
+    """Get all grades for a specific assessment
+    
+    Flat rows from a column projection, serialized straight to JSON.
+    """
+    query = keyset_paginate(assessment_grades_query(assessment_id), [Grade.id], cursor, limit)
     
     result = await db.execute(query)
-    grades = result.scalars().all()
+    grades = result.all()
+    set_next_cursor(response, grades, limit, lambda grade: [grade.id])
     
-    return grades
+    return rows_response(grades, AssessmentGradeRecord, response)
 
 
 @router.put("/grades/{grade_id}", response_model=GradeResponse)
@@ -383,12 +535,14 @@ async def update_grade(
     grade_id: int,
     grade_data: GradeUpdate,
     current_user: User = Depends(require_role("super_admin", "admin", "teacher")),
+    principal: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """Update a grade"""
     result = await db.execute(
         select(Grade).options(
-            selectinload(Grade.assessment)
+            selectinload(Grade.assessment),
+            selectinload(Grade.student),
         ).where(Grade.id == grade_id)
     )
     grade = result.scalar_one_or_none()
@@ -401,7 +555,7 @@ async def update_grade(
     
     # Teachers can only update their own grades
     if current_user.role == UserRole.TEACHER:
-        if grade.teacher_id != current_user.teacher_profile[0].id:
+        if grade.teacher_id != principal.teacher_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not authorized to update this grade"
@@ -413,13 +567,16 @@ async def update_grade(
     if "marks_obtained" in update_data and update_data["marks_obtained"] is not None:
         percentage = (update_data["marks_obtained"] / grade.assessment.total_marks) * 100
         update_data["percentage"] = percentage
-        update_data["grade"] = calculate_letter_grade(percentage)
+        scale = await scale_for_class(db, grade.student.class_id)
+        update_data["grade"] = scale.letter(percentage)
     
     for field, value in update_data.items():
         setattr(grade, field, value)
     
+    await bump_versions(db, "grades", [grade.student_id])
     await db.commit()
     await db.refresh(grade)
+    await response_cache.invalidate(student_grades_tag(grade.student_id))
     
     return grade
 
@@ -443,28 +600,354 @@ async def delete_grade(
         )
     
     await db.delete(grade)
+    await bump_versions(db, "grades", [grade.student_id])
     await db.commit()
+    await response_cache.invalidate(student_grades_tag(grade.student_id))
+    
+    return None
+
+
+# ========== Gradebook Matrix ==========
+
+@router.get("/matrix", response_model=GradebookMatrixResponse)
+async def get_gradebook_matrix(
+    class_id: int,
+    subject_id: int,
+    section_id: Optional[int] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    current_user: User = Depends(require_role("super_admin", "admin", "teacher")),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Get a class's whole gradebook for a subject
+    
+    One student x assessment matrix of marks with weighted totals, letter
+    grades, ranks and per-assessment statistics, in columnar form.
+    """
+    subject = await db.get(Subject, subject_id)
+    if not subject:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Subject not found"
+        )
+    
+    result = await db.execute(
+        gradebook_matrix_query(class_id, subject_id, section_id, start_date, end_date)
+    )
+    scale = await scale_for_class(db, class_id)
+    
+    return build_gradebook_matrix(result.all(), subject.id, subject.name, scale)
+
+
+# ========== Report Card Endpoints ==========
+
+@router.post("/report-cards/generate", response_model=ReportCardRunResponse, status_code=status.HTTP_202_ACCEPTED)
+async def generate_report_cards(
+    request_data: ReportCardGenerateRequest,
+    response: Response,
+    current_user: User = Depends(require_role("super_admin", "admin")),
+    db: AsyncSession = Depends(get_db)
+):
+    """Start generating report cards for a term (Admin only)
+    
+    Returns the run immediately and queues it as a background job (its URL
+    is in ``Location``); poll ``/report-cards/runs/{run_id}`` for progress.
+    """
+    run = await create_run(
+        db,
+        academic_year_id=request_data.academic_year_id,
+        term=request_data.term,
+        start_date=request_data.start_date,
+        end_date=request_data.end_date,
+        class_ids=request_data.class_ids,
+    )
+    job = await submit_job(db, "report_cards", {"run_id": run.id}, created_by=current_user.id)
+    response.headers["Location"] = f"{settings.API_V1_PREFIX}/jobs/{job.id}"
+    
+    return run
+
+
+@router.get("/report-cards/runs/{run_id}", response_model=ReportCardRunResponse)
+async def get_report_card_run(
+    run_id: int,
+    current_user: User = Depends(require_role("super_admin", "admin", "teacher")),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Get progress of a report card run"""
+    return await _get_run_or_404(db, run_id)
+
+
+@router.post("/report-cards/runs/{run_id}/resume", response_model=ReportCardRunResponse, status_code=status.HTTP_202_ACCEPTED)
+async def resume_report_card_run(
+    run_id: int,
+    response: Response,
+    current_user: User = Depends(require_role("super_admin", "admin")),
+    db: AsyncSession = Depends(get_db)
+):
+    """Resume an interrupted or failed run; finished classes are skipped (Admin only)"""
+    run = await _get_run_or_404(db, run_id)
+    
+    if run.status == "completed":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Report card run already completed"
+        )
+    
+    job = await submit_job(db, "report_cards", {"run_id": run.id}, created_by=current_user.id)
+    response.headers["Location"] = f"{settings.API_V1_PREFIX}/jobs/{job.id}"
+    
+    return run
+
+
+@router.get("/report-cards", response_model=List[ReportCardResponse])
+async def list_report_cards(
+    academic_year_id: int,
+    term: str,
+    class_id: int,
+    current_user: User = Depends(require_role("super_admin", "admin", "teacher")),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Get the report cards of a class for a term, best rank first"""
+    result = await db.execute(
+        select(ReportCard)
+        .where(
+            ReportCard.academic_year_id == academic_year_id,
+            ReportCard.term == term,
+            ReportCard.class_id == class_id,
+        )
+        .order_by(ReportCard.rank.asc().nulls_last(), ReportCard.student_id)
+    )
+    
+    return result.scalars().all()
+
+
+@router.get("/report-cards/export")
+async def export_report_card_pdfs(
+    academic_year_id: int,
+    term: str,
+    class_id: Optional[List[int]] = Query(None),
+    format: Literal["zip", "pdf"] = "zip",
+    current_user: User = Depends(require_role("super_admin", "admin", "teacher")),
+):
+    """Download report cards as PDFs
+    
+    ``zip`` returns one PDF per student in a folder per class section;
+    ``pdf`` returns one merged PDF (a ZIP of merged PDFs when the selection
+    spans several sections). Classes are rendered in parallel worker processes.
+    """
+    handle, path = tempfile.mkstemp(prefix="report-cards-")
+    os.close(handle)
+    try:
+        media_type = await export_report_cards(
+            academic_year_id=academic_year_id,
+            term=term,
+            destination=Path(path),
+            class_ids=class_id,
+            output_format=format,
+        )
+    except BaseException:
+        os.unlink(path)
+        raise
+    
+    if media_type is None:
+        os.unlink(path)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No report cards found"
+        )
+    
+    extension = "pdf" if media_type == "application/pdf" else "zip"
+    return FileResponse(
+        path,
+        media_type=media_type,
+        filename=f"report-cards-{academic_year_id}-{term}.{extension}".replace(" ", "_"),
+        background=BackgroundTask(os.unlink, path),
+    )
+
+
+# ========== Grading Scale Endpoints ==========
+
+@router.get("/grading-scales", response_model=List[GradingScaleResponse])
+async def list_grading_scales(
+    current_user: User = Depends(require_role("super_admin", "admin", "teacher")),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Get all grading scales, the school default first
+    
+    Classes without their own scale use the default; without any scale the
+    built-in A+ to F scale applies.
+    """
+    result = await db.execute(
+        select(GradingScale)
+        .options(selectinload(GradingScale.bands))
+        .order_by(GradingScale.class_id.nulls_first(), GradingScale.id)
+    )
+    
+    return result.scalars().all()
+
+
+@router.get("/grading-scales/{scale_id}", response_model=GradingScaleResponse)
+async def get_grading_scale(
+    scale_id: int,
+    current_user: User = Depends(require_role("super_admin", "admin", "teacher")),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Get a grading scale"""
+    return await _get_grading_scale_or_404(db, scale_id)
+
+
+@router.post("/grading-scales", response_model=GradingScaleResponse, status_code=status.HTTP_201_CREATED)
+async def create_grading_scale(
+    scale_data: GradingScaleCreate,
+    current_user: User = Depends(require_role("super_admin", "admin")),
+    db: AsyncSession = Depends(get_db)
+):
+    """Create the school default or a class's grading scale (Admin only)
+    
+    Existing grades of the affected classes are re-graded by a background
+    job, listed under ``/jobs``.
+    """
+    if scale_data.class_id is not None and not await db.get(Class, scale_data.class_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Class not found"
+        )
+    
+    scale = GradingScale(
+        name=scale_data.name,
+        class_id=scale_data.class_id,
+        version=1,
+        bands=[GradingScaleBand(**band.model_dump()) for band in scale_data.bands],
+    )
+    db.add(scale)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="A grading scale already exists for this class" if scale_data.class_id is not None
+            else "A default grading scale already exists"
+        )
+    
+    await _submit_regrade(db, await classes_for_scale(db, scale.class_id), current_user)
+    
+    return await _get_grading_scale_or_404(db, scale.id)
+
+
+@router.put("/grading-scales/{scale_id}", response_model=GradingScaleResponse)
+async def update_grading_scale(
+    scale_id: int,
+    scale_data: GradingScaleUpdate,
+    current_user: User = Depends(require_role("super_admin", "admin")),
+    db: AsyncSession = Depends(get_db)
+):
+    """Update a grading scale (Admin only)
+    
+    New bands replace the old ones, bump the scale's version and re-grade
+    the affected classes in a background job.
+    """
+    scale = await _get_grading_scale_or_404(db, scale_id)
+    
+    if scale_data.name is not None:
+        scale.name = scale_data.name
+    if scale_data.bands is not None:
+        invalidate_scale(scale)
+        # Flush the removals first; the new bands may reuse their minimums
+        scale.bands.clear()
+        await db.flush()
+        scale.bands.extend(GradingScaleBand(**band.model_dump()) for band in scale_data.bands)
+        scale.version += 1
+    
+    await db.commit()
+    
+    if scale_data.bands is not None:
+        await _submit_regrade(db, await classes_for_scale(db, scale.class_id), current_user)
+    
+    return await _get_grading_scale_or_404(db, scale.id)
+
+
+@router.delete("/grading-scales/{scale_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_grading_scale(
+    scale_id: int,
+    current_user: User = Depends(require_role("super_admin", "admin")),
+    db: AsyncSession = Depends(get_db)
+):
+    """Delete a grading scale; its classes fall back to the default (Admin only)"""
+    scale = await _get_grading_scale_or_404(db, scale_id)
+    
+    class_ids = await classes_for_scale(db, scale.class_id)
+    invalidate_scale(scale)
+    await db.delete(scale)
+    await db.commit()
+    
+    await _submit_regrade(db, class_ids, current_user)
     
     return None
 
 
 # ========== Helper Functions ==========
 
-def calculate_letter_grade(percentage: float) -> GradeScale:
-    """Calculate letter grade from percentage"""
-    if percentage >= 90:
-        return GradeScale.A_PLUS
-    elif percentage >= 80:
-        return GradeScale.A
-    elif percentage >= 70:
-        return GradeScale.B_PLUS
-    elif percentage >= 60:
-        return GradeScale.B
-    elif percentage >= 50:
-        return GradeScale.C_PLUS
-    elif percentage >= 40:
-        return GradeScale.C
-    elif percentage >= 33:
-        return GradeScale.D
-    else:
-        return GradeScale.F
+async def _get_assessment_or_404(db: AsyncSession, assessment_id: int) -> Assessment:
+    """Load an assessment or raise 404"""
+    result = await db.execute(
+        select(Assessment).where(Assessment.id == assessment_id)
+    )
+    assessment = result.scalar_one_or_none()
+    
+    if not assessment:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Assessment not found"
+        )
+    
+    return assessment
+
+
+async def _get_run_or_404(db: AsyncSession, run_id: int) -> ReportCardRun:
+    """Load a report card run or raise 404"""
+    result = await db.execute(
+        select(ReportCardRun).where(ReportCardRun.id == run_id)
+    )
+    run = result.scalar_one_or_none()
+    
+    if not run:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Report card run not found"
+        )
+    
+    return run
+
+
+async def _get_grading_scale_or_404(db: AsyncSession, scale_id: int) -> GradingScale:
+    """Load a grading scale with its bands or raise 404"""
+    result = await db.execute(
+        select(GradingScale)
+        .options(selectinload(GradingScale.bands))
+        .where(GradingScale.id == scale_id)
+        .execution_options(populate_existing=True)
+    )
+    scale = result.scalar_one_or_none()
+    
+    if not scale:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Grading scale not found"
+        )
+    
+    return scale
+
+
+async def _graded_student_ids(db: AsyncSession, assessment_id: int) -> list[int]:
+    """Students with a grade on the assessment"""
+    result = await db.execute(
+        select(Grade.student_id).where(Grade.assessment_id == assessment_id)
+    )
+    
+    return list(result.scalars())
+
+
+async def _submit_regrade(db: AsyncSession, class_ids: list, current_user: User) -> None:
+    """Queue a job re-grading the classes of an edited grading scale"""
+    await submit_job(db, "recompute_grades", {"class_ids": class_ids}, created_by=current_user.id)
@@ -0,0 +1,157 @@
+from fastapi import APIRouter, Depends, File, HTTPException, Response, UploadFile, status, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from sqlalchemy.orm import undefer
+from typing import List
+
+from ..core.config import settings
+from ..core.database import get_db, get_read_db
+from ..core.security import get_current_user, require_role
+from ..models.job import Job
+from ..models.user import User, UserRole
+from ..schemas.attendance import DateRangeAttendanceRequest
+from ..schemas.job import JobResponse
+from ..services.jobs import submit_job
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+
+# ========== Submit Endpoints ==========
+
+@router.post("/attendance-summary", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def submit_attendance_summary(
+    date_range: DateRangeAttendanceRequest,
+    response: Response,
+    current_user: User = Depends(require_role("super_admin", "admin", "teacher")),
+    db: AsyncSession = Depends(get_db)
+):
+    """Compute ``POST /attendance/summary`` in the background"""
+    job = await submit_job(db, "attendance_summary", date_range.model_dump(), created_by=current_user.id)
+    set_job_location(response, job)
+    
+    return job
+
+
+@router.post("/roster-import", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def submit_roster_import(
+    response: Response,
+    file: UploadFile = File(...),
+    dry_run: bool = False,
+    skip_invalid: bool = False,
+    current_user: User = Depends(require_role("super_admin", "admin")),
+    db: AsyncSession = Depends(get_db)
+):
+    """Same as ``POST /students/import`` (Admin only)"""
+    return await submit_roster_upload(db, response, file, dry_run, skip_invalid, current_user)
+
+
+async def submit_roster_upload(
+    db: AsyncSession,
+    response: Response,
+    file: UploadFile,
+    dry_run: bool,
+    skip_invalid: bool,
+    current_user: User,
+) -> Job:
+    """Queue a ``roster_import`` job for an uploaded roster
+    
+    The file is stored with the job and parsed by the worker; an unreadable
+    file fails the job.
+    """
+    filename = file.filename or ""
+    if not filename.lower().endswith((".csv", ".xlsx")):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Roster must be a .csv or .xlsx file"
+        )
+    
+    data = await file.read(settings.MAX_UPLOAD_SIZE + 1)
+    if len(data) > settings.MAX_UPLOAD_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="Roster file is too large"
+        )
+    
+    job = await submit_job(
+        db,
+        "roster_import",
+        {"filename": filename, "dry_run": dry_run, "skip_invalid": skip_invalid},
+        created_by=current_user.id,
+        input_data=data,
+    )
+    set_job_location(response, job)
+    
+    return job
+
+
+def set_job_location(response: Response, job: Job) -> None:
+    response.headers["Location"] = f"{settings.API_V1_PREFIX}/jobs/{job.id}"
+
+
+# ========== Status Endpoints ==========
+
+@router.get("", response_model=List[JobResponse])
+async def list_jobs(
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Get the current user's most recent jobs, newest first"""
+    result = await db.execute(
+        select(Job)
+        .where(Job.created_by == current_user.id)
+        .order_by(Job.created_at.desc(), Job.id.desc())
+        .limit(limit)
+    )
+    
+    return result.scalars().all()
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Get the status and progress of a job"""
+    return await _get_job_or_404(db, job_id, current_user)
+
+
+@router.get("/{job_id}/result")
+async def download_job_result(
+    job_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Download the JSON result of a completed job"""
+    job = await _get_job_or_404(db, job_id, current_user, undefer(Job.result))
+    
+    if job.status != "completed":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Job is {job.status}" + (f": {job.error}" if job.error else "")
+        )
+    
+    return ORJSONResponse(
+        job.result,
+        headers={"Content-Disposition": f'attachment; filename="{job.kind}-{job.id}.json"'},
+    )
+
+
+# ========== Helper Functions ==========
+
+async def _get_job_or_404(db: AsyncSession, job_id: int, current_user: User, *options) -> Job:
+    """Jobs are visible to the user who submitted them and to admins"""
+    job = await db.get(Job, job_id, options=options)
+    
+    if not job or (
+        job.created_by != current_user.id
+        and current_user.role not in (UserRole.SUPER_ADMIN, UserRole.ADMIN)
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    
+    return job
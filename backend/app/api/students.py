@@ -1,21 +1,28 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, File, HTTPException, Response, UploadFile, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, or_
+from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 from typing import List, Optional
 
-from ..core.database import get_db
-from ..core.security import get_current_user, require_role
+from ..core.database import get_db, get_read_db
+from ..core.pagination import keyset_paginate, set_next_cursor
+from ..core.security import get_current_user, get_password_hash_async, require_role
+from ..core.serialization import rows_response
 from ..models.user import User, UserRole
 from ..models.student import Student
 from ..models.academic import Class, Section
+from ..schemas.job import JobResponse
 from ..schemas.student import (
     StudentCreate,
     StudentUpdate,
     StudentResponse,
     StudentListResponse,
     StudentDetailResponse,
+    StudentSuggestion,
 )
+from .jobs import submit_roster_upload
+from ..services.student_search import matching_student_ids, search_rank
+from ..services.students import student_list_query
 
 router = APIRouter(prefix="/students", tags=["Students"])
 
@@ -50,11 +57,10 @@ async def create_student(
         )
     
     # Create user account
-    from ..core.security import get_password_hash
     new_user = User(
         email=student_data.email,
         username=student_data.username,
-        hashed_password=get_password_hash(student_data.password),
+        hashed_password=await get_password_hash_async(student_data.password),
         first_name=student_data.first_name,
         last_name=student_data.last_name,
         phone=student_data.phone,
@@ -98,23 +104,46 @@ async def create_student(
     return new_student
 
 
+@router.post("/import", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def import_students(
+    response: Response,
+    file: UploadFile = File(...),
+    dry_run: bool = False,
+    skip_invalid: bool = False,
+    current_user: User = Depends(require_role("super_admin", "admin")),
+    db: AsyncSession = Depends(get_db)
+):
+    """Import a roster of students from a CSV or XLSX file (Admin only)
+    
+    Columns are the ``StudentCreate`` fields. The whole file is validated
+    before anything is written; with errors nothing is imported unless
+    ``skip_invalid`` is set. ``dry_run`` only validates. Validation, password
+    hashing and inserts run as a ``roster_import`` background job: the job is
+    returned with its URL in ``Location`` and its result is the import summary.
+    """
+    return await submit_roster_upload(db, response, file, dry_run, skip_invalid, current_user)
+
+
 @router.get("", response_model=List[StudentListResponse])
 async def list_students(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
     class_id: Optional[int] = None,
     section_id: Optional[int] = None,
     status: Optional[str] = "active",
     search: Optional[str] = None,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """List all students with filters"""
-    query = select(Student).options(
-        selectinload(Student.user),
-        selectinload(Student.class_info),
-        selectinload(Student.section)
-    )
+    """List all students with filters
+    
+    Pass the ``X-Next-Cursor`` response header back as ``cursor`` to fetch the
+    next page; ``skip`` is only honoured when no cursor is given. With
+    ``search`` the results are ordered by relevance instead of id.
+    """
+    query = student_list_query()
     
     # Apply filters
     if class_id:
@@ -123,46 +152,61 @@ async def list_students(
         query = query.where(Student.section_id == section_id)
     if status:
         query = query.where(Student.status == status)
-    if search:
-        query = query.join(Student.user).where(
-            or_(
-                User.first_name.ilike(f"%{search}%"),
-                User.last_name.ilike(f"%{search}%"),
-                Student.admission_number.ilike(f"%{search}%"),
-                User.email.ilike(f"%{search}%")
-            )
-        )
+    if skip and not cursor:
+        query = query.offset(skip)
     
-    # Pagination
-    query = query.offset(skip).limit(limit)
+    if search and search.strip():
+        # Trigram-indexed candidate lookup, ranked by similarity
+        rank = search_rank(search)
+        query = query.where(Student.id.in_(matching_student_ids(search))).add_columns(rank)
+        query = keyset_paginate(query, [rank, Student.id], cursor, limit, descending=True)
+        next_key = lambda row: [row.rank, row.id]
+    else:
+        # Keyset pagination on the primary key
+        query = keyset_paginate(query, [Student.id], cursor, limit)
+        next_key = lambda row: [row.id]
     
     result = await db.execute(query)
-    students = result.scalars().all()
-    
-    # Format response
-    response_list = []
-    for student in students:
-        response_list.append({
-            "id": student.id,
-            "user_id": student.user_id,
-            "admission_number": student.admission_number,
-            "roll_number": student.roll_number,
-            "first_name": student.user.first_name,
-            "last_name": student.user.last_name,
-            "email": student.user.email,
-            "class_name": student.class_info.name if student.class_info else None,
-            "section_name": student.section.name if student.section else None,
-            "status": student.status,
-        })
-    
-    return response_list
+    rows = result.all()
+    set_next_cursor(response, rows, limit, next_key)
+    
+    # Column projection: already the response types, so skip re-validation
+    return rows_response(rows, StudentListResponse, response)
+
+
+@router.get("/search/suggest", response_model=List[StudentSuggestion])
+async def suggest_students(
+    q: str = Query(..., min_length=2, max_length=100),
+    limit: int = Query(10, ge=1, le=50),
+    status: Optional[str] = "active",
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Type-ahead suggestions: best matching student ids and display names"""
+    if not q.strip():
+        return []
+    
+    query = (
+        select(Student.id, User.first_name, User.last_name)
+        .join(Student.user)
+        .where(Student.id.in_(matching_student_ids(q)))
+    )
+    if status:
+        query = query.where(Student.status == status)
+    query = query.order_by(search_rank(q).desc(), Student.id.desc()).limit(limit)
+    
+    result = await db.execute(query)
+    return [
+        {"id": row.id, "display_name": f"{row.first_name} {row.last_name}"}
+        for row in result
+    ]
 
 
 @router.get("/{student_id}", response_model=StudentDetailResponse)
 async def get_student(
     student_id: int,
     current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get student details by ID"""
     result = await db.execute(
@@ -1,14 +1,70 @@
+import time
 from typing import AsyncGenerator
+from uuid import uuid4
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from .config import settings
 
+
+class MeteredPool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long checkouts wait for a connection."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.checkout_wait_total = 0.0
+        self.checkout_wait_max = 0.0
+        self.checkout_timeouts = 0
+    
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except Exception:
+            self.checkout_timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            self.checkouts += 1
+            self.checkout_wait_total += waited
+            self.checkout_wait_max = max(self.checkout_wait_max, waited)
+    
+    def metrics(self) -> dict:
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "overflow": max(self.overflow(), 0),
+            "checked_in": self.checkedin(),
+            "checkouts": self.checkouts,
+            "checkout_failures": self.checkout_timeouts,
+            "checkout_wait_avg_ms": round(self.checkout_wait_total / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+            "checkout_wait_max_ms": round(self.checkout_wait_max * 1000, 3),
+        }
+
+
 # Create async engine
+# Both statement caches: SQLAlchemy's prepared statements and asyncpg's own
+connect_args = {
+    "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+}
+if settings.DB_STATEMENT_CACHE_SIZE == 0:
+    # Behind pgbouncer in transaction mode server connections are shared, so
+    # the statements asyncpg still prepares need names no other client uses
+    connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+
 engine = create_async_engine(
     settings.DATABASE_URL.replace('postgresql://', 'postgresql+asyncpg://'),
-    echo=settings.ENVIRONMENT == "development",
+    echo=settings.DB_ECHO,
     future=True,
-    pool_pre_ping=True,
+    poolclass=MeteredPool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    connect_args=connect_args,
 )
 
 # Create async session factory
@@ -20,6 +76,15 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+# Read-only sessions share the pool but run in autocommit mode, so a request
+# that only reads skips the BEGIN and COMMIT round trips entirely.
+ReadSessionLocal = async_sessionmaker(
+    engine.execution_options(isolation_level="AUTOCOMMIT"),
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
 # Create declarative base
 Base = declarative_base()
 
@@ -35,3 +100,14 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             await session.close()
+
+
+# Dependency to get a DB session for routes that never write
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    async with ReadSessionLocal() as session:
+        yield session
+
+
+def pool_metrics() -> dict:
+    """Connection pool usage and checkout wait times for this worker."""
+    return engine.sync_engine.pool.metrics()
@@ -0,0 +1,70 @@
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Callable, Optional, Sequence
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import Select, tuple_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+DEFAULT_PAGE_SIZE = 100  # a cursor sent without a limit
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode sort-key values into an opaque, URL-safe cursor."""
+    payload = [value.isoformat() if isinstance(value, date) else value for value in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, types: Sequence[Callable[[Any], Any]]) -> tuple:
+    """Decode a cursor produced by ``encode_cursor`` back into typed values."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("cursor shape mismatch")
+        return tuple(
+            convert.fromisoformat(value) if convert in (date, datetime) else convert(value)
+            for convert, value in zip(types, values)
+        )
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def keyset_paginate(
+    query: Select,
+    columns: Sequence[Any],
+    cursor: Optional[str],
+    limit: Optional[int],
+    descending: bool = False,
+) -> Select:
+    """Order by ``columns`` and return the page that starts after ``cursor``.
+
+    ``columns`` must form a unique, stable sort key (end with the primary key)
+    without NULLs. ``limit=None`` returns every remaining row.
+    The row-value comparison lets Postgres seek straight into a matching
+    composite index, so every page costs the same regardless of depth.
+    """
+    if cursor:
+        types = [_python_type(column) for column in columns]
+        values = decode_cursor(cursor, types)
+        key = tuple_(*columns) if len(columns) > 1 else columns[0]
+        bound = tuple_(*values) if len(columns) > 1 else values[0]
+        query = query.where(key < bound if descending else key > bound)
+
+    order = [column.desc() if descending else column.asc() for column in columns]
+    return query.order_by(*order).limit(limit)
+
+
+def set_next_cursor(response: Response, rows: Sequence[Any], limit: Optional[int], key: Callable[[Any], Sequence[Any]]) -> None:
+    """Expose the cursor for the next page when this page is full."""
+    if rows and len(rows) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(key(rows[-1]))
+
+
+def _python_type(column) -> Callable[[Any], Any]:
+    return column.type.python_type
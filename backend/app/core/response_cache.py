@@ -0,0 +1,226 @@
+import hashlib
+import json
+import os
+from datetime import date
+from typing import Any, Optional, Protocol, Sequence
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from redis.exceptions import RedisError
+
+from .cache import TTLCache
+from .config import settings
+
+# Tags of cached read responses; write handlers bump them after committing
+GRADES_TAG = "grades"  # every student's grades, e.g. after a grading scale change
+
+
+def student_grades_tag(student_id: int) -> str:
+    return f"student-grades:{student_id}"
+
+
+def student_attendance_tag(student_id: int) -> str:
+    return f"student-attendance:{student_id}"
+
+
+def assessment_tag(assessment_id: int) -> str:
+    return f"assessment:{assessment_id}"
+
+
+def attendance_date_tag(attendance_date: date) -> str:
+    return f"attendance-date:{attendance_date.isoformat()}"
+
+
+class CacheBackend(Protocol):
+    name: str
+
+    async def get(self, key: str) -> Optional[bytes]: ...
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    async def versions(self, tags: Sequence[str]) -> list[int]: ...
+
+    async def bump(self, tags: Sequence[str]) -> None: ...
+
+
+class MemoryBackend:
+    """Per-process LRU for a single worker and tests; invalidations only reach this worker's entries."""
+
+    name = "memory"
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._entries = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._versions: dict[str, int] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._entries.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._entries.set(key, value, ttl)
+
+    async def versions(self, tags: Sequence[str]) -> list[int]:
+        return [self._versions.get(tag, 0) for tag in tags]
+
+    async def bump(self, tags: Sequence[str]) -> None:
+        for tag in tags:
+            self._versions[tag] = self._versions.get(tag, 0) + 1
+
+    def size(self) -> int:
+        return len(self._entries)
+
+
+class RedisBackend:
+    """Shared by every worker; entries expire in Redis, tag versions persist."""
+
+    name = "redis"
+
+    def __init__(self, client, prefix: str = "response-cache:"):
+        self.client = client
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.client.get(self.prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self.client.set(self.prefix + key, value, ex=int(ttl))
+
+    async def versions(self, tags: Sequence[str]) -> list[int]:
+        values = await self.client.mget([f"{self.prefix}tag:{tag}" for tag in tags])
+        return [int(value or 0) for value in values]
+
+    async def bump(self, tags: Sequence[str]) -> None:
+        async with self.client.pipeline(transaction=False) as pipe:
+            for tag in tags:
+                pipe.incr(f"{self.prefix}tag:{tag}")
+            await pipe.execute()
+
+
+class ResponseCache:
+    """Cache of serialized JSON read responses, invalidated by tag.
+
+    Like ``PrincipalCache``, invalidation bumps a version instead of
+    deleting entries: the current versions of an entry's tags are part of
+    its key, read before the route queries the database, so a response
+    built from rows older than a concurrent write is stored under a key
+    that no longer matches and ages out. Entries are keyed by path, query
+    string and the caller's role scope.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend], ttl: float):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.invalidations = 0
+        self._routes: dict[str, list[int]] = {}
+
+    async def lookup(self, request: Request, scope: str, tags: Sequence[str]) -> tuple[Optional[str], Optional[Response]]:
+        """Return ``(key, cached response)``; on a miss store under ``key``."""
+        if self.backend is None:
+            return None, None
+        route = request.scope["route"].path if "route" in request.scope else request.url.path
+        counts = self._routes.setdefault(route, [0, 0])
+        try:
+            versions = await self.backend.versions(tags)
+            identity = f"{request.url.path}?{sorted(request.query_params.multi_items())}|{scope}|{versions}"
+            key = hashlib.sha1(identity.encode()).hexdigest()
+            value = await self.backend.get(key)
+        except RedisError:
+            self.errors += 1
+            return None, None
+        if value is None:
+            self.misses += 1
+            counts[1] += 1
+            return key, None
+        self.hits += 1
+        counts[0] += 1
+        headers, body = value.split(b"\n", 1)
+        return key, Response(body, media_type="application/json", headers=json.loads(headers))
+
+    async def store(self, key: Optional[str], content: Any, response: Optional[Response] = None) -> Response:
+        """Serialize ``content`` like FastAPI would, cache it and return it.
+
+        ``content`` may also be an already rendered response, e.g. an
+        ``ORJSONResponse`` of flat rows. Headers the route set on its
+        injected ``response`` (such as the next cursor) are kept with the body.
+        """
+        headers = {
+            name: value for name, value in (response.headers.items() if response is not None else [])
+            if name not in ("content-length", "content-type")
+        }
+        if isinstance(content, Response):
+            rendered = content
+            rendered.headers.update(headers)
+        else:
+            rendered = JSONResponse(jsonable_encoder(content), headers=headers)
+        if key is not None:
+            try:
+                await self.backend.set(key, json.dumps(headers).encode() + b"\n" + rendered.body, self.ttl)
+            except RedisError:
+                self.errors += 1
+        return rendered
+
+    async def invalidate(self, *tags: str) -> None:
+        """Make every entry tagged with any of ``tags`` unreachable; call after commit."""
+        if self.backend is None or not tags:
+            return
+        try:
+            await self.backend.bump(sorted(set(tags)))
+            self.invalidations += 1
+        except RedisError:
+            self.errors += 1
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.backend.name if self.backend else "none",
+            "size": self.backend.size() if isinstance(self.backend, MemoryBackend) else None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "errors": self.errors,
+            "routes": {
+                route: {
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+                }
+                for route, (hits, misses) in sorted(self._routes.items())
+            },
+        }
+
+
+def create_backend(name: str = settings.CACHE_BACKEND) -> Optional[CacheBackend]:
+    """The backend for ``CACHE_BACKEND``: redis, memory, fakeredis or none.
+
+    ``memory`` is refused when ``WEB_CONCURRENCY`` asks for several
+    workers, as a write on one worker would leave the others serving
+    stale entries until they expire.
+    """
+    if name == "none":
+        return None
+    if name == "memory":
+        if int(os.environ.get("WEB_CONCURRENCY") or 1) > 1:
+            raise ValueError("CACHE_BACKEND=memory is per process; use redis with several workers")
+        return MemoryBackend(settings.CACHE_MAXSIZE, settings.CACHE_TTL_SECONDS)
+    if name == "redis":
+        from redis.asyncio import Redis
+
+        return RedisBackend(Redis.from_url(settings.REDIS_URL))
+    if name == "fakeredis":
+        # In-memory Redis stand-in for tests; not a runtime dependency
+        from fakeredis.aioredis import FakeRedis
+
+        return RedisBackend(FakeRedis())
+    raise ValueError(f"Unknown CACHE_BACKEND {name!r}")
+
+
+def cache_scope(role: Any) -> str:
+    """Role part of the cache key; authorization runs before the lookup."""
+    return getattr(role, "value", str(role))
+
+
+response_cache = ResponseCache(create_backend(), ttl=settings.CACHE_TTL_SECONDS)
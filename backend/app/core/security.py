@@ -1,15 +1,22 @@
+import asyncio
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, event, inspect
 
+from .cache import TTLCache
 from .config import settings
-from .database import get_db
-from ..models.user import User
+from .database import ReadSessionLocal
+from ..models.user import User, UserRole
+from ..models.student import Student
+from ..models.teacher import Teacher
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_PREFIX}/auth/login")
@@ -25,6 +32,26 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+# bcrypt releases the GIL, so a small thread pool keeps hashing off the event
+# loop while capping how many CPU-bound hashes a worker runs at once.
+password_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_MAX_WORKERS,
+    thread_name_prefix="password-hash",
+)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the hashing pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_executor, verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Generate a password hash on the hashing pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_executor, get_password_hash, password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token."""
     to_encode = data.copy()
@@ -38,11 +65,91 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_db)
-) -> User:
-    """Get current authenticated user."""
+@dataclass(frozen=True)
+class Principal:
+    """Authenticated user plus the profile ids handlers need.
+    
+    ``user`` is detached from any session and shared between requests, so it
+    must be treated as read-only.
+    """
+    user: User
+    teacher_id: Optional[int] = None
+    student_id: Optional[int] = None
+    
+    @property
+    def id(self) -> int:
+        return self.user.id
+    
+    @property
+    def role(self) -> UserRole:
+        return self.user.role
+
+
+class PrincipalCache:
+    """Per-process cache of principals keyed by user id and token.
+    
+    Invalidating a user gives it a new generation, which is part of the key,
+    so every cached entry for that user stops matching at once and ages out
+    of the LRU. Other worker processes pick up the change when their entries
+    expire, so the TTL bounds cross-worker staleness.
+    
+    Generations come from one counter and are never reused, and a user's is
+    forgotten one TTL after its invalidation: by then every entry stored
+    under an older generation has expired, as ``set`` refuses principals
+    loaded across an invalidation. Only recently invalidated users are kept.
+    """
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._ttl = ttl
+        self._clock = 0
+        # user id -> (generation, invalidated at), oldest invalidation first
+        self._generations: "OrderedDict[int, tuple[int, float]]" = OrderedDict()
+    
+    def _generation(self, user_id: int) -> int:
+        entry = self._generations.get(user_id)
+        return entry[0] if entry else 0
+    
+    def key(self, user_id: int, token: str) -> tuple:
+        """Build the cache key; take it before loading so a concurrent
+        invalidation makes the loaded principal unreachable."""
+        return (user_id, self._generation(user_id), token)
+    
+    def get(self, key: tuple) -> Optional[Principal]:
+        return self._cache.get(key)
+    
+    def set(self, key: tuple, principal: Principal) -> None:
+        user_id, generation, _ = key
+        if generation == self._generation(user_id):
+            self._cache.set(key, principal)
+    
+    def invalidate_user(self, user_id: int) -> None:
+        now = time.monotonic()
+        self._clock += 1
+        self._generations.pop(user_id, None)
+        self._generations[user_id] = (self._clock, now)
+        while True:
+            oldest, (_, invalidated_at) = next(iter(self._generations.items()))
+            if now - invalidated_at <= self._ttl:
+                break
+            del self._generations[oldest]
+    
+    def clear(self) -> None:
+        self._cache.clear()
+        self._generations.clear()
+    
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+principal_cache = PrincipalCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAXSIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+async def get_current_principal(token: str = Depends(oauth2_scheme)) -> Principal:
+    """Get the authenticated principal, from cache when possible."""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -57,16 +164,39 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
     
-    result = await db.execute(select(User).where(User.id == int(user_id)))
-    user = result.scalar_one_or_none()
+    cache_key = principal_cache.key(int(user_id), token)
+    principal = principal_cache.get(cache_key)
     
-    if user is None:
-        raise credentials_exception
+    if principal is None:
+        # Short-lived read session: the connection goes back to the pool
+        # before the handler checks out its own
+        async with ReadSessionLocal() as db:
+            result = await db.execute(
+                select(User, Teacher.id, Student.id)
+                .outerjoin(Teacher, Teacher.user_id == User.id)
+                .outerjoin(Student, Student.user_id == User.id)
+                .where(User.id == int(user_id))
+            )
+            row = result.one_or_none()
+        
+        if row is None:
+            raise credentials_exception
+        
+        user, teacher_id, student_id = row
+        principal = Principal(user=user, teacher_id=teacher_id, student_id=student_id)
+        principal_cache.set(cache_key, principal)
     
-    if not user.is_active:
+    if not principal.user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     
-    return user
+    return principal
+
+
+async def get_current_user(
+    principal: Principal = Depends(get_current_principal)
+) -> User:
+    """Get current authenticated user."""
+    return principal.user
 
 
 async def get_current_active_user(
@@ -88,3 +218,25 @@ def require_role(*roles: str):
             )
         return current_user
     return role_checker
+
+
+# ========== Principal cache invalidation ==========
+
+@event.listens_for(User, "after_update")
+def _invalidate_updated_user(mapper, connection, target):
+    state = inspect(target)
+    if any(state.attrs[name].history.has_changes() for name in ("is_active", "role", "hashed_password")):
+        principal_cache.invalidate_user(target.id)
+
+
+@event.listens_for(User, "after_delete")
+def _invalidate_deleted_user(mapper, connection, target):
+    principal_cache.invalidate_user(target.id)
+
+
+@event.listens_for(Teacher, "after_insert")
+@event.listens_for(Teacher, "after_delete")
+@event.listens_for(Student, "after_insert")
+@event.listens_for(Student, "after_delete")
+def _invalidate_profile_owner(mapper, connection, target):
+    principal_cache.invalidate_user(target.user_id)
@@ -0,0 +1,37 @@
+from typing import Any, Iterable, Optional, Type
+
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+def schema_rows(rows: Iterable[Any], schema: Type[BaseModel]) -> list[dict]:
+    """Project ``rows`` onto the fields of ``schema`` without validating them.
+
+    For rows whose values are already the schema's types, i.e. column
+    projections or ORM objects straight from the database. Attributes are
+    read by name, so ``Row`` tuples and model instances both work; extra
+    columns (a search rank, say) are dropped and missing optional fields
+    take their default.
+    """
+    fields = [
+        (name, None if field.is_required() else field.get_default(call_default_factory=True))
+        for name, field in schema.model_fields.items()
+    ]
+    return [{name: getattr(row, name, default) for name, default in fields} for row in rows]
+
+
+def rows_response(
+    rows: Iterable[Any],
+    schema: Type[BaseModel],
+    response: Optional[Response] = None,
+) -> ORJSONResponse:
+    """``schema_rows`` rendered by orjson, skipping FastAPI's response-model pass.
+
+    Keep ``response_model=List[schema]`` on the route for OpenAPI. Headers
+    set on the injected ``response`` (such as the next cursor) are copied.
+    """
+    headers = dict(response.headers) if response is not None else None
+    if headers:
+        headers.pop("content-length", None)
+    return ORJSONResponse(schema_rows(rows, schema), headers=headers)
@@ -1,13 +1,20 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from .core.config import settings
-from .api import auth, students, attendance, gradebook
+from .core.database import pool_metrics
+from .core.pagination import NEXT_CURSOR_HEADER
+from .core.response_cache import response_cache
+from .core.security import principal_cache
+from .api import auth, students, attendance, gradebook, jobs
+from .services.jobs import recover_jobs
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -17,6 +24,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag", "Location"],
 )
 
 # Include routers
@@ -24,6 +32,16 @@ app.include_router(auth.router, prefix=settings.API_V1_PREFIX)
 app.include_router(students.router, prefix=settings.API_V1_PREFIX)
 app.include_router(attendance.router, prefix=settings.API_V1_PREFIX)
 app.include_router(gradebook.router, prefix=settings.API_V1_PREFIX)
+app.include_router(jobs.router, prefix=settings.API_V1_PREFIX)
+
+
+@app.on_event("startup")
+async def recover_background_jobs():
+    """Restart jobs left pending or running by the previous process
+
+    Best effort: one worker does it, and a database error does not stop startup.
+    """
+    await recover_jobs()
 
 
 @app.get("/")
@@ -43,6 +61,16 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/health/metrics")
+async def health_metrics():
+    """Per-worker cache and connection pool metrics"""
+    return {
+        "principal_cache": principal_cache.stats(),
+        "response_cache": response_cache.stats(),
+        "db_pool": pool_metrics(),
+    }
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
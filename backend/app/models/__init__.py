@@ -1,15 +1,27 @@
 # Import all models here for Alembic auto-detection
 from .user import User, UserRole
-from .student import Student, Gender, BloodGroup
+from .student import Student, StudentDataVersion, Gender, BloodGroup
 from .teacher import Teacher, Parent, ParentStudent
 from .academic import AcademicYear, Class, Section, Subject, SubjectTeacher
 from .attendance import Attendance, AttendanceStatus, AttendanceReport
-from .gradebook import Assessment, Grade, ReportCard, AssessmentType, GradeScale
+from .gradebook import (
+    Assessment,
+    Grade,
+    ReportCard,
+    ReportCardRun,
+    ReportCardRunClass,
+    GradingScale,
+    GradingScaleBand,
+    AssessmentType,
+    GradeScale,
+)
+from .job import Job
 
 __all__ = [
     "User",
     "UserRole",
     "Student",
+    "StudentDataVersion",
     "Gender",
     "BloodGroup",
     "Teacher",
@@ -26,6 +38,11 @@ __all__ = [
     "Assessment",
     "Grade",
     "ReportCard",
+    "ReportCardRun",
+    "ReportCardRunClass",
+    "GradingScale",
+    "GradingScaleBand",
     "AssessmentType",
     "GradeScale",
+    "Job",
 ]
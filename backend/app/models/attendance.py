@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Date, Enum as SQLEnum, DateTime, Text
+from sqlalchemy import Column, Integer, String, ForeignKey, Date, Enum as SQLEnum, DateTime, Text, Index, UniqueConstraint, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
@@ -16,10 +16,19 @@ class AttendanceStatus(str, enum.Enum):
 
 class Attendance(Base):
     __tablename__ = "attendance"
+    __table_args__ = (
+        # One mark per student, date and period (a NULL period is the whole-day mark)
+        Index("uq_attendance_student_date_period", "student_id", "date", text("coalesce(period_number, 0)"), unique=True),
+        # Per-student history, newest first
+        Index("ix_attendance_student_date", "student_id", "date", "id"),
+        # Monthly range partitions, managed by scripts/manage_attendance_partitions.py
+        {"postgresql_partition_by": "RANGE (date)"},
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
+    # The partition key has to be part of the primary key
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     student_id = Column(Integer, ForeignKey("students.id", ondelete="CASCADE"), nullable=False)
-    date = Column(Date, nullable=False, index=True)
+    date = Column(Date, primary_key=True, index=True)
     status = Column(SQLEnum(AttendanceStatus), nullable=False, default=AttendanceStatus.PRESENT)
     
     # Optional fields
@@ -42,8 +51,15 @@ class Attendance(Base):
 
 
 class AttendanceReport(Base):
-    """Monthly attendance summary for students"""
+    """Monthly attendance summary for students
+    
+    Counters are kept in step with ``attendance`` by
+    ``app/services/attendance_rollups.py`` on every write.
+    """
     __tablename__ = "attendance_reports"
+    __table_args__ = (
+        UniqueConstraint("student_id", "year", "month", name="uq_attendance_reports_student_month"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     student_id = Column(Integer, ForeignKey("students.id", ondelete="CASCADE"), nullable=False)
@@ -54,6 +70,7 @@ class AttendanceReport(Base):
     present_days = Column(Integer, default=0)
     absent_days = Column(Integer, default=0)
     late_days = Column(Integer, default=0)
+    half_day_days = Column(Integer, default=0)
     sick_leave_days = Column(Integer, default=0)
     excused_days = Column(Integer, default=0)
     
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Float, Date, Enum as SQLEnum, DateTime, Text, Boolean
+from sqlalchemy import Column, Integer, String, ForeignKey, Float, Date, Enum as SQLEnum, DateTime, Text, Boolean, Index, UniqueConstraint, JSON, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
@@ -18,6 +18,7 @@ class AssessmentType(str, enum.Enum):
 
 
 class GradeScale(str, enum.Enum):
+    """Letters of the built-in grading scale"""
     A_PLUS = "A+"
     A = "A"
     B_PLUS = "B+"
@@ -31,6 +32,12 @@ class GradeScale(str, enum.Enum):
 class Assessment(Base):
     """Assignments, tests, quizzes, exams"""
     __tablename__ = "assessments"
+    __table_args__ = (
+        # Assessment listings, newest first, optionally per teacher or subject
+        Index("ix_assessments_date", "date", "id"),
+        Index("ix_assessments_teacher_date", "teacher_id", "date", "id"),
+        Index("ix_assessments_subject_date", "subject_id", "date", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False)
@@ -64,6 +71,12 @@ class Assessment(Base):
 class Grade(Base):
     """Individual student grades for assessments"""
     __tablename__ = "grades"
+    __table_args__ = (
+        # One grade per student and assessment
+        UniqueConstraint("assessment_id", "student_id", name="uq_grades_assessment_student"),
+        # Per-student grade history, optionally per subject
+        Index("ix_grades_student_subject", "student_id", "subject_id", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     student_id = Column(Integer, ForeignKey("students.id", ondelete="CASCADE"), nullable=False)
@@ -72,7 +85,7 @@ class Grade(Base):
     teacher_id = Column(Integer, ForeignKey("teachers.id"), nullable=False)
     
     marks_obtained = Column(Float, nullable=True)
-    grade = Column(SQLEnum(GradeScale), nullable=True)
+    grade = Column(String(10), nullable=True)  # letter from the student's grading scale
     percentage = Column(Float, nullable=True)
     
     is_absent = Column(Boolean, default=False)
@@ -98,6 +111,10 @@ class Grade(Base):
 class ReportCard(Base):
     """Term/semester report cards"""
     __tablename__ = "report_cards"
+    __table_args__ = (
+        # One report card per student and term; target of the batch upsert
+        UniqueConstraint("student_id", "academic_year_id", "term", name="uq_report_cards_student_term"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     student_id = Column(Integer, ForeignKey("students.id", ondelete="CASCADE"), nullable=False)
@@ -128,3 +145,96 @@ class ReportCard(Base):
     
     def __repr__(self):
         return f"<ReportCard student={self.student_id} term={self.term}>"
+
+
+class ReportCardRun(Base):
+    """One batch generation of report cards for an academic year and term"""
+    __tablename__ = "report_card_runs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    academic_year_id = Column(Integer, ForeignKey("academic_years.id"), nullable=False)
+    term = Column(String(50), nullable=False)
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=False)
+    class_ids = Column(JSON, nullable=True)  # None means every class of the year
+    
+    status = Column(String(20), nullable=False, default="pending")  # pending, running, completed, failed
+    total_classes = Column(Integer, default=0)
+    completed_classes = Column(Integer, default=0)
+    error = Column(Text, nullable=True)
+    
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    # Relationships
+    completed = relationship("ReportCardRunClass", cascade="all, delete-orphan")
+    
+    def __repr__(self):
+        return f"<ReportCardRun {self.id} term={self.term} {self.status}>"
+
+
+class ReportCardRunClass(Base):
+    """A class whose report cards a run has written; lets an interrupted run resume"""
+    __tablename__ = "report_card_run_classes"
+    __table_args__ = (
+        UniqueConstraint("run_id", "class_id", name="uq_report_card_run_classes_run_class"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    run_id = Column(Integer, ForeignKey("report_card_runs.id", ondelete="CASCADE"), nullable=False)
+    class_id = Column(Integer, ForeignKey("classes.id", ondelete="CASCADE"), nullable=False)
+    student_count = Column(Integer, nullable=False)
+    completed_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    def __repr__(self):
+        return f"<ReportCardRunClass run={self.run_id} class={self.class_id}>"
+
+
+class GradingScale(Base):
+    """Custom letter grades and grade points for a class, or the school default
+    
+    ``version`` is bumped on every edit; compiled scales are cached per
+    version, see ``app/services/grading_scales.py``.
+    """
+    __tablename__ = "grading_scales"
+    __table_args__ = (
+        # At most one scale per class and one school-wide default (class_id NULL)
+        UniqueConstraint("class_id", name="uq_grading_scales_class"),
+        Index("uq_grading_scales_default", text("(class_id IS NULL)"), unique=True, postgresql_where=text("class_id IS NULL")),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(100), nullable=False)
+    class_id = Column(Integer, ForeignKey("classes.id", ondelete="CASCADE"), nullable=True)
+    version = Column(Integer, nullable=False, default=1)
+    
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    # Relationships
+    bands = relationship(
+        "GradingScaleBand",
+        cascade="all, delete-orphan",
+        order_by="GradingScaleBand.min_percentage.desc()",
+    )
+    
+    def __repr__(self):
+        return f"<GradingScale {self.name} class={self.class_id} v{self.version}>"
+
+
+class GradingScaleBand(Base):
+    """One letter of a grading scale: every percentage from ``min_percentage`` up to the next band"""
+    __tablename__ = "grading_scale_bands"
+    __table_args__ = (
+        UniqueConstraint("scale_id", "min_percentage", name="uq_grading_scale_bands_scale_min"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    scale_id = Column(Integer, ForeignKey("grading_scales.id", ondelete="CASCADE"), nullable=False)
+    letter = Column(String(10), nullable=False)
+    min_percentage = Column(Float, nullable=False)
+    grade_points = Column(Float, nullable=True)
+    
+    def __repr__(self):
+        return f"<GradingScaleBand {self.letter} >= {self.min_percentage}>"
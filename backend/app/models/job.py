@@ -0,0 +1,36 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, LargeBinary, Index, JSON
+from sqlalchemy.sql import func
+from sqlalchemy.orm import deferred
+from ..core.database import Base
+
+
+class Job(Base):
+    """A background job: a heavy report or import run outside the request
+
+    Workers claim pending jobs, write progress as they go and store the
+    JSON result for download, see ``app/services/jobs.py``. The uploaded
+    input and the result are deferred so status polls don't load them.
+    """
+    __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_created_by_created_at", "created_by", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String(50), nullable=False)  # attendance_summary, report_cards, roster_import, recompute_grades
+    params = Column(JSON, nullable=True)
+    input_data = deferred(Column(LargeBinary, nullable=True))  # uploaded file, dropped when the job finishes
+    created_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+
+    status = Column(String(20), nullable=False, default="pending")  # pending, running, completed, failed
+    progress_current = Column(Integer, nullable=False, default=0)
+    progress_total = Column(Integer, nullable=True)
+    result = deferred(Column(JSON, nullable=True))
+    error = Column(Text, nullable=True)
+
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<Job {self.id} {self.kind} {self.status}>"
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, Date, Enum as SQLEnum, ForeignKey, Text, JSON
+from sqlalchemy import BigInteger, Column, DateTime, Integer, String, Date, Enum as SQLEnum, ForeignKey, Text, JSON, Index
+from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
 from ..core.database import Base
@@ -23,6 +24,12 @@ class BloodGroup(str, enum.Enum):
 
 class Student(Base):
     __tablename__ = "students"
+    __table_args__ = (
+        # Trigram index for the student search (pg_trgm)
+        Index("ix_students_admission_number_trgm", "admission_number", postgresql_using="gin", postgresql_ops={"admission_number": "gin_trgm_ops"}),
+        # Class and section rosters
+        Index("ix_students_class_section", "class_id", "section_id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), unique=True, nullable=False)
@@ -72,3 +79,20 @@ class Student(Base):
     
     def __repr__(self):
         return f"<Student {self.admission_number}>"
+
+
+class StudentDataVersion(Base):
+    """Counters bumped by every write to a student's grades or attendance
+    
+    One primary-key lookup gives the ETag of the student's grade and
+    attendance listings, see ``app/services/data_versions.py``.
+    """
+    __tablename__ = "student_data_versions"
+    
+    student_id = Column(Integer, ForeignKey("students.id", ondelete="CASCADE"), primary_key=True)
+    grades_version = Column(BigInteger, nullable=False, default=0)
+    attendance_version = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<StudentDataVersion student={self.student_id} grades={self.grades_version} attendance={self.attendance_version}>"
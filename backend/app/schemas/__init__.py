@@ -16,14 +16,23 @@ from .student import (
     StudentResponse,
     StudentListResponse,
     StudentDetailResponse,
+    StudentSuggestion,
+    RosterImportError,
+    RosterImportResponse,
 )
 from .attendance import (
     AttendanceBase,
     AttendanceCreate,
+    AttendanceBulkRecord,
     AttendanceBulkCreate,
+    AttendanceBulkRecordResult,
+    AttendanceBulkResponse,
     AttendanceUpdate,
     AttendanceResponse,
+    AttendanceDateRecord,
     AttendanceReportResponse,
+    AttendanceStatsBase,
+    AttendanceStatsBreakdown,
     AttendanceStatsResponse,
     StudentAttendanceSummary,
     DateRangeAttendanceRequest,
@@ -35,15 +44,33 @@ from .gradebook import (
     AssessmentResponse,
     GradeBase,
     GradeCreate,
+    GradeBulkRecord,
     GradeBulkCreate,
+    GradeBulkRecordResult,
+    GradeBulkResponse,
+    GradeStreamError,
+    GradeStreamResponse,
     GradeUpdate,
     GradeResponse,
+    AssessmentGradeRecord,
+    StudentGradeRecord,
     StudentGradesSummary,
     SubjectPerformanceResponse,
+    GradebookMatrixAssessments,
+    GradebookMatrixStudents,
+    GradebookMatrixResponse,
     ReportCardBase,
     ReportCardCreate,
     ReportCardResponse,
+    ReportCardGenerateRequest,
+    ReportCardRunResponse,
+    GradingScaleBandBase,
+    GradingScaleBandResponse,
+    GradingScaleCreate,
+    GradingScaleUpdate,
+    GradingScaleResponse,
 )
+from .job import JobResponse
 
 __all__ = [
     "Token",
@@ -60,12 +87,21 @@ __all__ = [
     "StudentResponse",
     "StudentListResponse",
     "StudentDetailResponse",
+    "StudentSuggestion",
+    "RosterImportError",
+    "RosterImportResponse",
     "AttendanceBase",
     "AttendanceCreate",
+    "AttendanceBulkRecord",
     "AttendanceBulkCreate",
+    "AttendanceBulkRecordResult",
+    "AttendanceBulkResponse",
     "AttendanceUpdate",
     "AttendanceResponse",
+    "AttendanceDateRecord",
     "AttendanceReportResponse",
+    "AttendanceStatsBase",
+    "AttendanceStatsBreakdown",
     "AttendanceStatsResponse",
     "StudentAttendanceSummary",
     "DateRangeAttendanceRequest",
@@ -75,12 +111,30 @@ __all__ = [
     "AssessmentResponse",
     "GradeBase",
     "GradeCreate",
+    "GradeBulkRecord",
     "GradeBulkCreate",
+    "GradeBulkRecordResult",
+    "GradeBulkResponse",
+    "GradeStreamError",
+    "GradeStreamResponse",
     "GradeUpdate",
     "GradeResponse",
+    "AssessmentGradeRecord",
+    "StudentGradeRecord",
     "StudentGradesSummary",
     "SubjectPerformanceResponse",
+    "GradebookMatrixAssessments",
+    "GradebookMatrixStudents",
+    "GradebookMatrixResponse",
     "ReportCardBase",
     "ReportCardCreate",
     "ReportCardResponse",
+    "ReportCardGenerateRequest",
+    "ReportCardRunResponse",
+    "GradingScaleBandBase",
+    "GradingScaleBandResponse",
+    "GradingScaleCreate",
+    "GradingScaleUpdate",
+    "GradingScaleResponse",
+    "JobResponse",
 ]
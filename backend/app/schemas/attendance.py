@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, List, Literal
 from datetime import date, datetime
 from ..models.attendance import AttendanceStatus
 
@@ -17,12 +17,33 @@ class AttendanceCreate(AttendanceBase):
     check_in_time: Optional[datetime] = None
 
 
+class AttendanceBulkRecord(BaseModel):
+    student_id: int
+    status: AttendanceStatus
+    remarks: Optional[str] = None
+
+
 class AttendanceBulkCreate(BaseModel):
     """For marking attendance for multiple students at once"""
     date: date
     period_number: Optional[int] = None
     subject_id: Optional[int] = None
-    attendance_records: list[dict]  # [{student_id: int, status: str}, ...]
+    attendance_records: List[AttendanceBulkRecord]
+
+
+class AttendanceBulkRecordResult(BaseModel):
+    student_id: int
+    result: Literal["created", "skipped", "conflict"]
+    attendance_id: Optional[int] = None
+    detail: Optional[str] = None
+
+
+class AttendanceBulkResponse(BaseModel):
+    message: str
+    created: int
+    skipped: int
+    conflicts: int
+    results: List[AttendanceBulkRecordResult]
 
 
 class AttendanceUpdate(BaseModel):
@@ -42,8 +63,27 @@ class AttendanceResponse(AttendanceBase):
     # Nested data
     student_name: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AttendanceDateRecord(BaseModel):
+    """One attendance mark of a day, flattened with its student"""
+    id: int
+    student_id: int
+    admission_number: str
+    roll_number: Optional[str]
+    student_name: str
+    class_id: Optional[int]
+    section_id: Optional[int]
+    date: date
+    status: AttendanceStatus
+    period_number: Optional[int]
+    subject_id: Optional[int]
+    remarks: Optional[str]
+    check_in_time: Optional[datetime]
+    check_out_time: Optional[datetime]
+    marked_by: Optional[int]
+    marked_at: datetime
 
 
 class AttendanceReportResponse(BaseModel):
@@ -59,11 +99,10 @@ class AttendanceReportResponse(BaseModel):
     excused_days: int
     attendance_percentage: str
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
-class AttendanceStatsResponse(BaseModel):
+class AttendanceStatsBase(BaseModel):
     total_students: int
     present: int
     absent: int
@@ -74,6 +113,16 @@ class AttendanceStatsResponse(BaseModel):
     attendance_percentage: float
 
 
+class AttendanceStatsBreakdown(AttendanceStatsBase):
+    class_id: Optional[int] = None
+    section_id: Optional[int] = None
+
+
+class AttendanceStatsResponse(AttendanceStatsBase):
+    # Per-class or per-section counts, only when requested
+    breakdown: Optional[List[AttendanceStatsBreakdown]] = None
+
+
 class StudentAttendanceSummary(BaseModel):
     student_id: int
     student_name: str
@@ -84,8 +133,7 @@ class StudentAttendanceSummary(BaseModel):
     late_days: int
     attendance_percentage: float
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class DateRangeAttendanceRequest(BaseModel):
@@ -1,7 +1,7 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, Field, validator
+from typing import Optional, List, Literal
 from datetime import date, datetime
-from ..models.gradebook import AssessmentType, GradeScale
+from ..models.gradebook import AssessmentType
 
 
 class AssessmentBase(BaseModel):
@@ -48,8 +48,7 @@ class AssessmentResponse(AssessmentBase):
     total_submissions: Optional[int] = None
     graded_submissions: Optional[int] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class GradeBase(BaseModel):
@@ -65,16 +64,50 @@ class GradeCreate(GradeBase):
     subject_id: int
 
 
+class GradeBulkRecord(BaseModel):
+    student_id: int
+    marks_obtained: Optional[float] = Field(None, ge=0)
+    is_absent: bool = False
+    remarks: Optional[str] = None
+
+
 class GradeBulkCreate(BaseModel):
     """For grading multiple students for an assessment"""
     assessment_id: int
     subject_id: int
-    grades: List[dict]  # [{student_id: int, marks_obtained: float, remarks: str}, ...]
+    grades: List[GradeBulkRecord]
+
+
+class GradeBulkRecordResult(BaseModel):
+    student_id: Optional[int]
+    result: Literal["created", "skipped", "invalid"]
+    grade_id: Optional[int] = None
+    detail: Optional[str] = None
+
+
+class GradeBulkResponse(BaseModel):
+    message: str
+    created: int
+    skipped: int
+    invalid: int
+    results: List[GradeBulkRecordResult]
+
+
+class GradeStreamError(GradeBulkRecordResult):
+    line: int
+
+
+class GradeStreamResponse(BaseModel):
+    created: int
+    skipped: int
+    invalid: int
+    errors: List[GradeStreamError]  # invalid rows, the first 100
+    errors_truncated: bool = False
 
 
 class GradeUpdate(BaseModel):
     marks_obtained: Optional[float] = Field(None, ge=0)
-    grade: Optional[GradeScale] = None
+    grade: Optional[str] = Field(None, max_length=10)
     is_absent: Optional[bool] = None
     remarks: Optional[str] = None
     feedback: Optional[str] = None
@@ -84,7 +117,7 @@ class GradeResponse(GradeBase):
     id: int
     subject_id: int
     teacher_id: int
-    grade: Optional[GradeScale]
+    grade: Optional[str]
     percentage: Optional[float]
     submitted_on: Optional[datetime]
     graded_on: Optional[datetime]
@@ -96,8 +129,48 @@ class GradeResponse(GradeBase):
     subject_name: Optional[str] = None
     total_marks: Optional[float] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AssessmentGradeRecord(BaseModel):
+    """One grade of an assessment, flattened with its student"""
+    id: int
+    student_id: int
+    admission_number: str
+    roll_number: Optional[str]
+    student_name: str
+    assessment_id: int
+    subject_id: int
+    teacher_id: int
+    marks_obtained: Optional[float]
+    percentage: Optional[float]
+    grade: Optional[str]
+    is_absent: Optional[bool]
+    remarks: Optional[str]
+    feedback: Optional[str]
+    submitted_on: Optional[datetime]
+    graded_on: Optional[datetime]
+
+
+class StudentGradeRecord(BaseModel):
+    """One grade of a student, flattened with its assessment and subject"""
+    id: int
+    student_id: int
+    assessment_id: int
+    assessment_title: str
+    total_marks: float
+    subject_id: int
+    subject_name: str
+    teacher_id: int
+    marks_obtained: Optional[float]
+    percentage: Optional[float]
+    grade: Optional[str]
+    is_absent: Optional[bool]
+    remarks: Optional[str]
+    feedback: Optional[str]
+    submitted_on: Optional[datetime]
+    graded_on: Optional[datetime]
+    created_at: datetime
 
 
 class StudentGradesSummary(BaseModel):
@@ -112,8 +185,7 @@ class StudentGradesSummary(BaseModel):
     percentage: float
     average_grade: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SubjectPerformanceResponse(BaseModel):
@@ -125,8 +197,47 @@ class SubjectPerformanceResponse(BaseModel):
     lowest_marks: float
     passing_percentage: float
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class GradebookMatrixAssessments(BaseModel):
+    """Assessment columns of the matrix, one list entry per assessment"""
+    id: List[int]
+    title: List[str]
+    date: List[date]
+    total_marks: List[float]
+    weightage: List[float]
+    graded: List[int]
+    average: List[Optional[float]]
+    highest: List[Optional[float]]
+    lowest: List[Optional[float]]
+    pass_rate: List[Optional[float]]
+    p25: List[Optional[float]]
+    p50: List[Optional[float]]
+    p75: List[Optional[float]]
+    p90: List[Optional[float]]
+
+
+class GradebookMatrixStudents(BaseModel):
+    """Student rows of the matrix, one list entry per student"""
+    id: List[int]
+    name: List[str]
+    roll_number: List[Optional[str]]
+    marks_obtained: List[Optional[float]]
+    total_marks: List[Optional[float]]  # graded assessments only
+    percentage: List[Optional[float]]  # weightage-weighted mean of assessment percentages
+    grade: List[Optional[str]]
+    grade_points: List[Optional[float]]
+    rank: List[Optional[int]]
+    percentile: List[Optional[float]]
+
+
+class GradebookMatrixResponse(BaseModel):
+    subject: SubjectPerformanceResponse
+    assessments: GradebookMatrixAssessments
+    students: GradebookMatrixStudents
+    marks: List[List[Optional[float]]]  # [student][assessment]; null = not graded
+    absent: List[List[int]]  # [student index, assessment index] pairs
 
 
 class ReportCardBase(BaseModel):
@@ -157,5 +268,92 @@ class ReportCardResponse(ReportCardBase):
     published_date: Optional[date]
     created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ReportCardGenerateRequest(BaseModel):
+    academic_year_id: int
+    term: str = Field(..., max_length=50)
+    # Assessments and attendance dated within the term are counted
+    start_date: date
+    end_date: date
+    class_ids: Optional[List[int]] = None  # every class of the year when omitted
+    
+    @validator('end_date')
+    def validate_end_date(cls, v, values):
+        if 'start_date' in values and v < values['start_date']:
+            raise ValueError('end_date must not be before start_date')
+        return v
+
+
+class ReportCardRunResponse(BaseModel):
+    id: int
+    academic_year_id: int
+    term: str
+    start_date: date
+    end_date: date
+    class_ids: Optional[List[int]] = None
+    status: str
+    total_classes: int
+    completed_classes: int
+    error: Optional[str] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    created_at: datetime
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
+class GradingScaleBandBase(BaseModel):
+    letter: str = Field(..., min_length=1, max_length=10)
+    min_percentage: float = Field(..., ge=0, le=100)
+    grade_points: Optional[float] = Field(None, ge=0)
+
+
+class GradingScaleBandResponse(GradingScaleBandBase):
+    id: int
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
+class GradingScaleBase(BaseModel):
+    name: str = Field(..., max_length=100)
+    bands: List[GradingScaleBandBase] = Field(..., min_length=1)
+    
+    @validator('bands')
+    def validate_bands(cls, v):
+        return _check_bands(v)
+
+
+class GradingScaleCreate(GradingScaleBase):
+    class_id: Optional[int] = None  # the school default when omitted
+
+
+class GradingScaleUpdate(BaseModel):
+    name: Optional[str] = Field(None, max_length=100)
+    bands: Optional[List[GradingScaleBandBase]] = Field(None, min_length=1)
+    
+    @validator('bands')
+    def validate_bands(cls, v):
+        return v if v is None else _check_bands(v)
+
+
+class GradingScaleResponse(BaseModel):
+    id: int
+    name: str
+    class_id: Optional[int]
+    version: int
+    bands: List[GradingScaleBandResponse]
+    created_at: datetime
+    updated_at: Optional[datetime]
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
+def _check_bands(bands: List[GradingScaleBandBase]) -> List[GradingScaleBandBase]:
+    minimums = [band.min_percentage for band in bands]
+    if len(set(minimums)) != len(minimums):
+        raise ValueError('each band must have a different min_percentage')
+    if 0 not in minimums:
+        raise ValueError('one band must start at 0 so every percentage gets a letter')
+    return sorted(bands, key=lambda band: band.min_percentage, reverse=True)
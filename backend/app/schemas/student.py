@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, validator
 from typing import Optional, List, Dict, Any
 from datetime import date, datetime
 from ..models.student import Gender, BloodGroup
@@ -72,8 +72,7 @@ class StudentResponse(StudentBase):
     # Nested user info
     user: Optional[Dict[str, Any]] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class StudentListResponse(BaseModel):
@@ -88,8 +87,12 @@ class StudentListResponse(BaseModel):
     section_name: Optional[str] = None
     status: str
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class StudentSuggestion(BaseModel):
+    id: int
+    display_name: str
 
 
 class StudentDetailResponse(StudentResponse):
@@ -98,5 +101,18 @@ class StudentDetailResponse(StudentResponse):
     total_attendance_days: Optional[int] = None
     present_days: Optional[int] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class RosterImportError(BaseModel):
+    row: Optional[int] = None  # as numbered in the file (header is row 1); None if not row-specific
+    admission_number: Optional[str] = None
+    detail: str
+
+
+class RosterImportResponse(BaseModel):
+    dry_run: bool
+    total_rows: int
+    valid_rows: int
+    created: int
+    errors: List[RosterImportError]
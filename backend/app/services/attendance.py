@@ -0,0 +1,340 @@
+from datetime import date, datetime
+from typing import Mapping, Optional, Sequence
+
+from sqlalchemy import Select, select, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.attendance import Attendance, AttendanceStatus
+from ..models.student import Student
+from ..models.user import User
+from ..schemas.attendance import AttendanceBulkRecord
+from .attendance_rollups import STATUS_COLUMNS, apply_attendance_changes, student_counts
+from .data_versions import bump_versions
+
+# Keeps multi-row INSERTs well below the 32767 bind-parameter limit of asyncpg
+INSERT_CHUNK_SIZE = 1000
+
+
+async def bulk_mark_attendance(
+    db: AsyncSession,
+    attendance_date: date,
+    records: Sequence[AttendanceBulkRecord],
+    period_number: Optional[int] = None,
+    subject_id: Optional[int] = None,
+    marked_by: Optional[int] = None,
+) -> list[dict]:
+    """Mark attendance for a whole section in a handful of round trips.
+
+    Existing ``(student_id, date, period_number)`` keys are prefetched in one
+    query and new rows go in through multi-row ``INSERT ... ON CONFLICT DO
+    NOTHING`` statements of ``INSERT_CHUNK_SIZE`` rows, so a section of up to
+    1,000 students takes one. Returns one result per input record:
+
+    - ``created``: a new attendance row was written
+    - ``skipped``: the student was already marked with the same status
+    - ``conflict``: the student was already marked with a different status,
+      appears more than once in the payload, or was inserted concurrently
+
+    The monthly rollups are updated for the created rows in the same
+    transaction.
+    """
+    results: list[Optional[dict]] = [None] * len(records)
+    if not records:
+        return []
+
+    student_ids = {record.student_id for record in records}
+    existing_result = await db.execute(
+        select(Attendance.student_id, Attendance.id, Attendance.status).where(
+            Attendance.date == attendance_date,
+            Attendance.period_number == period_number,
+            Attendance.student_id.in_(student_ids),
+        )
+    )
+    existing = {row.student_id: row for row in existing_result}
+
+    check_in_time = datetime.now()
+    pending: dict[int, int] = {}  # student_id -> index into records
+    rows = []
+    for index, record in enumerate(records):
+        current = existing.get(record.student_id)
+        if current is not None:
+            same_status = current.status == record.status
+            results[index] = {
+                "student_id": record.student_id,
+                "result": "skipped" if same_status else "conflict",
+                "attendance_id": current.id,
+                "detail": None if same_status else f"Already marked as {current.status.value}",
+            }
+        elif record.student_id in pending:
+            results[index] = {
+                "student_id": record.student_id,
+                "result": "conflict",
+                "attendance_id": None,
+                "detail": "Duplicate student in request",
+            }
+        else:
+            pending[record.student_id] = index
+            rows.append({
+                "student_id": record.student_id,
+                "date": attendance_date,
+                "status": record.status,
+                "remarks": record.remarks,
+                "period_number": period_number,
+                "subject_id": subject_id,
+                "check_in_time": check_in_time,
+                "marked_by": marked_by,
+            })
+
+    created = []
+    for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+        insert_result = await db.execute(
+            pg_insert(Attendance)
+            .values(rows[start:start + INSERT_CHUNK_SIZE])
+            .on_conflict_do_nothing()
+            .returning(Attendance.id, Attendance.student_id)
+        )
+        for row in insert_result:
+            index = pending.pop(row.student_id)
+            results[index] = {
+                "student_id": row.student_id,
+                "result": "created",
+                "attendance_id": row.id,
+                "detail": None,
+            }
+            created.append((row.student_id, attendance_date, records[index].status, 1))
+
+    # Rows that lost a race against a concurrent writer
+    for student_id, index in pending.items():
+        results[index] = {
+            "student_id": student_id,
+            "result": "conflict",
+            "attendance_id": None,
+            "detail": "Attendance was marked concurrently",
+        }
+
+    await apply_attendance_changes(db, created)
+    await bump_versions(db, "attendance", (student_id for student_id, *_ in created))
+    return results
+
+
+def attendance_by_date_query(
+    attendance_date: date,
+    class_id: Optional[int] = None,
+    section_id: Optional[int] = None,
+) -> Select:
+    """A day's attendance as flat ``AttendanceDateRecord`` rows, one query.
+
+    Only the columns the response needs are selected, so no ORM objects are
+    built and nothing else about the student or user is loaded.
+    """
+    query = (
+        select(
+            Attendance.id,
+            Attendance.student_id,
+            Student.admission_number,
+            Student.roll_number,
+            (User.first_name + " " + User.last_name).label("student_name"),
+            Student.class_id,
+            Student.section_id,
+            Attendance.date,
+            Attendance.status,
+            Attendance.period_number,
+            Attendance.subject_id,
+            Attendance.remarks,
+            Attendance.check_in_time,
+            Attendance.check_out_time,
+            Attendance.marked_by,
+            Attendance.marked_at,
+        )
+        .join(Student, Student.id == Attendance.student_id)
+        .join(User, User.id == Student.user_id)
+        .where(Attendance.date == attendance_date)
+        .order_by(Student.admission_number, Attendance.period_number.nulls_first())
+    )
+
+    if class_id:
+        query = query.where(Student.class_id == class_id)
+    if section_id:
+        query = query.where(Student.section_id == section_id)
+
+    return query
+
+
+def attendance_summary_query(
+    start_date: date,
+    end_date: date,
+    class_id: Optional[int] = None,
+    section_id: Optional[int] = None,
+) -> Select:
+    """Per-student attendance counters for a date range as one grouped query.
+
+    Whole months are read from the ``attendance_reports`` rollups and only the
+    partial months at either edge are counted from raw attendance rows, so the
+    cost follows the number of students rather than the length of the range.
+    Students without attendance are included with zeros.
+    """
+    counts = student_counts(start_date, end_date, _roster(class_id, section_id))
+
+    query = (
+        select(
+            Student.id.label("student_id"),
+            User.first_name,
+            User.last_name,
+            Student.admission_number,
+            func.coalesce(counts.c.total_days, 0).label("total_days"),
+            func.coalesce(counts.c.present_days, 0).label("present_days"),
+            func.coalesce(counts.c.absent_days, 0).label("absent_days"),
+            func.coalesce(counts.c.late_days, 0).label("late_days"),
+        )
+        .join(User, Student.user_id == User.id)
+        .outerjoin(counts, counts.c.student_id == Student.id)
+        .order_by(Student.id)
+    )
+
+    if class_id:
+        query = query.where(Student.class_id == class_id)
+    if section_id:
+        query = query.where(Student.section_id == section_id)
+
+    return query
+
+
+async def count_summary_students(
+    db: AsyncSession,
+    class_id: Optional[int] = None,
+    section_id: Optional[int] = None,
+) -> int:
+    """Rows ``attendance_summary_query`` returns, from the students table alone."""
+    query = select(func.count()).select_from(Student)
+    if class_id:
+        query = query.where(Student.class_id == class_id)
+    if section_id:
+        query = query.where(Student.section_id == section_id)
+    return await db.scalar(query)
+
+
+async def attendance_summaries(
+    db: AsyncSession,
+    start_date: date,
+    end_date: date,
+    class_id: Optional[int] = None,
+    section_id: Optional[int] = None,
+) -> list[dict]:
+    """``StudentAttendanceSummary`` rows of ``attendance_summary_query``."""
+    result = await db.execute(
+        attendance_summary_query(start_date, end_date, class_id=class_id, section_id=section_id)
+    )
+    
+    summaries = []
+    for row in result:
+        percentage = (row.present_days / row.total_days * 100) if row.total_days > 0 else 0
+        summaries.append({
+            "student_id": row.student_id,
+            "student_name": f"{row.first_name} {row.last_name}",
+            "admission_number": row.admission_number,
+            "total_days": row.total_days,
+            "present_days": row.present_days,
+            "absent_days": row.absent_days,
+            "late_days": row.late_days,
+            "attendance_percentage": round(percentage, 2)
+        })
+    
+    return summaries
+
+
+def attendance_range_stats_query(
+    start_date: date,
+    end_date: date,
+    class_id: Optional[int] = None,
+    section_id: Optional[int] = None,
+    breakdown: Optional[str] = None,
+) -> Select:
+    """Attendance counters over a date range, one column per status.
+
+    Reads the same rollup/raw mix as ``attendance_summary_query`` and groups
+    it by class (and section) when ``breakdown`` is set.
+    """
+    group_columns = []
+    if breakdown == "class":
+        group_columns = [Student.class_id]
+    elif breakdown == "section":
+        group_columns = [Student.class_id, Student.section_id]
+
+    counts = student_counts(start_date, end_date, _roster(class_id, section_id))
+
+    query = select(
+        *group_columns,
+        *(func.coalesce(func.sum(counts.c[column]), 0).label(column) for column in STATUS_COLUMNS.values()),
+    )
+    if group_columns:
+        query = query.select_from(counts).join(Student, Student.id == counts.c.student_id).group_by(*group_columns)
+    return query
+
+
+def attendance_stats_query(
+    attendance_date: date,
+    class_id: Optional[int] = None,
+    section_id: Optional[int] = None,
+    breakdown: Optional[str] = None,
+) -> Select:
+    """Attendance counts for one date grouped by status.
+
+    With ``breakdown`` set to ``"class"`` or ``"section"`` the counts are also
+    grouped by ``class_id`` (and ``section_id``), so a whole-school dashboard
+    gets every class in the same query.
+    """
+    group_columns = []
+    if breakdown == "class":
+        group_columns = [Student.class_id]
+    elif breakdown == "section":
+        group_columns = [Student.class_id, Student.section_id]
+
+    query = (
+        select(*group_columns, Attendance.status, func.count().label("count"))
+        .where(Attendance.date == attendance_date)
+        .group_by(*group_columns, Attendance.status)
+    )
+
+    if class_id or section_id or group_columns:
+        query = query.join(Student, Attendance.student_id == Student.id)
+    if class_id:
+        query = query.where(Student.class_id == class_id)
+    if section_id:
+        query = query.where(Student.section_id == section_id)
+
+    return query
+
+
+def summarize_status_counts(counts: Mapping[AttendanceStatus, int]) -> dict:
+    """Turn per-status counts into the ``AttendanceStatsBase`` fields."""
+    total = sum(counts.values())
+    present = counts.get(AttendanceStatus.PRESENT, 0)
+    percentage = (present / total * 100) if total > 0 else 0
+
+    return {
+        "total_students": total,
+        "present": present,
+        "absent": counts.get(AttendanceStatus.ABSENT, 0),
+        "late": counts.get(AttendanceStatus.LATE, 0),
+        "sick_leave": counts.get(AttendanceStatus.SICK_LEAVE, 0),
+        "excused": counts.get(AttendanceStatus.EXCUSED, 0),
+        "half_day": counts.get(AttendanceStatus.HALF_DAY, 0),
+        "attendance_percentage": round(percentage, 2)
+    }
+
+
+def range_status_counts(row) -> dict:
+    """Per-status counts of one ``attendance_range_stats_query`` row."""
+    return {attendance_status: getattr(row, column) for attendance_status, column in STATUS_COLUMNS.items()}
+
+
+def _roster(class_id: Optional[int], section_id: Optional[int]) -> Optional[Select]:
+    if not class_id and not section_id:
+        return None
+    roster = select(Student.id)
+    if class_id:
+        roster = roster.where(Student.class_id == class_id)
+    if section_id:
+        roster = roster.where(Student.section_id == section_id)
+    return roster
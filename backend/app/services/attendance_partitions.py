@@ -0,0 +1,142 @@
+import re
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+PARENT_TABLE = "attendance"
+DEFAULT_PARTITION = "attendance_default"
+
+_PARTITION_NAME = re.compile(r"^attendance_y(\d{4})m(\d{2})$")
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    years, index = divmod(month.month - 1 + months, 12)
+    return date(month.year + years, index + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Name of the partition holding ``month``, e.g. ``attendance_y2026m10``."""
+    return f"attendance_y{month.year}m{month.month:02d}"
+
+
+async def monthly_partitions(conn: AsyncConnection) -> list[tuple[str, date]]:
+    """Attached monthly partitions as ``(name, first day of month)``, oldest first."""
+    result = await conn.execute(
+        text(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = :parent
+            """
+        ),
+        {"parent": PARENT_TABLE},
+    )
+    partitions = []
+    for name in result.scalars():
+        match = _PARTITION_NAME.match(name)
+        if match:
+            partitions.append((name, date(int(match.group(1)), int(match.group(2)), 1)))
+    return sorted(partitions, key=lambda partition: partition[1])
+
+
+async def create_partitions(
+    conn: AsyncConnection,
+    through: date,
+    start: Optional[date] = None,
+) -> list[str]:
+    """Create every missing monthly partition from ``start`` through ``through``.
+
+    ``start`` defaults to the current month. Rows that landed in the default
+    partition because their month did not exist yet are moved into the new
+    partition. Returns the names of the partitions created.
+    """
+    existing = {month for _, month in await monthly_partitions(conn)}
+    created = []
+    month = month_start(start or date.today())
+    while month <= through:
+        if month not in existing:
+            await _create_partition(conn, month)
+            created.append(partition_name(month))
+        month = add_months(month, 1)
+    return created
+
+
+async def detach_partitions(
+    conn: AsyncConnection,
+    before: date,
+    archive_schema: Optional[str] = None,
+    drop: bool = False,
+) -> list[str]:
+    """Detach every monthly partition that ends on or before ``before``.
+
+    Detached partitions become plain tables. They are moved into
+    ``archive_schema`` when given, or dropped when ``drop`` is set.
+    Returns the names of the partitions detached.
+    """
+    detached = []
+    for name, month in await monthly_partitions(conn):
+        if add_months(month, 1) > before:
+            break
+        await conn.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+        if drop:
+            await conn.execute(text(f"DROP TABLE {name}"))
+        elif archive_schema:
+            await conn.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{archive_schema}"'))
+            await conn.execute(text(f'ALTER TABLE {name} SET SCHEMA "{archive_schema}"'))
+        detached.append(name)
+    return detached
+
+
+async def _create_partition(conn: AsyncConnection, month: date) -> None:
+    name = partition_name(month)
+    lower, upper = month, add_months(month, 1)
+    bounds = f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+
+    has_default = await conn.execute(
+        text(
+            """
+            SELECT EXISTS (
+                SELECT 1 FROM pg_class WHERE relname = :default_partition
+            )
+            """
+        ),
+        {"default_partition": DEFAULT_PARTITION},
+    )
+    if not has_default.scalar():
+        await conn.execute(text(f"CREATE TABLE {name} PARTITION OF {PARENT_TABLE} {bounds}"))
+        return
+
+    overlapping = await conn.execute(
+        text(f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE date >= :lower AND date < :upper)"),
+        {"lower": lower, "upper": upper},
+    )
+    if not overlapping.scalar():
+        await conn.execute(text(f"CREATE TABLE {name} PARTITION OF {PARENT_TABLE} {bounds}"))
+        return
+
+    # Postgres refuses a new partition that overlaps rows in the default
+    # partition, so detach it, move those rows over and attach it again
+    await conn.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {DEFAULT_PARTITION}"))
+    await conn.execute(text(f"CREATE TABLE {name} PARTITION OF {PARENT_TABLE} {bounds}"))
+    await conn.execute(
+        text(
+            f"""
+            WITH moved AS (
+                DELETE FROM {DEFAULT_PARTITION}
+                WHERE date >= :lower AND date < :upper
+                RETURNING *
+            )
+            INSERT INTO {PARENT_TABLE} SELECT * FROM moved
+            """
+        ),
+        {"lower": lower, "upper": upper},
+    )
+    await conn.execute(text(f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT"))
@@ -0,0 +1,195 @@
+from collections import Counter
+from datetime import date, timedelta
+from typing import Iterable, Optional
+
+from sqlalchemy import Integer, Numeric, Select, String, Subquery, and_, case, cast, delete, func, or_, select, text, tuple_, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from ..models.attendance import Attendance, AttendanceReport, AttendanceStatus
+from .attendance_partitions import add_months, month_start
+
+# AttendanceReport counter column per status
+STATUS_COLUMNS = {
+    AttendanceStatus.PRESENT: "present_days",
+    AttendanceStatus.ABSENT: "absent_days",
+    AttendanceStatus.LATE: "late_days",
+    AttendanceStatus.HALF_DAY: "half_day_days",
+    AttendanceStatus.SICK_LEAVE: "sick_leave_days",
+    AttendanceStatus.EXCUSED: "excused_days",
+}
+COUNTER_COLUMNS = ["total_days", *STATUS_COLUMNS.values()]
+
+# Rollup rows per multi-row upsert
+ROLLUP_CHUNK_SIZE = 1000
+
+
+async def apply_attendance_changes(
+    db: AsyncSession,
+    changes: Iterable[tuple[int, date, AttendanceStatus, int]],
+) -> None:
+    """Add ``(student_id, date, status, delta)`` changes to the monthly rollups.
+
+    Changes are folded per student and month and written with one
+    ``INSERT ... ON CONFLICT DO UPDATE`` that increments the counters, so
+    concurrent writers never lose an update. Call it in the same transaction
+    as the attendance write it describes.
+    """
+    deltas: dict[tuple[int, int, int], Counter] = {}
+    for student_id, day, attendance_status, delta in changes:
+        counters = deltas.setdefault((student_id, day.year, day.month), Counter())
+        counters["total_days"] += delta
+        counters[STATUS_COLUMNS[attendance_status]] += delta
+
+    # Sorted keys keep the row lock order stable across concurrent upserts
+    rows = [
+        {
+            "student_id": student_id,
+            "year": year,
+            "month": month,
+            **{column: counters[column] for column in COUNTER_COLUMNS},
+            "attendance_percentage": _percentage(counters["present_days"], counters["total_days"]),
+        }
+        for (student_id, year, month), counters in sorted(deltas.items())
+        if any(counters.values())
+    ]
+
+    for start in range(0, len(rows), ROLLUP_CHUNK_SIZE):
+        stmt = pg_insert(AttendanceReport).values(rows[start:start + ROLLUP_CHUNK_SIZE])
+        table = AttendanceReport.__table__
+        new_present = table.c.present_days + stmt.excluded.present_days
+        new_total = table.c.total_days + stmt.excluded.total_days
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["student_id", "year", "month"],
+                set_={
+                    **{column: table.c[column] + stmt.excluded[column] for column in COUNTER_COLUMNS},
+                    "attendance_percentage": _percentage_sql(new_present, new_total),
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+
+async def rebuild_rollups(
+    conn: AsyncConnection,
+    first_month: Optional[date] = None,
+    last_month: Optional[date] = None,
+) -> int:
+    """Recompute the rollups of ``first_month`` through ``last_month`` from raw rows.
+
+    Both bounds are optional; without them every month is rebuilt. Attendance
+    writes are blocked (``SHARE`` lock) until the transaction ends, so no
+    concurrent delta can slip between the delete and the recount.
+    Returns the number of rollup rows written.
+    """
+    await conn.execute(text("LOCK TABLE attendance IN SHARE MODE"))
+
+    month_key = tuple_(AttendanceReport.year, AttendanceReport.month)
+    clear = delete(AttendanceReport)
+    recount = select(
+        Attendance.student_id,
+        cast(func.extract("year", Attendance.date), Integer).label("year"),
+        cast(func.extract("month", Attendance.date), Integer).label("month"),
+        func.count().label("total_days"),
+        *(count_status(attendance_status).label(column) for attendance_status, column in STATUS_COLUMNS.items()),
+        _percentage_sql(count_status(AttendanceStatus.PRESENT), func.count()).label("attendance_percentage"),
+    ).group_by(Attendance.student_id, "year", "month")
+
+    if first_month:
+        first_month = month_start(first_month)
+        clear = clear.where(month_key >= (first_month.year, first_month.month))
+        recount = recount.where(Attendance.date >= first_month)
+    if last_month:
+        last_month = month_start(last_month)
+        clear = clear.where(month_key <= (last_month.year, last_month.month))
+        recount = recount.where(Attendance.date < add_months(last_month, 1))
+
+    await conn.execute(clear)
+    result = await conn.execute(
+        pg_insert(AttendanceReport).from_select(
+            ["student_id", "year", "month", *COUNTER_COLUMNS, "attendance_percentage"],
+            recount,
+        )
+    )
+    return result.rowcount
+
+
+def split_range(start_date: date, end_date: date) -> tuple[Optional[tuple[date, date]], list[tuple[date, date]]]:
+    """Split an inclusive date range into whole months and raw edge ranges.
+
+    Returns ``((first_month, last_month), edges)`` where the months are served
+    from the rollups and ``edges`` are the inclusive ``(start, end)`` ranges
+    that have to be counted from raw rows. The months are ``None`` when the
+    range does not cover a whole month.
+    """
+    first_full = start_date if start_date.day == 1 else add_months(month_start(start_date), 1)
+    after_full = month_start(end_date + timedelta(days=1))
+    if first_full >= after_full:
+        return None, [(start_date, end_date)]
+
+    edges = []
+    if start_date < first_full:
+        edges.append((start_date, first_full - timedelta(days=1)))
+    if after_full <= end_date:
+        edges.append((after_full, end_date))
+    return (first_full, add_months(after_full, -1)), edges
+
+
+def student_counts(start_date: date, end_date: date, roster: Optional[Select] = None) -> Subquery:
+    """Per-student counters for a date range, from rollups plus raw edge rows.
+
+    The subquery has a ``student_id`` column plus one column per name in
+    ``COUNTER_COLUMNS``. ``roster`` is an optional ``select(Student.id)``
+    restricting the students counted.
+    """
+    months, edges = split_range(start_date, end_date)
+    arms = []
+
+    if months:
+        first_month, last_month = months
+        month_key = tuple_(AttendanceReport.year, AttendanceReport.month)
+        rollups = select(
+            AttendanceReport.student_id,
+            *(getattr(AttendanceReport, column).label(column) for column in COUNTER_COLUMNS),
+        ).where(
+            month_key >= (first_month.year, first_month.month),
+            month_key <= (last_month.year, last_month.month),
+        )
+        if roster is not None:
+            rollups = rollups.where(AttendanceReport.student_id.in_(roster))
+        arms.append(rollups)
+
+    if edges:
+        raw = select(
+            Attendance.student_id,
+            func.count().label("total_days"),
+            *(count_status(attendance_status).label(column) for attendance_status, column in STATUS_COLUMNS.items()),
+        ).where(
+            or_(*(and_(Attendance.date >= edge_start, Attendance.date <= edge_end) for edge_start, edge_end in edges))
+        ).group_by(Attendance.student_id)
+        if roster is not None:
+            raw = raw.where(Attendance.student_id.in_(roster))
+        arms.append(raw)
+
+    combined = union_all(*arms).subquery() if len(arms) > 1 else arms[0].subquery()
+    return (
+        select(
+            combined.c.student_id,
+            *(cast(func.sum(combined.c[column]), Integer).label(column) for column in COUNTER_COLUMNS),
+        )
+        .group_by(combined.c.student_id)
+        .subquery("attendance_counts")
+    )
+
+
+def count_status(attendance_status: AttendanceStatus):
+    return func.count(Attendance.id).filter(Attendance.status == attendance_status)
+
+
+def _percentage(present: int, total: int) -> Optional[str]:
+    return f"{present / total * 100:.2f}" if total > 0 else None
+
+
+def _percentage_sql(present, total):
+    return case((total > 0, cast(func.round(cast(present, Numeric) * 100 / total, 2), String)), else_=None)
@@ -0,0 +1,71 @@
+import hashlib
+from typing import Iterable, Literal, Union
+
+from fastapi import Request
+from sqlalchemy import Select, func, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models.student import StudentDataVersion
+
+DataKind = Literal["grades", "attendance"]
+VERSION_COLUMNS = ["grades_version", "attendance_version"]
+
+
+async def bump_versions(
+    db: AsyncSession,
+    kind: DataKind,
+    students: Union[Iterable[int], Select],
+) -> None:
+    """Bump the ``kind`` version of ``students`` in the caller's transaction.
+
+    ``students`` is a collection of ids or a select of one student id
+    column, for set-based writes. One ``INSERT ... ON CONFLICT DO UPDATE``
+    either way; ids are sorted so concurrent writers lock rows in the same
+    order.
+    """
+    column = f"{kind}_version"
+    initial = {name: int(name == column) for name in VERSION_COLUMNS}
+    if isinstance(students, Select):
+        stmt = pg_insert(StudentDataVersion).from_select(
+            ["student_id", *initial],
+            select(
+                students.subquery().c[0].label("student_id"),
+                *(literal(value) for value in initial.values()),
+            ).distinct().order_by("student_id"),
+        )
+    else:
+        student_ids = sorted(set(students))
+        if not student_ids:
+            return
+        stmt = pg_insert(StudentDataVersion).values(
+            [{"student_id": student_id, **initial} for student_id in student_ids]
+        )
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["student_id"],
+            set_={column: StudentDataVersion.__table__.c[column] + 1, "updated_at": func.now()},
+        )
+    )
+
+
+async def student_etag(db: AsyncSession, request: Request, kind: DataKind, student_id: int) -> str:
+    """Weak ETag of a student's ``kind`` listing, from one primary-key lookup.
+
+    The query string is part of the tag, so every page and filter of the
+    listing has its own.
+    """
+    version = await db.scalar(
+        select(getattr(StudentDataVersion, f"{kind}_version")).where(StudentDataVersion.student_id == student_id)
+    )
+    query = hashlib.sha1(str(sorted(request.query_params.multi_items())).encode()).hexdigest()[:16]
+    return f'W/"{kind}-{student_id}-{version or 0}-{query}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether ``If-None-Match`` names ``etag`` (weak comparison) or ``*``."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in header.split(",")}
+    return "*" in candidates or etag.removeprefix("W/") in candidates
@@ -0,0 +1,208 @@
+import asyncio
+import csv
+import enum
+import io
+import os
+import tempfile
+from datetime import date
+from pathlib import Path
+from typing import AsyncIterator, Optional, Sequence
+
+from fastapi.responses import FileResponse, StreamingResponse
+from openpyxl import Workbook
+from sqlalchemy import Select, select
+from sqlalchemy.engine import Row
+from starlette.background import BackgroundTask
+
+from ..core.database import AsyncSessionLocal
+from ..models.academic import Class, Section, Subject
+from ..models.attendance import Attendance
+from ..models.gradebook import Assessment, Grade
+from ..models.student import Student
+from ..models.user import User
+
+# Rows fetched per server-side cursor round trip; also the CSV write batch
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_FORMATS = ("csv", "xlsx")
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+# Leading characters that make Excel and LibreOffice read a cell as a formula
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def attendance_export_query(
+    start_date: date,
+    end_date: date,
+    class_id: Optional[int] = None,
+    section_id: Optional[int] = None,
+) -> Select:
+    """Flat attendance rows for a date range, one per mark.
+
+    The range filter prunes to the matching monthly partitions.
+    """
+    query = (
+        select(
+            Attendance.date,
+            Student.admission_number,
+            Student.roll_number,
+            User.first_name,
+            User.last_name,
+            Class.name.label("class_name"),
+            Section.name.label("section_name"),
+            Attendance.period_number,
+            Subject.name.label("subject"),
+            Attendance.status,
+            Attendance.remarks,
+        )
+        .join(Student, Student.id == Attendance.student_id)
+        .join(User, User.id == Student.user_id)
+        .outerjoin(Class, Class.id == Student.class_id)
+        .outerjoin(Section, Section.id == Student.section_id)
+        .outerjoin(Subject, Subject.id == Attendance.subject_id)
+        .where(Attendance.date >= start_date, Attendance.date <= end_date)
+        .order_by(Attendance.date, Student.admission_number, Attendance.period_number.nulls_first())
+    )
+    if class_id:
+        query = query.where(Student.class_id == class_id)
+    if section_id:
+        query = query.where(Student.section_id == section_id)
+    return query
+
+
+def grade_sheet_query(
+    assessment_id: Optional[int] = None,
+    subject_id: Optional[int] = None,
+    class_id: Optional[int] = None,
+) -> Select:
+    """Flat grade rows for an assessment or a subject, one per student grade."""
+    query = (
+        select(
+            Assessment.id.label("assessment_id"),
+            Assessment.title.label("assessment"),
+            Assessment.assessment_type,
+            Assessment.date.label("assessment_date"),
+            Subject.name.label("subject"),
+            Student.admission_number,
+            Student.roll_number,
+            User.first_name,
+            User.last_name,
+            Class.name.label("class_name"),
+            Section.name.label("section_name"),
+            Assessment.total_marks,
+            Grade.marks_obtained,
+            Grade.percentage,
+            Grade.grade,
+            Grade.is_absent,
+            Grade.remarks,
+        )
+        .join(Assessment, Assessment.id == Grade.assessment_id)
+        .join(Subject, Subject.id == Grade.subject_id)
+        .join(Student, Student.id == Grade.student_id)
+        .join(User, User.id == Student.user_id)
+        .outerjoin(Class, Class.id == Student.class_id)
+        .outerjoin(Section, Section.id == Student.section_id)
+        .order_by(Assessment.date, Assessment.id, Student.admission_number)
+    )
+    if assessment_id:
+        query = query.where(Grade.assessment_id == assessment_id)
+    if subject_id:
+        query = query.where(Grade.subject_id == subject_id)
+    if class_id:
+        query = query.where(Student.class_id == class_id)
+    return query
+
+
+def export_header(query: Select) -> list[str]:
+    return [column.key for column in query.selected_columns]
+
+
+async def iter_partitions(query: Select) -> AsyncIterator[Sequence[Row]]:
+    """Yield the query's rows ``EXPORT_CHUNK_SIZE`` at a time.
+
+    Uses its own session, so it outlives the request's dependencies while a
+    response streams, and a server-side cursor (which needs the transaction
+    the write session opens), so only one chunk is ever held in memory.
+    """
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(query.execution_options(yield_per=EXPORT_CHUNK_SIZE))
+        async for partition in result.partitions():
+            yield partition
+
+
+async def stream_csv(query: Select) -> AsyncIterator[str]:
+    """CSV text of the query, header first, one chunk of rows per piece."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(export_header(query))
+    yield buffer.getvalue()
+
+    async for partition in iter_partitions(query):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([_plain(value) for value in row] for row in partition)
+        yield buffer.getvalue()
+
+
+async def write_xlsx(query: Select, destination: Path, sheet_title: str) -> None:
+    """Write the query to an XLSX file with openpyxl's write-only mode.
+
+    Write-only worksheets spool rows to disk as they are appended, so memory
+    stays flat; appending runs off the event loop one chunk at a time.
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(sheet_title[:31])
+    sheet.append(export_header(query))
+
+    async for partition in iter_partitions(query):
+        await asyncio.to_thread(_append_rows, sheet, partition)
+
+    await asyncio.to_thread(workbook.save, destination)
+
+
+async def export_response(query: Select, output_format: str, filename: str):
+    """Stream ``query`` as CSV, or build an XLSX temp file and send it.
+
+    ``filename`` has no extension. XLSX is a ZIP container, so the file is
+    finished before the first byte is sent and removed once it has been.
+    """
+    if output_format == "csv":
+        return StreamingResponse(
+            stream_csv(query),
+            media_type="text/csv; charset=utf-8",
+            headers={"Content-Disposition": f'attachment; filename="{filename}.csv"'},
+        )
+
+    handle, path = tempfile.mkstemp(prefix="export-", suffix=".xlsx")
+    os.close(handle)
+    try:
+        await write_xlsx(query, Path(path), filename)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return FileResponse(
+        path,
+        media_type=XLSX_MEDIA_TYPE,
+        filename=f"{filename}.xlsx",
+        background=BackgroundTask(os.unlink, path),
+    )
+
+
+def _append_rows(sheet, rows: Sequence[Row]) -> None:
+    for row in rows:
+        sheet.append([_plain(value) for value in row])
+
+
+def _plain(value):
+    """A cell value for either writer: enums by value, text made formula-safe."""
+    if isinstance(value, enum.Enum):
+        value = value.value
+    return _safe_text(value) if isinstance(value, str) else value
+
+
+def _safe_text(value: str) -> str:
+    """Prefix ``'`` to text a spreadsheet would run as a formula.
+
+    Names and remarks are user input; ``=HYPERLINK(...)`` or ``@SUM(...)``
+    must open as text, in CSV as well as XLSX.
+    """
+    return "'" + value if value.startswith(FORMULA_PREFIXES) else value
@@ -0,0 +1,377 @@
+import csv
+import json
+from collections import deque
+from datetime import datetime
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Optional, Sequence
+
+import numpy as np
+from pydantic import ValidationError
+from sqlalchemy import Select, select, and_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.response_cache import response_cache, student_grades_tag
+from ..models.academic import Subject
+from ..models.gradebook import Assessment, Grade
+from ..models.student import Student
+from ..models.user import User
+from ..schemas.gradebook import GradeBulkRecord
+from .data_versions import bump_versions
+from .grading_scales import scales_for_classes
+
+# Rows per existence query / multi-row INSERT when ingesting grades
+INGEST_CHUNK_SIZE = 1000
+# Invalid rows listed in a stream upload's response; the rest are only counted
+STREAM_ERROR_LIMIT = 100
+# Longest line (or quoted CSV record) of a stream upload; longer ones are
+# dropped as invalid instead of being buffered
+MAX_LINE_BYTES = 64 * 1024
+
+
+def assessment_grades_query(assessment_id: int) -> Select:
+    """An assessment's grades as flat ``AssessmentGradeRecord`` rows, by id.
+
+    Only the columns the response needs are selected, so no ORM objects are
+    built and nothing else about the student or user is loaded.
+    """
+    return (
+        select(
+            Grade.id,
+            Grade.student_id,
+            Student.admission_number,
+            Student.roll_number,
+            (User.first_name + " " + User.last_name).label("student_name"),
+            Grade.assessment_id,
+            Grade.subject_id,
+            Grade.teacher_id,
+            Grade.marks_obtained,
+            Grade.percentage,
+            Grade.grade,
+            Grade.is_absent,
+            Grade.remarks,
+            Grade.feedback,
+            Grade.submitted_on,
+            Grade.graded_on,
+        )
+        .join(Student, Student.id == Grade.student_id)
+        .join(User, User.id == Student.user_id)
+        .where(Grade.assessment_id == assessment_id)
+    )
+
+
+def student_grades_query(student_id: int, subject_id: Optional[int] = None) -> Select:
+    """A student's grades as flat ``StudentGradeRecord`` rows, unordered.
+
+    The assessment title and marks and the subject name are joined in as
+    columns rather than loaded as related objects.
+    """
+    query = (
+        select(
+            Grade.id,
+            Grade.student_id,
+            Grade.assessment_id,
+            Assessment.title.label("assessment_title"),
+            Assessment.total_marks,
+            Grade.subject_id,
+            Subject.name.label("subject_name"),
+            Grade.teacher_id,
+            Grade.marks_obtained,
+            Grade.percentage,
+            Grade.grade,
+            Grade.is_absent,
+            Grade.remarks,
+            Grade.feedback,
+            Grade.submitted_on,
+            Grade.graded_on,
+            Grade.created_at,
+        )
+        .join(Assessment, Assessment.id == Grade.assessment_id)
+        .join(Subject, Subject.id == Grade.subject_id)
+        .where(Grade.student_id == student_id)
+    )
+    if subject_id:
+        query = query.where(Grade.subject_id == subject_id)
+    return query
+
+
+async def ingest_grades(
+    db: AsyncSession,
+    assessment: Assessment,
+    subject_id: int,
+    teacher_id: int,
+    records: Sequence[GradeBulkRecord],
+) -> list[dict]:
+    """Insert a batch of grades for one assessment.
+
+    Student existence and already-graded students are resolved with a single
+    query, percentages are computed in one pass, letter grades per class scale
+    on whole arrays, and the new
+    rows are written with one multi-row ``INSERT ... ON CONFLICT DO NOTHING``.
+    Returns one result per record: ``created``, ``skipped`` (already graded)
+    or ``invalid``.
+    """
+    results: list[Optional[dict]] = [None] * len(records)
+    if not records:
+        return []
+
+    student_ids = {record.student_id for record in records}
+    lookup = await db.execute(
+        select(Student.id, Student.class_id, Grade.id.label("grade_id"))
+        .outerjoin(
+            Grade,
+            and_(Grade.student_id == Student.id, Grade.assessment_id == assessment.id),
+        )
+        .where(Student.id.in_(student_ids))
+    )
+    lookup = lookup.all()
+    existing = {row.id: row.grade_id for row in lookup}
+    student_classes = {row.id: row.class_id for row in lookup}
+
+    graded_on = datetime.now()
+    total_marks = assessment.total_marks
+    pending: dict[int, int] = {}  # student_id -> index into records
+    rows = []
+    for index, record in enumerate(records):
+        student_id = record.student_id
+        if student_id not in existing:
+            results[index] = _result(student_id, "invalid", detail="Student not found")
+        elif existing[student_id] is not None:
+            results[index] = _result(student_id, "skipped", existing[student_id], "Grade already exists")
+        elif student_id in pending:
+            results[index] = _result(student_id, "invalid", detail="Duplicate student in request")
+        else:
+            percentage = None
+            if record.marks_obtained is not None and not record.is_absent:
+                percentage = (record.marks_obtained / total_marks) * 100
+            pending[student_id] = index
+            rows.append({
+                "student_id": student_id,
+                "assessment_id": assessment.id,
+                "subject_id": subject_id,
+                "teacher_id": teacher_id,
+                "marks_obtained": record.marks_obtained,
+                "grade": None,
+                "percentage": percentage,
+                "is_absent": record.is_absent,
+                "remarks": record.remarks,
+                "graded_on": graded_on,
+            })
+
+    await _assign_letters(db, rows, student_classes)
+
+    for start in range(0, len(rows), INGEST_CHUNK_SIZE):
+        insert_result = await db.execute(
+            pg_insert(Grade)
+            .values(rows[start:start + INGEST_CHUNK_SIZE])
+            .on_conflict_do_nothing()
+            .returning(Grade.id, Grade.student_id)
+        )
+        for row in insert_result:
+            results[pending.pop(row.student_id)] = _result(row.student_id, "created", row.id)
+
+    # Rows that lost a race against a concurrent writer
+    for student_id, index in pending.items():
+        results[index] = _result(student_id, "skipped", detail="Grade was created concurrently")
+
+    await bump_versions(db, "grades", (r["student_id"] for r in results if r["result"] == "created"))
+
+    return results
+
+
+async def ingest_grade_stream(
+    db: AsyncSession,
+    assessment: Assessment,
+    subject_id: int,
+    teacher_id: int,
+    lines: AsyncIterator[str],
+    csv_format: bool = False,
+) -> dict:
+    """Ingest an NDJSON or CSV stream of grade rows in fixed-size chunks.
+
+    Only one chunk of rows is held in memory at a time and each chunk is
+    committed on its own, so the connection goes back to the pool while the
+    client is still uploading. Re-sending a partially ingested file is safe:
+    rows that were already written are counted as ``skipped``.
+    Returns counters plus the first ``STREAM_ERROR_LIMIT`` invalid rows;
+    ``errors_truncated`` says whether there were more.
+    """
+    summary = {"created": 0, "skipped": 0, "invalid": 0, "errors": [], "errors_truncated": False}
+    chunk: list[GradeBulkRecord] = []
+    chunk_lines: list[int] = []
+
+    def add_error(line_number: int, result: dict) -> None:
+        if len(summary["errors"]) < STREAM_ERROR_LIMIT:
+            summary["errors"].append({"line": line_number, **result})
+        else:
+            summary["errors_truncated"] = True
+
+    async def flush():
+        results = await ingest_grades(db, assessment, subject_id, teacher_id, chunk)
+        await db.commit()
+        await response_cache.invalidate(
+            *(student_grades_tag(r["student_id"]) for r in results if r["result"] == "created")
+        )
+        for line_number, result in zip(chunk_lines, results):
+            summary[result["result"]] += 1
+            if result["result"] == "invalid":
+                add_error(line_number, result)
+        chunk.clear()
+        chunk_lines.clear()
+
+    header = None
+    records = _csv_records(lines) if csv_format else _ndjson_records(lines)
+    async for line_number, parse in records:
+        try:
+            values = parse()
+            if csv_format:
+                if header is None:
+                    header = [name.strip() for name in values]
+                    continue
+                values = {name: value for name, value in zip(header, values) if value != ""}
+            record = GradeBulkRecord.model_validate(values)
+        except (ValueError, ValidationError, csv.Error) as exc:
+            summary["invalid"] += 1
+            add_error(line_number, _result(None, "invalid", detail=describe_error(exc)))
+            continue
+
+        chunk.append(record)
+        chunk_lines.append(line_number)
+        if len(chunk) >= INGEST_CHUNK_SIZE:
+            await flush()
+
+    if chunk:
+        await flush()
+
+    return summary
+
+
+async def _ndjson_records(lines: AsyncIterator[Optional[str]]) -> AsyncIterator[tuple[int, Callable[[], Any]]]:
+    """``(line number, parse)`` for each non-blank line of an NDJSON stream."""
+    line_number = 0
+    async for line in lines:
+        line_number += 1
+        if line is None:
+            yield line_number, _line_too_long
+        elif line.strip():
+            yield line_number, partial(json.loads, line)
+
+
+async def _csv_records(lines: AsyncIterator[Optional[str]]) -> AsyncIterator[tuple[int, Callable[[], list[str]]]]:
+    """``(first line number, parse)`` for each record of a CSV stream.
+
+    One ``csv.reader`` reads the whole stream, so a quoted field may span
+    lines: lines are queued until their quotes balance and the record is
+    parsed when ``parse`` is called, before the next one is read. A record
+    over ``MAX_LINE_BYTES`` is dropped as invalid.
+    """
+    feed = _LineFeed()
+    reader = csv.reader(feed)
+    line_number = record_line = record_size = 0
+    open_quote = False
+    async for line in lines:
+        line_number += 1
+        if not feed.lines:
+            if line is not None and not line.strip():
+                continue
+            record_line, record_size = line_number, 0
+        if line is not None:
+            record_size += len(line)
+        if line is None or record_size > MAX_LINE_BYTES:
+            feed.lines.clear()
+            open_quote = False
+            yield record_line, _line_too_long
+            continue
+        feed.lines.append(line + "\n")
+        open_quote ^= line.count('"') % 2 == 1
+        if not open_quote:
+            yield record_line, partial(next, reader)
+    if feed.lines:
+        # Unterminated quoted field: parsed as far as it goes
+        yield record_line, partial(next, reader)
+
+
+class _LineFeed:
+    """The lines a ``csv.reader`` reads, appended as they arrive."""
+
+    def __init__(self):
+        self.lines: deque[str] = deque()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        if not self.lines:
+            raise StopIteration
+        return self.lines.popleft()
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Optional[str]]:
+    """Split a streamed request body into decoded lines.
+
+    Only the line being read is buffered and each chunk is scanned once. A
+    line longer than ``MAX_LINE_BYTES`` is not buffered: ``None`` stands in
+    for it and its bytes are dropped up to the next newline.
+    """
+    buffer = bytearray()
+    skipping = False  # inside a line already reported as too long
+    async for data in chunks:
+        start = 0
+        while (end := data.find(b"\n", start)) != -1:
+            if skipping:
+                skipping = False
+            else:
+                buffer += data[start:end]
+                yield _decode_line(buffer)
+            buffer.clear()
+            start = end + 1
+        if not skipping:
+            buffer += data[start:]
+            if len(buffer) > MAX_LINE_BYTES:
+                buffer.clear()
+                skipping = True
+                yield None
+    if buffer:
+        yield _decode_line(buffer)
+
+
+def _decode_line(line: bytearray) -> Optional[str]:
+    if len(line) > MAX_LINE_BYTES:
+        return None
+    return line.decode("utf-8-sig").rstrip("\r")
+
+
+def _line_too_long():
+    raise ValueError(f"Line is longer than {MAX_LINE_BYTES // 1024} KiB")
+
+
+def describe_error(exc: ValueError) -> str:
+    if isinstance(exc, ValidationError):
+        return "; ".join(
+            f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in exc.errors()
+        )
+    return str(exc)
+
+
+def _result(
+    student_id: Optional[int],
+    result: str,
+    grade_id: Optional[int] = None,
+    detail: Optional[str] = None,
+) -> dict:
+    return {"student_id": student_id, "result": result, "grade_id": grade_id, "detail": detail}
+
+
+async def _assign_letters(db: AsyncSession, rows: list[dict], student_classes: dict) -> None:
+    # One searchsorted per class scale over all of that class's percentages
+    by_class: dict[Optional[int], list[dict]] = {}
+    for row in rows:
+        if row["percentage"] is not None:
+            by_class.setdefault(student_classes[row["student_id"]], []).append(row)
+    if not by_class:
+        return
+    scales = await scales_for_classes(db, by_class)
+    for class_id, class_rows in by_class.items():
+        percentages = np.array([row["percentage"] for row in class_rows], dtype=float)
+        for row, letter in zip(class_rows, scales[class_id].letters_for(percentages)):
+            row["grade"] = letter
@@ -0,0 +1,201 @@
+import warnings
+from datetime import date
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import Select, select
+from sqlalchemy.engine import Row
+
+from ..models.gradebook import Assessment, Grade
+from ..models.student import Student
+from ..models.user import User
+from .grading_scales import DEFAULT_SCALE, PASS_PERCENTAGE, CompiledScale
+
+PERCENTILES = [25, 50, 75, 90]
+# Columns of ``gradebook_matrix_query``, in order
+MATRIX_COLUMNS = [
+    "student_id", "first_name", "last_name", "roll_number", "assessment_id", "title", "assessment_date",
+    "total_marks", "weightage", "passing_marks", "marks_obtained", "is_absent",
+]
+ASSESSMENT_STATS = ["graded", "average", "highest", "lowest", "pass_rate", *(f"p{pct}" for pct in PERCENTILES)]
+
+
+def gradebook_matrix_query(
+    class_id: int,
+    subject_id: int,
+    section_id: Optional[int] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+) -> Select:
+    """The class roster left-joined to its grades in the subject, one query.
+
+    Students without any grade still come back once (with NULL assessment
+    columns) so they get a row in the matrix.
+    """
+    grades = (
+        select(
+            Grade.student_id,
+            Grade.marks_obtained,
+            Grade.is_absent,
+            Assessment.id.label("assessment_id"),
+            Assessment.title,
+            Assessment.date.label("assessment_date"),
+            Assessment.total_marks,
+            Assessment.weightage,
+            Assessment.passing_marks,
+        )
+        .join(Assessment, Assessment.id == Grade.assessment_id)
+        .where(Grade.subject_id == subject_id)
+    )
+    if start_date:
+        grades = grades.where(Assessment.date >= start_date)
+    if end_date:
+        grades = grades.where(Assessment.date <= end_date)
+    grades = grades.subquery("grades")
+
+    query = (
+        select(
+            Student.id.label("student_id"),
+            User.first_name,
+            User.last_name,
+            Student.roll_number,
+            grades.c.assessment_id,
+            grades.c.title,
+            grades.c.assessment_date,
+            grades.c.total_marks,
+            grades.c.weightage,
+            grades.c.passing_marks,
+            grades.c.marks_obtained,
+            grades.c.is_absent,
+        )
+        .join(User, User.id == Student.user_id)
+        .outerjoin(grades, grades.c.student_id == Student.id)
+        .where(Student.class_id == class_id, Student.status == "active")
+        .order_by(Student.roll_number.nulls_last(), User.last_name, User.first_name, Student.id)
+    )
+    if section_id:
+        query = query.where(Student.section_id == section_id)
+    return query
+
+
+def build_gradebook_matrix(
+    rows: Sequence[Row],
+    subject_id: int,
+    subject_name: str,
+    scale: CompiledScale = DEFAULT_SCALE,
+) -> dict:
+    """Pivot matrix rows into a student x assessment matrix plus statistics.
+
+    Absent counts as zero marks and ungraded cells stay empty, and the
+    percentage is the ``weightage``-weighted mean of the graded assessments'
+    percentages, as on report cards; letters and grade points follow the
+    class ``scale``. Everything is computed on whole arrays; the result is
+    columnar (one list per field) to keep large classes compact.
+    """
+    frame = pd.DataFrame.from_records(rows, columns=MATRIX_COLUMNS)
+
+    students = frame.drop_duplicates("student_id").set_index("student_id")
+    graded = frame.dropna(subset=["assessment_id"]).astype({"assessment_id": int})
+    assessments = (
+        graded.drop_duplicates("assessment_id")
+        .sort_values(["assessment_date", "assessment_id"])
+        .set_index("assessment_id")
+    )
+
+    marks = graded["marks_obtained"].astype(float).where(~graded["is_absent"].astype(bool), 0.0)
+    matrix = (
+        graded.assign(marks=marks)
+        .pivot(index="student_id", columns="assessment_id", values="marks")
+        .reindex(index=students.index, columns=assessments.index)
+        .to_numpy(dtype=float)
+    )
+    absent = (
+        graded[graded["is_absent"].astype(bool)]
+        .pivot(index="student_id", columns="assessment_id", values="is_absent")
+        .reindex(index=students.index, columns=assessments.index)
+        .notna()
+        .to_numpy()
+    )
+
+    total_marks = assessments["total_marks"].to_numpy(dtype=float)
+    weights = assessments["weightage"].fillna(1.0).to_numpy(dtype=float)
+    passing = assessments["passing_marks"].to_numpy(dtype=float)
+    passing = np.where(np.isnan(passing), total_marks * PASS_PERCENTAGE / 100, passing)
+
+    is_graded = ~np.isnan(matrix)
+    graded_counts = is_graded.sum(axis=0)
+    passed = (is_graded & (np.nan_to_num(matrix, nan=-np.inf) >= passing)).sum(axis=0)
+    stats = {"graded": graded_counts.astype(float)}
+    with warnings.catch_warnings():
+        # Assessments or students with nothing graded come out as NaN
+        warnings.simplefilter("ignore", RuntimeWarning)
+        if len(assessments):
+            stats["average"] = np.nanmean(matrix, axis=0)
+            stats["highest"] = np.nanmax(matrix, axis=0)
+            stats["lowest"] = np.nanmin(matrix, axis=0)
+            stats["pass_rate"] = passed * 100 / graded_counts
+            quantiles = np.nanpercentile(matrix, PERCENTILES, axis=0)
+            stats.update({f"p{pct}": values for pct, values in zip(PERCENTILES, quantiles)})
+
+        scored = is_graded & (total_marks > 0)
+        weighted_score = np.where(scored, matrix / total_marks * weights, 0.0).sum(axis=1)
+        percentage = weighted_score * 100 / (scored * weights).sum(axis=1)
+        marks_obtained = np.nansum(matrix, axis=1)
+        marks_possible = (is_graded * total_marks).sum(axis=1)
+
+    percentage_series = pd.Series(percentage)
+    rank = percentage_series.rank(method="min", ascending=False)
+    percentile = percentage_series.rank(method="max", pct=True) * 100
+    scored = percentage[~np.isnan(percentage)]
+
+    absent_rows, absent_columns = np.nonzero(absent)
+    return {
+        "subject": {
+            "subject_id": subject_id,
+            "subject_name": subject_name,
+            "total_students": len(students),
+            "average_marks": _round(scored.mean()) if scored.size else 0.0,
+            "highest_marks": _round(scored.max()) if scored.size else 0.0,
+            "lowest_marks": _round(scored.min()) if scored.size else 0.0,
+            "passing_percentage": _round((scored >= PASS_PERCENTAGE).mean() * 100) if scored.size else 0.0,
+        },
+        "assessments": {
+            "id": assessments.index.tolist(),
+            "title": assessments["title"].tolist(),
+            "date": assessments["assessment_date"].tolist(),
+            "total_marks": total_marks.tolist(),
+            "weightage": weights.tolist(),
+            **{
+                name: _column(stats.get(name, []), digits=0 if name == "graded" else 2)
+                for name in ASSESSMENT_STATS
+            },
+        },
+        "students": {
+            "id": students.index.astype(int).tolist(),
+            "name": (students["first_name"] + " " + students["last_name"]).tolist(),
+            "roll_number": students["roll_number"].tolist(),
+            "marks_obtained": _column(np.where(is_graded.any(axis=1), marks_obtained, np.nan)),
+            "total_marks": _column(np.where(is_graded.any(axis=1), marks_possible, np.nan)),
+            "percentage": _column(percentage),
+            "grade": scale.letters_for(percentage).tolist(),
+            "grade_points": _column(scale.points_for(percentage)),
+            "rank": _column(rank.to_numpy(), digits=0),
+            "percentile": _column(percentile.to_numpy()),
+        },
+        "marks": _column(matrix),
+        "absent": np.column_stack([absent_rows, absent_columns]).tolist(),
+    }
+
+
+def _column(values, digits: int = 2) -> list:
+    """Float values as a JSON-ready list, rounded, with NaN as ``None``."""
+    values = np.round(np.asarray(values, dtype=float), digits)
+    missing = np.isnan(values)
+    column = (np.nan_to_num(values).astype(np.int64) if digits == 0 else values).astype(object)
+    column[missing] = None
+    return column.tolist()
+
+
+def _round(value: float) -> float:
+    return round(float(value), 2)
@@ -0,0 +1,270 @@
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import Update, case, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from ..core.cache import TTLCache
+from ..core.response_cache import GRADES_TAG, response_cache
+from ..core.database import AsyncSessionLocal
+from ..models.academic import Class
+from ..models.gradebook import Assessment, Grade, GradeScale, GradingScale
+from ..models.student import Student
+from .data_versions import bump_versions
+
+# Built-in scale used when neither the class nor the school defines one:
+# lowest percentage and grade points (10-point scale) per letter, best first
+LETTER_GRADE_THRESHOLDS = [
+    (90, GradeScale.A_PLUS, 10.0),
+    (80, GradeScale.A, 9.0),
+    (70, GradeScale.B_PLUS, 8.0),
+    (60, GradeScale.B, 7.0),
+    (50, GradeScale.C_PLUS, 6.0),
+    (40, GradeScale.C, 5.0),
+    (33, GradeScale.D, 4.0),
+    (0, GradeScale.F, 0.0),
+]
+# Pass mark when an assessment has no passing_marks: the lowest passing grade
+PASS_PERCENTAGE = LETTER_GRADE_THRESHOLDS[-2][0]
+
+# Compiled scales keyed by (scale id, version); an edit bumps the version, so
+# every worker process picks up the new bands on its next lookup
+scale_cache = TTLCache(maxsize=256, ttl=3600)
+
+
+@dataclass(frozen=True)
+class CompiledScale:
+    """A grading scale as sorted threshold arrays.
+
+    ``thresholds`` are the bands' minimum percentages in ascending order;
+    ``letters`` and ``points`` are aligned with them plus one trailing
+    ``None`` / NaN slot that missing percentages map to. A percentage's band
+    is found with one binary search (``numpy.searchsorted``).
+    """
+
+    scale_id: Optional[int]
+    version: int
+    thresholds: np.ndarray
+    letters: np.ndarray
+    points: np.ndarray
+
+    @classmethod
+    def compile(
+        cls,
+        bands: Iterable[tuple[float, str, Optional[float]]],
+        scale_id: Optional[int] = None,
+        version: int = 0,
+    ) -> "CompiledScale":
+        """Compile ``(min_percentage, letter, grade_points)`` bands."""
+        ordered = sorted(bands, key=lambda band: band[0])
+        return cls(
+            scale_id=scale_id,
+            version=version,
+            thresholds=np.array([band[0] for band in ordered], dtype=float),
+            letters=np.array([str(band[1]) for band in ordered] + [None], dtype=object),
+            points=np.array(
+                [np.nan if band[2] is None else band[2] for band in ordered] + [np.nan], dtype=float
+            ),
+        )
+
+    def positions(self, percentages) -> np.ndarray:
+        """Index of each percentage's band; below the lowest band counts as it."""
+        percentages = np.asarray(percentages, dtype=float)
+        positions = np.searchsorted(self.thresholds, percentages, side="right") - 1
+        positions = np.maximum(positions, 0)
+        positions[np.isnan(percentages)] = len(self.thresholds)
+        return positions
+
+    def letters_for(self, percentages) -> np.ndarray:
+        """Letters for an array of percentages; NaN maps to ``None``."""
+        return self.letters[self.positions(percentages)]
+
+    def points_for(self, percentages) -> np.ndarray:
+        """Grade points for an array of percentages; NaN maps to NaN."""
+        return self.points[self.positions(percentages)]
+
+    def letter(self, percentage: Optional[float]) -> Optional[str]:
+        if percentage is None:
+            return None
+        return self.letters[self.positions([percentage])[0]]
+
+    def sql(self, percentage):
+        """The scale as a SQL ``CASE`` over ``percentage``; NULL stays NULL."""
+        bands = list(zip(self.thresholds.tolist(), self.letters[:-1].tolist()))
+        lowest, *higher = bands
+        return case(
+            (percentage.is_(None), None),
+            *((percentage >= threshold, letter) for threshold, letter in reversed(higher)),
+            else_=lowest[1],
+        )
+
+
+DEFAULT_SCALE = CompiledScale.compile(
+    (threshold, letter.value, points) for threshold, letter, points in LETTER_GRADE_THRESHOLDS
+)
+
+
+async def scales_for_classes(db: AsyncSession, class_ids: Iterable[Optional[int]]) -> dict:
+    """The effective compiled scale of each class, from one version query.
+
+    A class uses its own scale, else the school default, else the built-in
+    ``DEFAULT_SCALE``; ``None`` stands for students without a class. Bands
+    are only loaded for scale versions not yet in ``scale_cache``.
+    """
+    class_ids = set(class_ids)
+    real_ids = [class_id for class_id in class_ids if class_id is not None]
+    result = await db.execute(
+        select(GradingScale.id, GradingScale.class_id, GradingScale.version).where(
+            or_(GradingScale.class_id.is_(None), GradingScale.class_id.in_(real_ids))
+        )
+    )
+    versions = {row.class_id: (row.id, row.version) for row in result}
+
+    missing = [key for key in versions.values() if scale_cache.get(key) is None]
+    if missing:
+        loaded = await db.execute(
+            select(GradingScale)
+            .options(selectinload(GradingScale.bands))
+            .where(GradingScale.id.in_([scale_id for scale_id, _ in missing]))
+        )
+        for scale in loaded.scalars():
+            scale_cache.set((scale.id, scale.version), compile_scale(scale))
+
+    def resolve(key) -> CompiledScale:
+        return (scale_cache.get(key) if key else None) or DEFAULT_SCALE
+
+    default = resolve(versions.get(None))
+    return {
+        class_id: resolve(versions[class_id]) if class_id in versions else default
+        for class_id in class_ids
+    }
+
+
+async def scale_for_class(db: AsyncSession, class_id: Optional[int]) -> CompiledScale:
+    return (await scales_for_classes(db, [class_id]))[class_id]
+
+
+def compile_scale(scale: GradingScale) -> CompiledScale:
+    return CompiledScale.compile(
+        ((band.min_percentage, band.letter, band.grade_points) for band in scale.bands),
+        scale_id=scale.id,
+        version=scale.version,
+    )
+
+
+def invalidate_scale(scale: GradingScale) -> None:
+    """Drop this process's compiled copy; others miss on the new version."""
+    scale_cache.pop((scale.id, scale.version))
+
+
+def recompute_grades_statement(scales: dict, *criteria) -> Update:
+    """One ``UPDATE grades ... FROM assessments, students`` re-deriving percentage and letter.
+
+    ``scales`` maps class ids (``None``: no class) to their compiled scale,
+    as ``scales_for_classes`` returns; classes sharing a scale share one
+    branch of the letter ``CASE``. Absent and ungraded grades are left
+    alone. ``criteria`` narrow the grades to recompute.
+    """
+    percentage = Grade.marks_obtained * 100 / Assessment.total_marks
+    return (
+        update(Grade)
+        .where(
+            Grade.assessment_id == Assessment.id,
+            Grade.student_id == Student.id,
+            Grade.marks_obtained.isnot(None),
+            Grade.is_absent.isnot(True),
+            *criteria,
+        )
+        .values(percentage=percentage, grade=_letter_sql(scales, percentage))
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def regrade_assessment(db: AsyncSession, assessment_id: int) -> int:
+    """Re-grade one assessment's grades in the caller's transaction.
+
+    Flush pending changes to the assessment first; the statement reads
+    ``total_marks`` from the database. Bumping the students' grade versions
+    is left to the caller. Returns the number of grades updated.
+    """
+    result = await db.execute(
+        select(Student.class_id)
+        .join(Grade, Grade.student_id == Student.id)
+        .where(Grade.assessment_id == assessment_id)
+        .distinct()
+    )
+    class_ids = list(result.scalars())
+    if not class_ids:
+        return 0
+    scales = await scales_for_classes(db, class_ids)
+    result = await db.execute(recompute_grades_statement(scales, Grade.assessment_id == assessment_id))
+    return result.rowcount
+
+
+async def recompute_class_grades(
+    class_ids: Sequence[Optional[int]],
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> int:
+    """Re-grade every grade of students in ``class_ids`` with their class's scale.
+
+    Runs one set-based ``UPDATE`` and one commit per class, so a school-wide
+    recompute never holds a long transaction. ``None`` stands for students
+    without a class. ``on_progress(completed, total)`` is called after every
+    class. Returns the number of grades updated.
+    """
+    updated = 0
+    async with AsyncSessionLocal() as db:
+        scales = await scales_for_classes(db, class_ids)
+        for completed, class_id in enumerate(class_ids, 1):
+            in_class = Student.class_id.is_(None) if class_id is None else Student.class_id == class_id
+            result = await db.execute(recompute_grades_statement({class_id: scales[class_id]}, in_class))
+            await bump_versions(db, "grades", select(Student.id).where(in_class))
+            await db.commit()
+            updated += result.rowcount
+            if on_progress:
+                on_progress(completed, len(class_ids))
+    await response_cache.invalidate(GRADES_TAG)
+    return updated
+
+
+async def recompute_assessment_grades(assessment_id: int) -> int:
+    """``regrade_assessment`` in its own session and transaction."""
+    async with AsyncSessionLocal() as db:
+        updated = await regrade_assessment(db, assessment_id)
+        await bump_versions(db, "grades", select(Grade.student_id).where(Grade.assessment_id == assessment_id))
+        await db.commit()
+    await response_cache.invalidate(GRADES_TAG)
+    return updated
+
+
+async def classes_for_scale(db: AsyncSession, class_id: Optional[int]) -> list[Optional[int]]:
+    """Classes whose grades follow the scale of ``class_id`` (``None``: the default)."""
+    if class_id is not None:
+        return [class_id]
+    result = await db.execute(
+        select(Class.id).where(
+            Class.id.notin_(select(GradingScale.class_id).where(GradingScale.class_id.isnot(None)))
+        )
+    )
+    return [None, *result.scalars()]
+
+
+def _letter_sql(scales: dict, percentage):
+    groups: dict[int, tuple[CompiledScale, list]] = {}
+    for class_id, scale in scales.items():
+        groups.setdefault(id(scale), (scale, []))[1].append(class_id)
+    (fallback, _), *others = sorted(groups.values(), key=lambda group: -len(group[1]))
+    if not others:
+        return fallback.sql(percentage)
+    return case(
+        *((_in_classes(class_ids), scale.sql(percentage)) for scale, class_ids in others),
+        else_=fallback.sql(percentage),
+    )
+
+
+def _in_classes(class_ids: list):
+    known = [class_id for class_id in class_ids if class_id is not None]
+    condition = Student.class_id.in_(known)
+    return or_(condition, Student.class_id.is_(None)) if None in class_ids else condition
@@ -0,0 +1,327 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Optional, Protocol
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..core.database import AsyncSessionLocal, ReadSessionLocal, engine
+from ..core.response_cache import MemoryBackend, response_cache
+from ..models.job import Job
+from ..schemas.gradebook import ReportCardRunResponse
+from .attendance import attendance_summaries
+from .grading_scales import recompute_class_grades
+from .report_cards import execute_run
+from .roster_import import import_roster, read_roster
+
+RUN_JOB_TASK = "jobs.run"  # Celery task name, see app/worker.py
+RECOVERY_LOCK_ID = 4_716_001  # advisory lock taken by ``recover_jobs``
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[Job, "JobProgress"], Awaitable[Any]]
+JOB_HANDLERS: dict[str, JobHandler] = {}
+
+
+def job_handler(kind: str):
+    """Register the coroutine that runs jobs of ``kind``; its return value is the result."""
+    def register(handler: JobHandler) -> JobHandler:
+        JOB_HANDLERS[kind] = handler
+        return handler
+    return register
+
+
+class JobProgress:
+    """Progress of a running job, written to its row without blocking the job.
+
+    Calling it only records the latest counters (so it also works as a
+    synchronous callback); one write at a time is in flight and a call that
+    arrives during a write is picked up by it, so a fast job costs a
+    handful of UPDATEs rather than one per step.
+    """
+
+    def __init__(self, job_id: int):
+        self.job_id = job_id
+        self.current = 0
+        self.total: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def __call__(self, current: int, total: Optional[int] = None) -> None:
+        self.current = current
+        if total is not None:
+            self.total = total
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._write())
+
+    async def wait(self) -> None:
+        if self._task is not None:
+            await self._task
+
+    async def _write(self) -> None:
+        while True:
+            current, total = self.current, self.total
+            async with AsyncSessionLocal() as db:
+                await db.execute(
+                    update(Job)
+                    .where(Job.id == self.job_id)
+                    .values(progress_current=current, progress_total=total)
+                )
+                await db.commit()
+            if (current, total) == (self.current, self.total):
+                return
+
+
+async def submit_job(
+    db: AsyncSession,
+    kind: str,
+    params: dict,
+    created_by: Optional[int] = None,
+    input_data: Optional[bytes] = None,
+) -> Job:
+    """Record a pending job and hand it to the configured runner."""
+    if kind not in JOB_HANDLERS:
+        raise ValueError(f"Unknown job kind {kind!r}")
+    job = Job(
+        kind=kind,
+        params=jsonable_encoder(params),
+        input_data=input_data,
+        created_by=created_by,
+        status="pending",
+    )
+    db.add(job)
+    await db.commit()
+    await db.refresh(job)
+    await job_runner.submit(job.id)
+    return job
+
+
+async def run_job(job_id: int) -> Optional[str]:
+    """Claim and run a pending job; returns its final status.
+
+    The claim is a conditional UPDATE, so a job delivered twice (a Celery
+    redelivery, say) runs once; ``None`` means it was not pending.
+    Exceptions fail the job rather than propagating.
+    """
+    async with AsyncSessionLocal() as db:
+        job = (await db.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.status == "pending")
+            .values(status="running", started_at=func.now())
+            .returning(Job)
+        )).scalar_one_or_none()
+        await db.commit()
+    if job is None:
+        return None
+
+    progress = JobProgress(job.id)
+    result, error = None, None
+    try:
+        result = jsonable_encoder(await JOB_HANDLERS[job.kind](job, progress))
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}"
+    await progress.wait()
+
+    status = "failed" if error else "completed"
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(Job)
+            .where(Job.id == job_id)
+            .values(status=status, result=result, error=error, input_data=None, finished_at=func.now())
+        )
+        await db.commit()
+    return status
+
+
+async def recover_jobs() -> Optional[dict]:
+    """Re-submit pending jobs and fail stale running ones; run at startup.
+
+    A restart loses the asyncio runner's tasks and the process pool, so
+    pending jobs would never start and running ones would never finish.
+    A running job is only failed after ``JOB_STALE_AFTER_MINUTES``, as it
+    may belong to a Celery worker or another API worker that is still alive.
+
+    Every API worker calls this as it boots: the one that gets the
+    transaction-level advisory lock recovers while the others skip, and
+    any error is logged instead of keeping the worker from starting.
+    Returns the counts, or ``None`` when skipped or failed.
+    """
+    try:
+        return await _recover_jobs()
+    except Exception:
+        logger.exception("Job recovery failed; pending jobs wait for the next start")
+        return None
+
+
+async def _recover_jobs() -> Optional[dict]:
+    stale_before = datetime.now(timezone.utc) - timedelta(minutes=settings.JOB_STALE_AFTER_MINUTES)
+    async with AsyncSessionLocal() as db:
+        if not await db.scalar(select(func.pg_try_advisory_xact_lock(RECOVERY_LOCK_ID))):
+            return None
+        failed = (await db.execute(
+            update(Job)
+            .where(Job.status == "running", Job.started_at < stale_before)
+            .values(
+                status="failed",
+                error="Interrupted: the worker running this job stopped",
+                input_data=None,
+                finished_at=func.now(),
+            )
+            .returning(Job.id)
+        )).scalars().all()
+        pending = (await db.execute(
+            select(Job.id).where(Job.status == "pending").order_by(Job.id)
+        )).scalars().all()
+        # Still holding the lock, so a worker booting alongside skips these
+        for job_id in pending:
+            await job_runner.submit(job_id)
+        await db.commit()
+    logger.info("Recovered jobs: %d re-submitted, %d failed as stale", len(pending), len(failed))
+    return {"resubmitted": len(pending), "failed": len(failed)}
+
+
+def run_job_in_new_loop(job_id: int) -> Optional[str]:
+    """``run_job`` on a fresh event loop, for worker processes.
+
+    Pooled connections belong to the loop that opened them, so the engine
+    is disposed before the loop closes.
+    """
+    async def main():
+        try:
+            return await run_job(job_id)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(main())
+
+
+# ========== Runners ==========
+
+class JobRunner(Protocol):
+    name: str
+
+    async def submit(self, job_id: int) -> None: ...
+
+
+class AsyncioJobRunner:
+    """Runs jobs as tasks on the API worker's event loop; single node and tests."""
+
+    name = "asyncio"
+
+    def __init__(self):
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, job_id: int) -> None:
+        task = asyncio.create_task(run_job(job_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+class ProcessPoolJobRunner:
+    """Runs jobs in a local process pool, off the API workers' event loops."""
+
+    name = "process"
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    async def submit(self, job_id: int) -> None:
+        if self._executor is None:
+            # Spawned rather than forked, like the PDF and hashing pools
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers or os.cpu_count(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        self._executor.submit(run_job_in_new_loop, job_id)
+
+
+class CeleryJobRunner:
+    """Queues jobs for Celery workers (``celery -A app.worker worker``)."""
+
+    name = "celery"
+
+    async def submit(self, job_id: int) -> None:
+        from ..worker import celery_app
+
+        # Publishing talks to the broker synchronously
+        await asyncio.to_thread(celery_app.send_task, RUN_JOB_TASK, args=[job_id])
+
+
+def create_job_runner(name: str = settings.JOB_BACKEND) -> JobRunner:
+    """The runner for ``JOB_BACKEND``: asyncio, process or celery.
+
+    Jobs outside the API process invalidate cached responses too (a
+    re-grade, say), which a per-process cache backend would never see.
+    """
+    if name != "asyncio" and isinstance(response_cache.backend, MemoryBackend):
+        raise ValueError(f"JOB_BACKEND={name} runs jobs outside the API workers; use CACHE_BACKEND=redis")
+    if name == "asyncio":
+        return AsyncioJobRunner()
+    if name == "process":
+        return ProcessPoolJobRunner(settings.JOB_WORKERS)
+    if name == "celery":
+        return CeleryJobRunner()
+    raise ValueError(f"Unknown JOB_BACKEND {name!r}")
+
+
+job_runner = create_job_runner()
+
+
+# ========== Handlers ==========
+
+@job_handler("attendance_summary")
+async def _attendance_summary(job: Job, progress: JobProgress) -> list[dict]:
+    params = job.params
+    progress(0, 1)
+    async with ReadSessionLocal() as db:
+        summaries = await attendance_summaries(
+            db,
+            date.fromisoformat(params["start_date"]),
+            date.fromisoformat(params["end_date"]),
+            class_id=params.get("class_id"),
+            section_id=params.get("section_id"),
+        )
+    progress(1, 1)
+    return summaries
+
+
+@job_handler("report_cards")
+async def _report_cards(job: Job, progress: JobProgress) -> dict:
+    run = await execute_run(
+        job.params["run_id"],
+        on_progress=lambda run, completed, total: progress(completed, total),
+    )
+    progress(run.completed_classes, run.total_classes)
+    if run.status == "failed":
+        raise RuntimeError(run.error)
+    return ReportCardRunResponse.model_validate(run).model_dump()
+
+
+@job_handler("roster_import")
+async def _roster_import(job: Job, progress: JobProgress) -> dict:
+    async with ReadSessionLocal() as db:
+        data = await db.scalar(select(Job.input_data).where(Job.id == job.id))
+    rows = read_roster(data, job.params["filename"])
+    progress(0, len(rows))
+    async with AsyncSessionLocal() as db:
+        summary = await import_roster(
+            db,
+            rows,
+            dry_run=job.params.get("dry_run", False),
+            skip_invalid=job.params.get("skip_invalid", False),
+        )
+    progress(len(rows), len(rows))
+    return summary
+
+
+@job_handler("recompute_grades")
+async def _recompute_grades(job: Job, progress: JobProgress) -> dict:
+    class_ids = job.params["class_ids"]
+    progress(0, len(class_ids))
+    return {"updated": await recompute_class_grades(class_ids, on_progress=progress)}
@@ -0,0 +1,172 @@
+import asyncio
+import multiprocessing
+import os
+import zipfile
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import Optional, Sequence
+
+from sqlalchemy import select
+
+from ..core.config import settings
+from ..core.database import ReadSessionLocal
+from ..models.academic import AcademicYear, Class, Section
+from ..models.gradebook import ReportCard
+from ..models.student import Student
+from ..models.user import User
+from .report_card_pdf import get_template, render_class
+
+EXPORT_FORMATS = ("zip", "pdf")
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def template_options() -> tuple:
+    """``get_template`` arguments for the configured letterhead."""
+    return (
+        settings.REPORT_CARD_SCHOOL_NAME,
+        settings.REPORT_CARD_LOGO_PATH,
+        settings.REPORT_CARD_FONT_PATH,
+        settings.REPORT_CARD_BOLD_FONT_PATH,
+    )
+
+
+def pdf_executor() -> ProcessPoolExecutor:
+    """The rendering pool, started on first use.
+
+    Workers are spawned rather than forked (forking a process that runs an
+    event loop and a connection pool is unsafe) and build the letterhead
+    template once at start-up, so every task only pays for drawing pages.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.REPORT_CARD_PDF_WORKERS or os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=get_template,
+            initargs=template_options(),
+        )
+    return _executor
+
+
+async def load_report_cards(
+    academic_year_id: int,
+    term: str,
+    class_ids: Optional[Sequence[int]] = None,
+) -> list[list[dict]]:
+    """Load report cards with one query, grouped per class section.
+
+    Each group is the unit of work of one pool task; cards are in rank order
+    and carry everything the renderer prints as plain values.
+    """
+    query = (
+        select(
+            ReportCard,
+            User.first_name,
+            User.last_name,
+            Student.admission_number,
+            Student.roll_number,
+            Student.section_id,
+            Class.name.label("class_name"),
+            Section.name.label("section_name"),
+            AcademicYear.year.label("academic_year"),
+        )
+        .join(Student, Student.id == ReportCard.student_id)
+        .join(User, User.id == Student.user_id)
+        .join(Class, Class.id == ReportCard.class_id)
+        .join(AcademicYear, AcademicYear.id == ReportCard.academic_year_id)
+        .outerjoin(Section, Section.id == Student.section_id)
+        .where(ReportCard.academic_year_id == academic_year_id, ReportCard.term == term)
+        .order_by(
+            ReportCard.class_id,
+            Student.section_id.nulls_first(),
+            ReportCard.rank.asc().nulls_last(),
+            ReportCard.student_id,
+        )
+    )
+    if class_ids:
+        query = query.where(ReportCard.class_id.in_(class_ids))
+
+    async with ReadSessionLocal() as db:
+        rows = (await db.execute(query)).all()
+
+    class_sizes = Counter(row.ReportCard.class_id for row in rows if row.ReportCard.rank is not None)
+    generated_on = date.today().isoformat()
+    groups: dict[tuple, list[dict]] = defaultdict(list)
+    for row in rows:
+        card = row.ReportCard
+        groups[(card.class_id, row.section_id)].append({
+            "student_name": f"{row.first_name} {row.last_name}",
+            "admission_number": row.admission_number,
+            "roll_number": row.roll_number,
+            "class_name": row.class_name,
+            "section_name": row.section_name,
+            "academic_year": row.academic_year,
+            "term": card.term,
+            "total_marks": card.total_marks,
+            "marks_obtained": card.marks_obtained,
+            "percentage": card.percentage,
+            "grade": card.grade,
+            "rank": card.rank,
+            "class_size": class_sizes[card.class_id],
+            "attendance_percentage": card.attendance_percentage,
+            "total_days": card.total_days,
+            "present_days": card.present_days,
+            "conduct_grade": card.conduct_grade,
+            "teacher_remarks": card.teacher_remarks,
+            "principal_remarks": card.principal_remarks,
+            "generated_on": generated_on,
+        })
+    return list(groups.values())
+
+
+async def export_report_cards(
+    academic_year_id: int,
+    term: str,
+    destination: Path,
+    class_ids: Optional[Sequence[int]] = None,
+    output_format: str = "zip",
+) -> Optional[str]:
+    """Render report cards on the process pool and write them to ``destination``.
+
+    ``zip`` writes one PDF per student, in a folder per class section.
+    ``pdf`` renders one merged PDF per class section; a single section is
+    written as that PDF, several are packed into a ZIP. Sections are written
+    as soon as their worker finishes, so only finished, not yet written
+    sections are held in memory. Returns the media type written, or ``None``
+    if there are no report cards.
+    """
+    if output_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown report card export format: {output_format}")
+
+    groups = await load_report_cards(academic_year_id, term, class_ids)
+    if not groups:
+        return None
+
+    loop = asyncio.get_running_loop()
+    executor = pdf_executor()
+    options = template_options()
+    merged = output_format == "pdf"
+    tasks = [
+        loop.run_in_executor(executor, render_class, options, cards, merged)
+        for cards in groups
+    ]
+
+    if merged and len(tasks) == 1:
+        [(_, data)] = await tasks[0]
+        await asyncio.to_thread(destination.write_bytes, data)
+        return "application/pdf"
+
+    # PDFs are already compressed; storing them keeps the archive step cheap
+    with zipfile.ZipFile(destination, "w", compression=zipfile.ZIP_STORED) as archive:
+        for finished in asyncio.as_completed(tasks):
+            files = await finished
+            await asyncio.to_thread(_write_entries, archive, files)
+    return "application/zip"
+
+
+def _write_entries(archive: zipfile.ZipFile, files: list[tuple[str, bytes]]) -> None:
+    for name, data in files:
+        archive.writestr(name, data)
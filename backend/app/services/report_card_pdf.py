@@ -0,0 +1,237 @@
+"""Report card PDF rendering.
+
+This module only depends on reportlab so it stays cheap to import in the
+worker processes of the export pool; loading report cards from the database
+and packaging the output lives in ``report_card_export``.
+"""
+import io
+import re
+from functools import lru_cache
+from typing import Optional, Sequence
+
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import mm
+from reportlab.lib.utils import ImageReader, simpleSplit
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfgen.canvas import Canvas
+
+PAGE_WIDTH, PAGE_HEIGHT = A4
+MARGIN = 18 * mm
+CONTENT_WIDTH = PAGE_WIDTH - 2 * MARGIN
+LOGO_HEIGHT = 20 * mm
+
+# Label and card key of each line in the results and attendance blocks
+RESULT_FIELDS = [
+    ("Total Marks", "total_marks"),
+    ("Marks Obtained", "marks_obtained"),
+    ("Percentage", "percentage"),
+    ("Grade", "grade"),
+    ("Class Rank", "rank"),
+]
+ATTENDANCE_FIELDS = [
+    ("Working Days", "total_days"),
+    ("Days Present", "present_days"),
+    ("Attendance", "attendance_percentage"),
+]
+REMARK_FIELDS = [
+    ("Conduct", "conduct_grade"),
+    ("Class Teacher's Remarks", "teacher_remarks"),
+    ("Principal's Remarks", "principal_remarks"),
+]
+
+
+class ReportCardTemplate:
+    """Fonts, logo and letterhead shared by every report card page.
+
+    Building a template parses the TrueType fonts and decodes the logo, so a
+    process builds each template once (see ``get_template``) and reuses it
+    for every PDF it renders. Inside a document the letterhead is stored as
+    a single form XObject that every page references.
+    """
+
+    LETTERHEAD = "letterhead"
+
+    def __init__(
+        self,
+        school_name: str,
+        logo_path: Optional[str] = None,
+        font_path: Optional[str] = None,
+        bold_font_path: Optional[str] = None,
+    ):
+        self.school_name = school_name
+        self.font = "Helvetica"
+        self.bold_font = "Helvetica-Bold"
+        if font_path:
+            pdfmetrics.registerFont(TTFont("ReportCard", font_path))
+            self.font = self.bold_font = "ReportCard"
+        if bold_font_path:
+            pdfmetrics.registerFont(TTFont("ReportCard-Bold", bold_font_path))
+            self.bold_font = "ReportCard-Bold"
+
+        self.logo = None
+        self.logo_width = 0.0
+        if logo_path:
+            self.logo = ImageReader(logo_path)
+            width, height = self.logo.getSize()
+            self.logo_width = LOGO_HEIGHT * width / height
+
+        self.title_y = PAGE_HEIGHT - MARGIN - LOGO_HEIGHT / 2
+        self.body_top = PAGE_HEIGHT - MARGIN - LOGO_HEIGHT - 10 * mm
+
+    def new_canvas(self, output, title: str) -> Canvas:
+        """Start a document whose letterhead form is ready for ``draw_page``."""
+        pdf = Canvas(output, pagesize=A4, pageCompression=1)
+        pdf.setTitle(title)
+        pdf.setAuthor(self.school_name)
+        pdf.beginForm(self.LETTERHEAD)
+        self._draw_letterhead(pdf)
+        pdf.endForm()
+        return pdf
+
+    def draw_page(self, pdf: Canvas, card: dict) -> None:
+        """Draw one student's report card and finish the page."""
+        pdf.doForm(self.LETTERHEAD)
+
+        pdf.setFont(self.bold_font, 13)
+        pdf.drawCentredString(PAGE_WIDTH / 2, self.body_top, f"Report Card - {card['term']}")
+        pdf.setFont(self.font, 10)
+        pdf.drawCentredString(PAGE_WIDTH / 2, self.body_top - 6 * mm, f"Academic Year {card['academic_year']}")
+
+        y = self.body_top - 18 * mm
+        class_name = card["class_name"]
+        if card.get("section_name"):
+            class_name = f"{class_name} - {card['section_name']}"
+        details = [
+            ("Student", card["student_name"]),
+            ("Admission No.", card["admission_number"]),
+            ("Class", class_name),
+            ("Roll No.", card.get("roll_number")),
+        ]
+        y = self._draw_pairs(pdf, "Student Details", details, y)
+
+        results = [(label, _format_value(key, card)) for label, key in RESULT_FIELDS]
+        y = self._draw_pairs(pdf, "Results", results, y - 6 * mm)
+
+        attendance = [(label, _format_value(key, card)) for label, key in ATTENDANCE_FIELDS]
+        y = self._draw_pairs(pdf, "Attendance", attendance, y - 6 * mm)
+
+        y = self._draw_heading(pdf, "Remarks", y - 6 * mm)
+        for label, key in REMARK_FIELDS:
+            pdf.setFont(self.bold_font, 10)
+            pdf.drawString(MARGIN, y, label)
+            pdf.setFont(self.font, 10)
+            lines = simpleSplit(card.get(key) or "-", self.font, 10, CONTENT_WIDTH - 55 * mm)
+            for line in lines:
+                pdf.drawString(MARGIN + 55 * mm, y, line)
+                y -= 5 * mm
+            y -= 2 * mm
+
+        pdf.setFont(self.font, 8)
+        pdf.drawRightString(PAGE_WIDTH - MARGIN, MARGIN / 2, f"Generated {card['generated_on']}")
+        pdf.showPage()
+
+    def _draw_letterhead(self, pdf: Canvas) -> None:
+        x = MARGIN
+        if self.logo:
+            pdf.drawImage(
+                self.logo, MARGIN, PAGE_HEIGHT - MARGIN - LOGO_HEIGHT,
+                width=self.logo_width, height=LOGO_HEIGHT, mask="auto",
+            )
+            x += self.logo_width + 6 * mm
+        pdf.setFont(self.bold_font, 18)
+        pdf.drawString(x, self.title_y - 3 * mm, self.school_name)
+        pdf.setLineWidth(0.8)
+        rule_y = PAGE_HEIGHT - MARGIN - LOGO_HEIGHT - 3 * mm
+        pdf.line(MARGIN, rule_y, PAGE_WIDTH - MARGIN, rule_y)
+
+        pdf.setFont(self.font, 9)
+        signature_y = MARGIN + 12 * mm
+        for x, label in ((MARGIN, "Class Teacher"), (PAGE_WIDTH - MARGIN - 45 * mm, "Principal")):
+            pdf.line(x, signature_y, x + 45 * mm, signature_y)
+            pdf.drawString(x, signature_y - 5 * mm, label)
+
+    def _draw_heading(self, pdf: Canvas, heading: str, y: float) -> float:
+        pdf.setFont(self.bold_font, 11)
+        pdf.drawString(MARGIN, y, heading)
+        pdf.setLineWidth(0.4)
+        pdf.line(MARGIN, y - 1.5 * mm, PAGE_WIDTH - MARGIN, y - 1.5 * mm)
+        return y - 7 * mm
+
+    def _draw_pairs(self, pdf: Canvas, heading: str, pairs: Sequence[tuple], y: float) -> float:
+        y = self._draw_heading(pdf, heading, y)
+        for label, value in pairs:
+            pdf.setFont(self.bold_font, 10)
+            pdf.drawString(MARGIN, y, label)
+            pdf.setFont(self.font, 10)
+            pdf.drawString(MARGIN + 55 * mm, y, "-" if value is None else str(value))
+            y -= 6 * mm
+        return y
+
+
+@lru_cache(maxsize=4)
+def get_template(
+    school_name: str,
+    logo_path: Optional[str] = None,
+    font_path: Optional[str] = None,
+    bold_font_path: Optional[str] = None,
+) -> ReportCardTemplate:
+    """The process-wide template for these options; also the pool initializer."""
+    return ReportCardTemplate(school_name, logo_path, font_path, bold_font_path)
+
+
+def render_class(options: tuple, cards: Sequence[dict], merged: bool = False) -> list[tuple[str, bytes]]:
+    """Render the report cards of one class.
+
+    Runs in an export pool worker: ``options`` are the ``get_template``
+    arguments and ``cards`` plain dicts, so everything crossing the process
+    boundary pickles cheaply. Returns ``(archive path, PDF bytes)`` pairs,
+    one per student, or a single multi-page PDF for the class if ``merged``.
+    """
+    template = get_template(*options)
+    if not cards:
+        return []
+    folder = class_folder(cards[0])
+
+    if merged:
+        output = io.BytesIO()
+        pdf = template.new_canvas(output, f"Report Cards - {folder} - {cards[0]['term']}")
+        for card in cards:
+            template.draw_page(pdf, card)
+        pdf.save()
+        return [(f"{folder}.pdf", output.getvalue())]
+
+    files = []
+    for card in cards:
+        output = io.BytesIO()
+        pdf = template.new_canvas(output, f"Report Card - {card['student_name']} - {card['term']}")
+        template.draw_page(pdf, card)
+        pdf.save()
+        files.append((f"{folder}/{_safe_name(card['admission_number'])}.pdf", output.getvalue()))
+    return files
+
+
+def class_folder(card: dict) -> str:
+    """File-system safe name for the class (and section) of a card."""
+    name = card["class_name"]
+    if card.get("section_name"):
+        name = f"{name}-{card['section_name']}"
+    return _safe_name(name)
+
+
+def _safe_name(value: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", str(value)).strip("_") or "unnamed"
+
+
+def _format_value(key: str, card: dict):
+    value = card.get(key)
+    if value is None:
+        return None
+    if key in ("percentage", "attendance_percentage"):
+        return f"{value:.2f}%"
+    if key in ("total_marks", "marks_obtained"):
+        return f"{value:g}"
+    if key == "rank" and card.get("class_size"):
+        return f"{value} of {card['class_size']}"
+    return value
+
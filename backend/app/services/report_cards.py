@@ -0,0 +1,243 @@
+import asyncio
+from datetime import date, datetime, timezone
+from typing import Callable, Optional, Sequence
+
+from sqlalchemy import Float, Insert, Numeric, case, cast, func, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..core.database import AsyncSessionLocal
+from ..models.academic import Class
+from ..models.gradebook import Assessment, Grade, ReportCard, ReportCardRun, ReportCardRunClass
+from ..models.student import Student
+from .attendance_rollups import student_counts
+from .grading_scales import DEFAULT_SCALE, CompiledScale, scale_for_class
+
+# Columns the engine computes; remarks, conduct and publishing are left alone
+COMPUTED_COLUMNS = [
+    "class_id",
+    "total_marks",
+    "marks_obtained",
+    "percentage",
+    "grade",
+    "rank",
+    "attendance_percentage",
+    "total_days",
+    "present_days",
+]
+
+ProgressCallback = Callable[[ReportCardRun, int, int], None]
+
+
+def report_card_upsert(
+    class_id: int,
+    academic_year_id: int,
+    term: str,
+    start_date: date,
+    end_date: date,
+    scale: CompiledScale = DEFAULT_SCALE,
+) -> Insert:
+    """One ``INSERT ... SELECT ... ON CONFLICT DO UPDATE`` for a whole class.
+
+    Marks come from the class's grades on assessments dated within the
+    term (absent counts as zero, ungraded rows are skipped). The percentage
+    is the weighted mean of the assessment percentages,
+    ``sum(w * marks / total) / sum(w)``, so ``weightage`` alone sets an
+    assessment's share; ``total_marks`` and ``marks_obtained`` are plain
+    sums. Attendance comes from the monthly rollups plus raw edge days, and
+    the class rank from a ``rank()`` window over the percentage. Letters
+    follow the class's grading ``scale``.
+    """
+    roster = select(Student.id).where(Student.class_id == class_id, Student.status == "active")
+
+    weight = func.coalesce(Assessment.weightage, 1.0)
+    marks_obtained = func.coalesce(Grade.marks_obtained, 0)
+    scores = (
+        select(
+            Grade.student_id,
+            func.sum(Assessment.total_marks).label("total_marks"),
+            func.sum(marks_obtained).label("marks_obtained"),
+            func.sum(weight * marks_obtained / Assessment.total_marks).label("weighted_score"),
+            func.sum(weight).label("total_weight"),
+        )
+        .join(Assessment, Assessment.id == Grade.assessment_id)
+        .where(
+            Grade.student_id.in_(roster),
+            Assessment.date >= start_date,
+            Assessment.date <= end_date,
+            Assessment.total_marks > 0,
+            or_(Grade.is_absent.is_(True), Grade.marks_obtained.isnot(None)),
+        )
+        .group_by(Grade.student_id)
+        .subquery("scores")
+    )
+    attendance = student_counts(start_date, end_date, roster)
+
+    percentage = case((scores.c.total_weight > 0, scores.c.weighted_score * 100 / scores.c.total_weight))
+    attendance_percentage = case((
+        attendance.c.total_days > 0,
+        cast(attendance.c.present_days, Float) * 100 / attendance.c.total_days,
+    ))
+    totals = (
+        select(
+            Student.id.label("student_id"),
+            scores.c.total_marks,
+            scores.c.marks_obtained,
+            _round(percentage).label("percentage"),
+            _round(attendance_percentage).label("attendance_percentage"),
+            func.coalesce(attendance.c.total_days, 0).label("total_days"),
+            func.coalesce(attendance.c.present_days, 0).label("present_days"),
+        )
+        .outerjoin(scores, scores.c.student_id == Student.id)
+        .outerjoin(attendance, attendance.c.student_id == Student.id)
+        .where(Student.class_id == class_id, Student.status == "active")
+        .subquery("totals")
+    )
+
+    rows = select(
+        totals.c.student_id,
+        literal(academic_year_id).label("academic_year_id"),
+        literal(term).label("term"),
+        literal(class_id).label("class_id"),
+        totals.c.total_marks,
+        totals.c.marks_obtained,
+        totals.c.percentage,
+        scale.sql(totals.c.percentage).label("grade"),
+        case((
+            totals.c.percentage.isnot(None),
+            func.rank().over(order_by=totals.c.percentage.desc().nulls_last()),
+        )).label("rank"),
+        totals.c.attendance_percentage,
+        totals.c.total_days,
+        totals.c.present_days,
+    )
+
+    stmt = pg_insert(ReportCard).from_select(
+        ["student_id", "academic_year_id", "term", *COMPUTED_COLUMNS], rows
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=["student_id", "academic_year_id", "term"],
+        set_={
+            **{column: stmt.excluded[column] for column in COMPUTED_COLUMNS},
+            "updated_at": func.now(),
+        },
+    )
+
+
+async def create_run(
+    db: AsyncSession,
+    academic_year_id: int,
+    term: str,
+    start_date: date,
+    end_date: date,
+    class_ids: Optional[Sequence[int]] = None,
+) -> ReportCardRun:
+    run = ReportCardRun(
+        academic_year_id=academic_year_id,
+        term=term,
+        start_date=start_date,
+        end_date=end_date,
+        class_ids=list(class_ids) if class_ids else None,
+        status="pending",
+    )
+    db.add(run)
+    await db.commit()
+    await db.refresh(run)
+    return run
+
+
+async def execute_run(
+    run_id: int,
+    workers: Optional[int] = None,
+    on_progress: Optional[ProgressCallback] = None,
+) -> ReportCardRun:
+    """Generate (or finish generating) the report cards of a run.
+
+    Classes already recorded in ``report_card_run_classes`` are skipped, so
+    calling this again after an interruption only computes what is missing.
+    Up to ``workers`` classes are computed concurrently, each in its own
+    session and transaction; a class's report cards and its progress record
+    commit together. ``on_progress(run, completed, total)`` is called after
+    every class.
+    """
+    async with AsyncSessionLocal() as db:
+        run = await db.get(ReportCardRun, run_id)
+        if run is None:
+            raise ValueError(f"Report card run {run_id} not found")
+
+        classes = select(Class.id).where(Class.academic_year_id == run.academic_year_id).order_by(Class.id)
+        if run.class_ids:
+            classes = classes.where(Class.id.in_(run.class_ids))
+        class_ids = list(await db.scalars(classes))
+        done = set(await db.scalars(
+            select(ReportCardRunClass.class_id).where(ReportCardRunClass.run_id == run_id)
+        ))
+
+        run.status = "running"
+        run.error = None
+        run.total_classes = len(class_ids)
+        run.completed_classes = len(done & set(class_ids))
+        run.started_at = run.started_at or datetime.now(timezone.utc)
+        run.finished_at = None
+        await db.commit()
+        db.expunge(run)
+
+    pending: asyncio.Queue[int] = asyncio.Queue()
+    for class_id in class_ids:
+        if class_id not in done:
+            pending.put_nowait(class_id)
+
+    failures: dict[int, str] = {}
+    progress = {"completed": run.completed_classes}
+
+    async def worker():
+        while not pending.empty():
+            class_id = pending.get_nowait()
+            try:
+                await _generate_class(run, class_id)
+            except Exception as exc:  # keep going; the class is retried on resume
+                failures[class_id] = f"{type(exc).__name__}: {exc}"
+                continue
+            progress["completed"] += 1
+            if on_progress:
+                on_progress(run, progress["completed"], len(class_ids))
+
+    worker_count = max(1, min(workers or settings.REPORT_CARD_WORKERS, pending.qsize()))
+    await asyncio.gather(*(worker() for _ in range(worker_count)))
+
+    async with AsyncSessionLocal() as db:
+        run = await db.get(ReportCardRun, run_id)
+        run.status = "failed" if failures else "completed"
+        run.error = "\n".join(f"class {class_id}: {message}" for class_id, message in sorted(failures.items())) or None
+        run.finished_at = datetime.now(timezone.utc)
+        await db.commit()
+        await db.refresh(run)
+        return run
+
+
+async def _generate_class(run: ReportCardRun, class_id: int) -> int:
+    async with AsyncSessionLocal() as db:
+        scale = await scale_for_class(db, class_id)
+        result = await db.execute(
+            report_card_upsert(class_id, run.academic_year_id, run.term, run.start_date, run.end_date, scale)
+        )
+        recorded = await db.execute(
+            pg_insert(ReportCardRunClass)
+            .values(run_id=run.id, class_id=class_id, student_count=result.rowcount)
+            .on_conflict_do_nothing()
+            .returning(ReportCardRunClass.id)
+        )
+        # Another runner may have finished this class concurrently
+        if recorded.first() is not None:
+            await db.execute(
+                update(ReportCardRun)
+                .where(ReportCardRun.id == run.id)
+                .values(completed_classes=ReportCardRun.completed_classes + 1)
+            )
+        await db.commit()
+        return result.rowcount
+
+
+def _round(value):
+    return cast(func.round(cast(value, Numeric), 2), Float)
@@ -0,0 +1,223 @@
+import asyncio
+import csv
+import io
+import json
+import multiprocessing
+import os
+import zipfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from typing import Iterable, Iterator, Optional, Sequence
+
+from openpyxl import load_workbook
+from openpyxl.utils.exceptions import InvalidFileException
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..core.security import get_password_hash
+from ..models.academic import Class, Section
+from ..models.student import Student
+from ..models.user import User, UserRole
+from ..schemas.student import StudentCreate
+from .gradebook import describe_error
+
+# Values per existence query and rows per multi-row INSERT
+IMPORT_CHUNK_SIZE = 1000
+
+USER_FIELDS = ["email", "username", "first_name", "last_name", "phone"]
+UNIQUE_FIELDS = [
+    ("admission_number", Student.admission_number, "Admission number"),
+    ("email", User.email, "Email"),
+    ("username", User.username, "Username"),
+]
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def hash_executor() -> ProcessPoolExecutor:
+    """Process pool for import password hashing, started on first use.
+
+    Kept apart from the login hashing threads so a large import cannot
+    starve logins; spawned rather than forked, like the PDF pool.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.ROSTER_IMPORT_HASH_WORKERS or os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+def read_roster(data: bytes, filename: str) -> list[tuple[int, dict]]:
+    """Parse a CSV or XLSX roster into ``(row number, raw values)`` pairs.
+
+    Row numbers are as a spreadsheet shows them (the header is row 1).
+    Header names are matched case-insensitively and blank cells are dropped
+    so that schema defaults apply. Raises ``ValueError`` for unreadable files.
+    """
+    try:
+        if filename.lower().endswith(".xlsx"):
+            workbook = load_workbook(io.BytesIO(data), read_only=True, data_only=True)
+            rows: Iterable[Sequence] = workbook.active.iter_rows(values_only=True)
+        else:
+            rows = csv.reader(io.StringIO(data.decode("utf-8-sig")))
+        return list(_roster_rows(rows))
+    except (UnicodeDecodeError, csv.Error, zipfile.BadZipFile, InvalidFileException, KeyError) as exc:
+        raise ValueError(f"Could not read roster file: {exc}") from exc
+
+
+async def import_roster(
+    db: AsyncSession,
+    rows: Sequence[tuple[int, dict]],
+    dry_run: bool = False,
+    skip_invalid: bool = False,
+) -> dict:
+    """Validate a whole roster, then create its users and students in bulk.
+
+    Every row is validated against ``StudentCreate``; duplicates within the
+    file and against the database (admission numbers, emails, usernames) and
+    unknown classes or sections are found with one set query per chunk of
+    values. Unless ``skip_invalid`` is set, any error stops the import before
+    anything is written. Passwords are hashed on a process pool and users
+    and students are inserted ``IMPORT_CHUNK_SIZE`` rows per statement in a
+    single transaction. Returns counters and a per-row error report.
+    """
+    errors: dict[int, list[str]] = {}
+    records: dict[int, StudentCreate] = {}
+    admission_numbers: dict[int, Optional[str]] = {}
+    for number, raw in rows:
+        admission_numbers[number] = raw.get("admission_number")
+        try:
+            if isinstance(raw.get("emergency_contacts"), str):
+                raw["emergency_contacts"] = json.loads(raw["emergency_contacts"])
+            records[number] = StudentCreate.model_validate(raw)
+        except (ValueError, ValidationError) as exc:
+            errors[number] = [describe_error(exc)]
+
+    for field, column, label in UNIQUE_FIELDS:
+        values = Counter(getattr(record, field) for record in records.values())
+        existing = await _existing_values(db, column, list(values))
+        for number, record in records.items():
+            value = getattr(record, field)
+            if values[value] > 1:
+                errors.setdefault(number, []).append(f"{label} '{value}' appears more than once in the file")
+            if value in existing:
+                errors.setdefault(number, []).append(f"{label} '{value}' already exists")
+
+    class_ids = {record.class_id for record in records.values() if record.class_id}
+    section_ids = {record.section_id for record in records.values() if record.section_id}
+    known_classes = set(await _existing_values(db, Class.id, list(class_ids)))
+    section_classes = dict((await db.execute(
+        select(Section.id, Section.class_id).where(Section.id.in_(section_ids))
+    )).all()) if section_ids else {}
+    for number, record in records.items():
+        if record.class_id and record.class_id not in known_classes:
+            errors.setdefault(number, []).append(f"Class {record.class_id} not found")
+        if record.section_id:
+            if record.section_id not in section_classes:
+                errors.setdefault(number, []).append(f"Section {record.section_id} not found")
+            elif record.class_id and section_classes[record.section_id] != record.class_id:
+                errors.setdefault(number, []).append(
+                    f"Section {record.section_id} does not belong to class {record.class_id}"
+                )
+
+    valid = {number: record for number, record in records.items() if number not in errors}
+    summary = {
+        "dry_run": dry_run,
+        "total_rows": len(rows),
+        "valid_rows": len(valid),
+        "created": 0,
+        "errors": [
+            {
+                "row": number,
+                "admission_number": admission_numbers[number],
+                "detail": "; ".join(messages),
+            }
+            for number, messages in sorted(errors.items())
+        ],
+    }
+    if dry_run or not valid or (errors and not skip_invalid):
+        return summary
+
+    loop = asyncio.get_running_loop()
+    hashes = await asyncio.gather(*(
+        loop.run_in_executor(hash_executor(), get_password_hash, record.password)
+        for record in valid.values()
+    ))
+
+    pending = list(valid.values())
+    try:
+        for start in range(0, len(pending), IMPORT_CHUNK_SIZE):
+            chunk = pending[start:start + IMPORT_CHUNK_SIZE]
+            user_rows = [
+                {
+                    **record.model_dump(include=set(USER_FIELDS)),
+                    "hashed_password": hashed,
+                    "role": UserRole.STUDENT,
+                    "is_active": True,
+                }
+                for record, hashed in zip(chunk, hashes[start:start + IMPORT_CHUNK_SIZE])
+            ]
+            result = await db.execute(insert(User).returning(User.id, User.username), user_rows)
+            user_ids = {row.username: row.id for row in result}
+            await db.execute(
+                insert(Student),
+                [
+                    {
+                        **record.model_dump(exclude={"password", *USER_FIELDS}),
+                        "user_id": user_ids[record.username],
+                    }
+                    for record in chunk
+                ],
+            )
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        summary["errors"].append({
+            "row": None,
+            "detail": "Another change created a conflicting student or user during the import; nothing was imported",
+        })
+        return summary
+
+    summary["created"] = len(valid)
+    return summary
+
+
+def _roster_rows(rows: Iterable[Sequence]) -> Iterator[tuple[int, dict]]:
+    header = None
+    for number, values in enumerate(rows, start=1):
+        if header is None:
+            header = [str(name or "").strip().lower() for name in values]
+            continue
+        raw = {
+            name: _cell_value(value)
+            for name, value in zip(header, values)
+            if name and value is not None and value != ""
+        }
+        if raw:
+            yield number, raw
+
+
+def _cell_value(value):
+    # Spreadsheet cells arrive typed; the schema expects text for codes like
+    # admission numbers and pincodes, and dates without a time
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+
+async def _existing_values(db: AsyncSession, column, values: list) -> set:
+    existing = set()
+    for start in range(0, len(values), IMPORT_CHUNK_SIZE):
+        result = await db.execute(select(column).where(column.in_(values[start:start + IMPORT_CHUNK_SIZE])))
+        existing.update(result.scalars())
+    return existing
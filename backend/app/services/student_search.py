@@ -0,0 +1,54 @@
+from sqlalchemy import Float, Select, select, func, and_, or_, union
+
+from ..models.student import Student
+from ..models.user import User
+
+
+def search_terms(search: str) -> list[str]:
+    """Split a search box value into the words that must all match."""
+    return search.split()
+
+
+def matching_student_ids(search: str) -> Select:
+    """Ids of students whose name, email or admission number contains ``search``.
+
+    Every word has to appear in the first name, last name or email, so
+    "john smi" finds John Smith. The admission number is matched against the
+    whole value. Each arm is a plain ``ILIKE '%...%'`` over one table, which
+    Postgres answers from the ``gin_trgm_ops`` indexes with a bitmap scan
+    instead of scanning ``users`` and ``students``.
+    """
+    pattern = f"%{_escape_like(search.strip())}%"
+    name_match = and_(*(
+        or_(
+            User.first_name.ilike(word, escape="\\"),
+            User.last_name.ilike(word, escape="\\"),
+            User.email.ilike(word, escape="\\"),
+        )
+        for word in (f"%{_escape_like(term)}%" for term in search_terms(search))
+    ))
+    by_user = select(Student.id).join(Student.user).where(name_match)
+    by_admission_number = select(Student.id).where(Student.admission_number.ilike(pattern, escape="\\"))
+    return union(by_user, by_admission_number)
+
+
+def search_rank(search: str):
+    """Relevance of a student row (``students`` joined to ``users``) for ``search``.
+
+    Only evaluated for the candidate rows, so the unindexed full-name
+    similarity is cheap.
+    """
+    term = search.strip()
+    full_name = func.concat_ws(" ", User.first_name, User.last_name)
+    return func.greatest(
+        func.similarity(full_name, term),
+        func.similarity(User.first_name, term),
+        func.similarity(User.last_name, term),
+        func.similarity(User.email, term),
+        func.similarity(Student.admission_number, term),
+        type_=Float,
+    ).label("rank")
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
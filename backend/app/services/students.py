@@ -0,0 +1,31 @@
+from sqlalchemy import Select, select
+
+from ..models.academic import Class, Section
+from ..models.student import Student
+from ..models.user import User
+
+
+def student_list_query() -> Select:
+    """One joined query selecting exactly the ``StudentListResponse`` fields.
+
+    Rows are plain tuples with attribute access, so they validate straight
+    into the response model without hydrating ``User``, ``Class`` and
+    ``Section`` objects or going through the identity map.
+    """
+    return (
+        select(
+            Student.id,
+            Student.user_id,
+            Student.admission_number,
+            Student.roll_number,
+            User.first_name,
+            User.last_name,
+            User.email,
+            Class.name.label("class_name"),
+            Section.name.label("section_name"),
+            Student.status,
+        )
+        .join(Student.user)
+        .outerjoin(Student.class_info)
+        .outerjoin(Student.section)
+    )
@@ -0,0 +1,27 @@
+"""Celery worker for background jobs, used when ``JOB_BACKEND=celery``.
+
+Run from the ``backend`` directory::
+
+    celery -A app.worker worker --loglevel=info
+
+Jobs are stored in the database; the broker only carries job ids, and
+results are read back through ``/jobs``, so no result backend is needed.
+"""
+from celery import Celery
+
+from .core.config import settings
+from .services.jobs import RUN_JOB_TASK, run_job_in_new_loop
+
+celery_app = Celery("school_management", broker=settings.CELERY_BROKER_URL)
+celery_app.conf.update(
+    task_ignore_result=True,
+    # Long jobs: take one at a time and acknowledge once done, so a job is
+    # not lost if its worker dies before claiming it
+    task_acks_late=True,
+    worker_prefetch_multiplier=1,
+)
+
+
+@celery_app.task(name=RUN_JOB_TASK)
+def run_job_task(job_id: int):
+    return run_job_in_new_loop(job_id)
@@ -0,0 +1,65 @@
+"""Shared helpers for the benchmark scripts.
+
+Benchmarks run against the database configured through ``DATABASE_URL``. Every
+benchmark seeds its own rows inside a transaction and rolls it back, so they
+are safe to run against a development database.
+"""
+from contextlib import contextmanager
+from datetime import date
+from uuid import uuid4
+
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.models.student import Student, Gender
+from app.models.user import User, UserRole
+
+
+@contextmanager
+def count_round_trips(engine: AsyncEngine):
+    """Count the statements sent to the database inside the block."""
+    counter = {"statements": 0}
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        counter["statements"] += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+
+
+async def seed_students(session: AsyncSession, count: int, **student_fields) -> list[int]:
+    """Insert ``count`` throwaway users and students and return the student ids."""
+    tag = uuid4().hex[:8]
+    user_result = await session.execute(
+        insert(User).returning(User.id),
+        [
+            {
+                "email": f"bench-{tag}-{i}@example.com",
+                "username": f"bench-{tag}-{i}",
+                "hashed_password": "!",
+                "first_name": f"Bench{i}",
+                "last_name": tag,
+                "role": UserRole.STUDENT,
+            }
+            for i in range(count)
+        ],
+    )
+    user_ids = list(user_result.scalars())
+    student_result = await session.execute(
+        insert(Student).returning(Student.id),
+        [
+            {
+                "user_id": user_id,
+                "admission_number": f"B{tag}{i:06d}",
+                "date_of_birth": date(2010, 1, 1),
+                "gender": Gender.OTHER,
+                "admission_date": date(2020, 6, 1),
+                **student_fields,
+            }
+            for i, user_id in enumerate(user_ids)
+        ],
+    )
+    return list(student_result.scalars())
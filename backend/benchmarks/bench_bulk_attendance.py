@@ -0,0 +1,66 @@
+"""Round trips per ``POST /attendance/bulk`` as the section grows.
+
+Run from the ``backend`` directory::
+
+    python -m benchmarks.bench_bulk_attendance
+
+The statement count grows with the number of chunks, not rows: one
+existence query, one multi-row INSERT per ``INSERT_CHUNK_SIZE`` records,
+one rollup upsert per ``ROLLUP_CHUNK_SIZE`` student-months and one
+version bump. Each size is checked against that.
+"""
+import asyncio
+import math
+import time
+from datetime import date
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import engine
+from app.models.attendance import AttendanceStatus
+from app.schemas.attendance import AttendanceBulkRecord
+from app.services.attendance import INSERT_CHUNK_SIZE, bulk_mark_attendance
+from app.services.attendance_rollups import ROLLUP_CHUNK_SIZE
+
+from ._common import count_round_trips, seed_students
+
+SECTION_SIZES = [10, 40, 160, 640, 2560]
+
+
+def expected_statements(size: int) -> int:
+    """Prefetch + inserts + rollups (one student-month per record) + versions."""
+    return 1 + math.ceil(size / INSERT_CHUNK_SIZE) + math.ceil(size / ROLLUP_CHUNK_SIZE) + 1
+
+
+async def run_once(size: int) -> tuple[int, float]:
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        try:
+            session = AsyncSession(bind=conn)
+            student_ids = await seed_students(session, size)
+            records = [
+                AttendanceBulkRecord(student_id=student_id, status=AttendanceStatus.PRESENT)
+                for student_id in student_ids
+            ]
+            with count_round_trips(engine) as counter:
+                started = time.perf_counter()
+                results = await bulk_mark_attendance(db=session, attendance_date=date.today(), records=records)
+                elapsed = time.perf_counter() - started
+            assert all(r["result"] == "created" for r in results)
+            return counter["statements"], elapsed
+        finally:
+            await trans.rollback()
+
+
+async def main():
+    print(f"{'section':>8} {'statements':>11} {'expected':>9} {'ms':>9}")
+    for size in SECTION_SIZES:
+        statements, elapsed = await run_once(size)
+        expected = expected_statements(size)
+        print(f"{size:>8} {statements:>11} {expected:>9} {elapsed * 1000:>9.2f}")
+        assert statements == expected, f"{size} records took {statements} statements, expected {expected}"
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,50 @@
+"""Time to build the gradebook matrix payload as classes and assessments grow.
+
+Run from the ``backend`` directory (no database needed)::
+
+    python -m benchmarks.bench_gradebook_matrix
+
+Rows are synthetic tuples shaped like ``gradebook_matrix_query`` results, so
+this isolates the pandas/NumPy step from the single query that feeds it.
+"""
+import random
+import time
+from datetime import date, timedelta
+
+from app.services.gradebook_matrix import build_gradebook_matrix
+
+SHAPES = [(40, 10), (60, 40), (200, 60), (1000, 100)]
+
+
+def synthetic_rows(students: int, assessments: int) -> list[tuple]:
+    rng = random.Random(students * 1000 + assessments)
+    rows = []
+    for student_id in range(1, students + 1):
+        for assessment_id in range(1, assessments + 1):
+            total = rng.choice([20.0, 50.0, 100.0])
+            absent = rng.random() < 0.03
+            graded = rng.random() < 0.95
+            rows.append((
+                student_id, f"First{student_id}", f"Last{student_id}", str(student_id),
+                assessment_id, f"Assessment {assessment_id}", date(2026, 6, 1) + timedelta(days=assessment_id),
+                total, rng.choice([1.0, 2.0]), None,
+                None if absent or not graded else round(rng.uniform(0, total), 1), absent,
+            ))
+    return rows
+
+
+def main():
+    print(f"{'students':>8} {'assessments':>11} {'rows':>8} {'ms':>9}")
+    for students, assessments in SHAPES:
+        rows = synthetic_rows(students, assessments)
+        build_gradebook_matrix(rows, 1, "Mathematics")  # warm up
+        runs = 5
+        started = time.perf_counter()
+        for _ in range(runs):
+            build_gradebook_matrix(rows, 1, "Mathematics")
+        elapsed = (time.perf_counter() - started) / runs
+        print(f"{students:>8} {assessments:>11} {len(rows):>8} {elapsed * 1000:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
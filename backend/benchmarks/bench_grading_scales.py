@@ -0,0 +1,47 @@
+"""Letter grades per second: per-value threshold loop vs. the compiled scale.
+
+Run from the ``backend`` directory (no database needed)::
+
+    python -m benchmarks.bench_grading_scales
+
+The loop is the scan the gradebook used per grade before scales were
+compiled; the compiled scale assigns a whole array with one binary search.
+"""
+import time
+
+import numpy as np
+
+from app.services.grading_scales import DEFAULT_SCALE, LETTER_GRADE_THRESHOLDS
+
+SIZES = [1_000, 100_000, 1_000_000]
+
+
+def loop_letters(percentages) -> list:
+    letters = []
+    for percentage in percentages:
+        for threshold, letter, _ in LETTER_GRADE_THRESHOLDS:
+            if percentage >= threshold:
+                letters.append(letter.value)
+                break
+    return letters
+
+
+def timed(function, *args) -> float:
+    started = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - started
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"{'grades':>9} {'loop ms':>9} {'compiled ms':>11} {'speed-up':>8}")
+    for size in SIZES:
+        percentages = rng.uniform(0, 100, size)
+        assert loop_letters(percentages[:1000]) == DEFAULT_SCALE.letters_for(percentages[:1000]).tolist()
+        loop = timed(loop_letters, percentages.tolist())
+        compiled = timed(DEFAULT_SCALE.letters_for, percentages)
+        print(f"{size:>9} {loop * 1000:>9.1f} {compiled * 1000:>11.2f} {loop / compiled:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Login storm load test: login p99 vs. non-login p99 on one server.
+
+Start the API (a single uvicorn worker makes the effect easiest to see), then
+run from the ``backend`` directory::
+
+    python -m benchmarks.bench_login_load --username teacher1 --password Secret123
+
+Concurrent logins are fired while a second set of clients polls ``/health``.
+With hashing on the event loop the ``/health`` p99 tracks the bcrypt cost;
+with hashing on the pool it stays in the low milliseconds.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def login_worker(client: httpx.AsyncClient, args, timings: list[float]):
+    for _ in range(args.requests):
+        started = time.perf_counter()
+        response = await client.post(
+            "/api/v1/auth/login",
+            data={"username": args.username, "password": args.password},
+        )
+        timings.append(time.perf_counter() - started)
+        response.raise_for_status()
+
+
+async def health_worker(client: httpx.AsyncClient, stop: asyncio.Event, timings: list[float]):
+    while not stop.is_set():
+        started = time.perf_counter()
+        await client.get("/health")
+        timings.append(time.perf_counter() - started)
+        await asyncio.sleep(0.01)
+
+
+def report(name: str, timings: list[float]):
+    ms = [t * 1000 for t in timings]
+    print(
+        f"{name:>10}: n={len(ms):<6} p50={statistics.median(ms):8.1f} ms  "
+        f"p99={percentile(ms, 99):8.1f} ms  max={max(ms):8.1f} ms"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--username", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--concurrency", type=int, default=50, help="concurrent login clients")
+    parser.add_argument("--requests", type=int, default=10, help="logins per client")
+    parser.add_argument("--pollers", type=int, default=10, help="concurrent /health clients")
+    args = parser.parse_args()
+
+    login_timings: list[float] = []
+    health_timings: list[float] = []
+    stop = asyncio.Event()
+
+    limits = httpx.Limits(max_connections=args.concurrency + args.pollers)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=120) as client:
+        pollers = [
+            asyncio.create_task(health_worker(client, stop, health_timings))
+            for _ in range(args.pollers)
+        ]
+        await asyncio.gather(*(login_worker(client, args, login_timings) for _ in range(args.concurrency)))
+        stop.set()
+        await asyncio.gather(*pollers)
+
+    report("login", login_timings)
+    report("non-login", health_timings)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
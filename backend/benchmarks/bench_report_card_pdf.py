@@ -0,0 +1,103 @@
+"""Report card PDFs per second, per core, as rendering processes are added.
+
+Run from the ``backend`` directory (no database needed)::
+
+    python -m benchmarks.bench_report_card_pdf [--classes 24 --class-size 40]
+
+Synthetic classes are rendered through ``render_class`` exactly as the export
+does: in-process first (cold template, then warm), then on spawned pools of
+increasing size. PDFs/s per core should stay roughly flat as workers grow
+until the machine runs out of physical cores.
+"""
+import argparse
+import os
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+from app.services.report_card_pdf import get_template, render_class
+
+OPTIONS = ("Benchmark Public School", None, None, None)
+
+
+def sample_class(class_index: int, size: int) -> list[dict]:
+    cards = []
+    for index in range(size):
+        percentage = 35 + (index * 7) % 65
+        cards.append({
+            "student_name": f"Student {class_index:03d}-{index:03d}",
+            "admission_number": f"ADM{class_index:03d}{index:04d}",
+            "roll_number": str(index + 1),
+            "class_name": f"Class {class_index % 12 + 1}",
+            "section_name": chr(ord("A") + class_index // 12),
+            "academic_year": "2026-2027",
+            "term": "Term 1",
+            "total_marks": 600.0,
+            "marks_obtained": percentage * 6.0,
+            "percentage": float(percentage),
+            "grade": "B",
+            "rank": index + 1,
+            "class_size": size,
+            "attendance_percentage": 92.5,
+            "total_days": 120,
+            "present_days": 111,
+            "conduct_grade": "Good",
+            "teacher_remarks": "Consistent effort across subjects; keep practising written answers "
+                               "and revise the term's chapters before the next assessment.",
+            "principal_remarks": None,
+            "generated_on": date.today().isoformat(),
+        })
+    return cards
+
+
+def render_all(classes: list[list[dict]], executor=None, merged: bool = False) -> int:
+    if executor is None:
+        results = [render_class(OPTIONS, cards, merged) for cards in classes]
+    else:
+        results = executor.map(render_class, [OPTIONS] * len(classes), classes, [merged] * len(classes))
+    return sum(len(files) for files in results)
+
+
+def report(name: str, workers: int, pdfs: int, elapsed: float):
+    rate = pdfs / elapsed
+    print(f"{name:>17} {workers:>7} {pdfs:>6} {elapsed:>8.2f} {rate:>9.1f} {rate / workers:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--classes", type=int, default=24)
+    parser.add_argument("--class-size", type=int, default=40)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    classes = [sample_class(i, args.class_size) for i in range(args.classes)]
+    students = args.classes * args.class_size
+    print(f"{'mode':>17} {'workers':>7} {'PDFs':>6} {'s':>8} {'PDFs/s':>9} {'PDFs/s/core':>10}")
+
+    started = time.perf_counter()
+    get_template(*OPTIONS)
+    render_class(OPTIONS, classes[0][:1])
+    print(f"template build + first PDF: {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    started = time.perf_counter()
+    pdfs = render_all(classes)
+    report("in-process", 1, pdfs, time.perf_counter() - started)
+
+    started = time.perf_counter()
+    render_all(classes, merged=True)
+    report("in-process merged", 1, students, time.perf_counter() - started)
+
+    workers = 1
+    context = multiprocessing.get_context("spawn")
+    while workers <= args.max_workers:
+        with ProcessPoolExecutor(workers, mp_context=context, initializer=get_template, initargs=OPTIONS) as pool:
+            render_all(classes[:workers], pool)  # start the workers before timing
+            started = time.perf_counter()
+            pdfs = render_all(classes, pool)
+            report("pool", workers, pdfs, time.perf_counter() - started)
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Serialization time per 1,000 rows: nested ORM graphs vs. flat projected rows.
+
+Run from the ``backend`` directory (no database needed)::
+
+    python -m benchmarks.bench_row_serialization
+
+"before" is what ``get_assessment_grades`` and ``get_attendance_by_date``
+did: ``jsonable_encoder`` walking each ORM row with its loaded ``student``
+and ``user``, then ``JSONResponse``. "after" is the flat row dicts of the
+column projections rendered by ``ORJSONResponse``.
+"""
+import time
+from datetime import date, datetime, timedelta, timezone
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models.attendance import Attendance, AttendanceStatus
+from app.models.gradebook import Grade
+from app.models.student import Gender, Student
+from app.models.user import User, UserRole
+
+ROWS = 1000
+RUNS = 20
+
+
+def orm_student(index: int) -> Student:
+    user = User(
+        id=index, email=f"student{index}@example.com", username=f"student{index}",
+        hashed_password="$2b$12$" + "x" * 53, first_name=f"First{index}", last_name=f"Last{index}",
+        phone="5550100", role=UserRole.STUDENT, is_active=True, created_at=datetime.now(timezone.utc),
+    )
+    student = Student(
+        id=index, user_id=index, admission_number=f"ADM{index:05d}", roll_number=str(index),
+        date_of_birth=date(2012, 1, 1), gender=Gender.FEMALE, city="Springfield", country="India",
+        class_id=3, section_id=7, admission_date=date(2020, 6, 1), status="active",
+    )
+    # As selectinload does: no backref events, so user.student_profile stays unloaded
+    set_committed_value(student, "user", user)
+    return student
+
+
+def grade_rows() -> tuple[list, list]:
+    graded_on = datetime.now(timezone.utc)
+    orm, flat = [], []
+    for index in range(1, ROWS + 1):
+        student = orm_student(index)
+        grade = Grade(
+            id=index, student_id=index, assessment_id=10, subject_id=5, teacher_id=2,
+            marks_obtained=41.5, percentage=83.0, grade="A", is_absent=False, remarks=None, feedback=None,
+            submitted_on=None, graded_on=graded_on,
+        )
+        set_committed_value(grade, "student", student)
+        orm.append(grade)
+        flat.append({
+            "id": index, "student_id": index, "admission_number": student.admission_number,
+            "roll_number": student.roll_number, "student_name": f"First{index} Last{index}",
+            "assessment_id": 10, "subject_id": 5, "teacher_id": 2, "marks_obtained": 41.5, "percentage": 83.0,
+            "grade": "A", "is_absent": False, "remarks": None, "feedback": None, "submitted_on": None,
+            "graded_on": graded_on,
+        })
+    return orm, flat
+
+
+def attendance_rows() -> tuple[list, list]:
+    marked_at = datetime.now(timezone.utc)
+    day = date(2026, 10, 16)
+    orm, flat = [], []
+    for index in range(1, ROWS + 1):
+        student = orm_student(index)
+        check_in = marked_at - timedelta(hours=3)
+        attendance = Attendance(
+            id=index, student_id=index, date=day, status=AttendanceStatus.PRESENT,
+            period_number=None, subject_id=None, remarks=None, check_in_time=check_in, check_out_time=None,
+            marked_by=2, marked_at=marked_at,
+        )
+        set_committed_value(attendance, "student", student)
+        orm.append(attendance)
+        flat.append({
+            "id": index, "student_id": index, "admission_number": student.admission_number,
+            "roll_number": student.roll_number, "student_name": f"First{index} Last{index}",
+            "class_id": 3, "section_id": 7, "date": day, "status": AttendanceStatus.PRESENT,
+            "period_number": None, "subject_id": None, "remarks": None, "check_in_time": check_in,
+            "check_out_time": None, "marked_by": 2, "marked_at": marked_at,
+        })
+    return orm, flat
+
+
+def per_run_ms(render) -> float:
+    render()  # warm up
+    started = time.perf_counter()
+    for _ in range(RUNS):
+        render()
+    return (time.perf_counter() - started) / RUNS * 1000
+
+
+def main():
+    print(f"{'endpoint':<24} {'before ms':>10} {'after ms':>9} {'speed-up':>8} {'bytes before':>12} {'after':>7}")
+    for name, build in [("assessment grades", grade_rows), ("attendance by date", attendance_rows)]:
+        orm, flat = build()
+        before = per_run_ms(lambda: JSONResponse(jsonable_encoder(orm)))
+        after = per_run_ms(lambda: ORJSONResponse(flat))
+        size_before = len(JSONResponse(jsonable_encoder(orm)).body)
+        size_after = len(ORJSONResponse(flat).body)
+        print(
+            f"{name:<24} {before:>10.2f} {after:>9.2f} {before / after:>7.0f}x"
+            f" {size_before:>12} {size_after:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Serialization time per 1,000 rows for every response schema.
+
+Run from the ``backend`` directory (no database needed)::
+
+    python -m benchmarks.bench_schema_serialization
+    python -m benchmarks.bench_schema_serialization --rows 100 --schema StudentListResponse
+
+Every ``response_model`` of the app's routes is benchmarked, with sample
+values generated from its field annotations. ``json`` is the old default
+path: response-model validation and dump, then ``JSONResponse``.
+``orjson`` is FastAPI's response-model pass rendered by the app's default
+``ORJSONResponse``. ``direct`` is ``rows_response``: the rows projected onto
+the schema and dumped without validation, as the hot list routes do. List
+schemas (the paginated listings) are timed as one list of ``--rows`` items,
+object schemas as ``--rows`` single responses.
+"""
+import argparse
+import enum
+import time
+import typing
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+from app.core.serialization import rows_response, schema_rows
+from app.main import app
+
+RUNS = 5
+NESTED_ITEMS = 3
+
+
+def sample_value(annotation, name: str = ""):
+    """A plausible value for ``annotation``; nested models become dicts."""
+    if name == "email":
+        return "user@example.com"
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is typing.Union:
+        return sample_value(next(arg for arg in args if arg is not type(None)), name)
+    if origin is typing.Literal:
+        return args[0]
+    if origin in (list, typing.List):
+        return [sample_value(args[0], name) for _ in range(NESTED_ITEMS)] if args else []
+    if origin in (dict, typing.Dict):
+        return {"key": "value", "count": 1}
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return sample_fields(annotation)
+        if issubclass(annotation, enum.Enum):
+            return next(iter(annotation))
+        if issubclass(annotation, bool):
+            return True
+        if issubclass(annotation, int):
+            return 7
+        if issubclass(annotation, float):
+            return 7.5
+        if issubclass(annotation, datetime):
+            return datetime(2026, 10, 16, 9, 30, tzinfo=timezone.utc)
+        if issubclass(annotation, date):
+            return date(2026, 10, 16)
+        if issubclass(annotation, str):
+            return (name or "value")[:8]
+    return None
+
+
+def sample_fields(schema: type[BaseModel]) -> dict:
+    return {name: sample_value(field.annotation, name) for name, field in schema.model_fields.items()}
+
+
+def response_schemas() -> dict[str, tuple[type[BaseModel], bool]]:
+    """``{name: (schema, is_list)}`` of every route's response model."""
+    schemas = {}
+    for route in app.routes:
+        model = getattr(route, "response_model", None)
+        if model is None:
+            continue
+        is_list = typing.get_origin(model) in (list, typing.List)
+        schema = typing.get_args(model)[0] if is_list else model
+        if isinstance(schema, type) and issubclass(schema, BaseModel):
+            schemas.setdefault(schema.__name__, (schema, is_list))
+    return dict(sorted(schemas.items()))
+
+
+def best_run_ms(render) -> float:
+    """Fastest of ``RUNS`` runs, so a collection pause doesn't skew a row."""
+    render()  # warm up
+    timings = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        render()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--schema", action="append", help="only these schemas (repeatable)")
+    args = parser.parse_args()
+
+    print(f"{'schema':<28} {'shape':>6} {'json ms':>8} {'orjson ms':>9} {'direct ms':>9} {'speed-up':>8}")
+    for name, (schema, is_list) in response_schemas().items():
+        if args.schema and name not in args.schema:
+            continue
+        # Attribute access, as on projected Row tuples and ORM objects
+        rows = [SimpleNamespace(**sample_fields(schema)) for _ in range(args.rows)]
+        adapter = TypeAdapter(list[schema] if is_list else schema)
+        batches = [rows] if is_list else [[row] for row in rows]
+
+        def fastapi_path(response_class):
+            for batch in batches:
+                value = adapter.validate_python(batch if is_list else batch[0], from_attributes=True)
+                response_class(adapter.dump_python(value, mode="json"))
+
+        json_ms = best_run_ms(lambda: fastapi_path(JSONResponse))
+        orjson_ms = best_run_ms(lambda: fastapi_path(ORJSONResponse))
+        if is_list:
+            direct_ms = best_run_ms(lambda: rows_response(rows, schema))
+        else:
+            direct_ms = best_run_ms(lambda: [ORJSONResponse(schema_rows(batch, schema)[0]) for batch in batches])
+        print(
+            f"{name:<28} {'list' if is_list else 'object':>6} {json_ms:>8.2f} {orjson_ms:>9.2f}"
+            f" {direct_ms:>9.2f} {json_ms / direct_ms:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
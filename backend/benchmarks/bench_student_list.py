@@ -0,0 +1,113 @@
+"""Student roster serialization: ORM eager loading vs. column projection.
+
+Run from the ``backend`` directory::
+
+    python -m benchmarks.bench_student_list --rows 5000
+
+``orm`` is the previous ``list_students`` implementation: ``select(Student)``
+with three ``selectinload``s, a hand-built dict per row and validation
+against ``StudentListResponse``. ``projection`` is the current path: one
+joined query over the listed columns validated straight into the model.
+Reports rows per second, statements and peak traced allocations.
+"""
+import argparse
+import asyncio
+import time
+import tracemalloc
+from typing import List
+
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core.database import engine
+from app.models.student import Student
+from app.schemas.student import StudentListResponse
+from app.services.students import student_list_query
+
+from ._common import count_round_trips, seed_students
+
+response_adapter = TypeAdapter(List[StudentListResponse])
+
+
+async def orm_path(session: AsyncSession, student_ids: list[int]) -> list:
+    result = await session.execute(
+        select(Student)
+        .options(
+            selectinload(Student.user),
+            selectinload(Student.class_info),
+            selectinload(Student.section),
+        )
+        .where(Student.id.in_(student_ids))
+        .order_by(Student.id)
+    )
+    rows = [
+        {
+            "id": student.id,
+            "user_id": student.user_id,
+            "admission_number": student.admission_number,
+            "roll_number": student.roll_number,
+            "first_name": student.user.first_name,
+            "last_name": student.user.last_name,
+            "email": student.user.email,
+            "class_name": student.class_info.name if student.class_info else None,
+            "section_name": student.section.name if student.section else None,
+            "status": student.status,
+        }
+        for student in result.scalars().all()
+    ]
+    return response_adapter.validate_python(rows)
+
+
+async def projection_path(session: AsyncSession, student_ids: list[int]) -> list:
+    result = await session.execute(
+        student_list_query().where(Student.id.in_(student_ids)).order_by(Student.id)
+    )
+    return response_adapter.validate_python(result.all())
+
+
+async def measure(name: str, path, session: AsyncSession, student_ids: list[int], repeat: int):
+    # Warm up compiled-statement caches before timing
+    await path(session, student_ids)
+    session.expunge_all()
+
+    elapsed = 0.0
+    peak = 0
+    for _ in range(repeat):
+        tracemalloc.start()
+        with count_round_trips(engine) as counter:
+            started = time.perf_counter()
+            await path(session, student_ids)
+            elapsed += time.perf_counter() - started
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        session.expunge_all()
+
+    rows_per_sec = len(student_ids) * repeat / elapsed
+    print(
+        f"{name:>10}: {rows_per_sec:>12,.0f} rows/s  "
+        f"statements={counter['statements']:<3} peak={peak / 1024:>10,.1f} KiB"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        try:
+            session = AsyncSession(bind=conn)
+            student_ids = await seed_students(session, args.rows)
+            await measure("orm", orm_path, session, student_ids, args.repeat)
+            await measure("projection", projection_path, session, student_ids, args.repeat)
+        finally:
+            await trans.rollback()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,287 @@
+"""Fail when an endpoint query needs a sequential scan.
+
+Run from the ``backend`` directory against a migrated database::
+
+    python -m scripts.check_query_plans --students 5000
+
+A school-sized dataset is seeded inside a transaction, the tables are
+analyzed and ``enable_seqscan`` is switched off for the transaction, so the
+planner only falls back to a ``Seq Scan`` when no index can serve the query.
+Each query below mirrors one built in ``app/api`` or ``app/services``; the
+script exits non-zero if any plan still contains a sequential scan.
+Everything is rolled back afterwards.
+"""
+import argparse
+import asyncio
+import json
+import sys
+from datetime import date, timedelta
+from uuid import uuid4
+
+from sqlalchemy import select, text, and_
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.database import engine
+from app.core.pagination import encode_cursor, keyset_paginate
+from app.models.attendance import Attendance
+from app.models.gradebook import Assessment, Grade
+from app.models.student import Student
+from app.models.teacher import Teacher
+from app.models.user import User
+from app.services.attendance import attendance_stats_query, attendance_summary_query
+from app.services.attendance_rollups import rebuild_rollups
+from app.services.student_search import matching_student_ids, search_rank
+from app.services.students import student_list_query
+
+START_DATE = date(2026, 6, 1)
+
+SEED_STATEMENTS = [
+    """
+    INSERT INTO academic_years (year, start_date, end_date, is_current)
+    VALUES (CAST(:tag AS text), '2026-06-01', '2027-03-31', false)
+    """,
+    """
+    INSERT INTO users (email, username, hashed_password, first_name, last_name, role, is_active)
+    VALUES ('plan-' || CAST(:tag AS text) || '@example.com', 'plan-' || CAST(:tag AS text), '!', 'Plan', 'Teacher', 'TEACHER', true)
+    """,
+    """
+    INSERT INTO teachers (user_id, employee_id, joining_date)
+    SELECT id, 'PLAN-' || CAST(:tag AS text), DATE '2020-01-01'
+    FROM users WHERE username = 'plan-' || CAST(:tag AS text)
+    """,
+    """
+    INSERT INTO classes (name, level, academic_year_id)
+    SELECT 'Class ' || g, g, ay.id
+    FROM academic_years ay, generate_series(1, :classes) g
+    WHERE ay.year = CAST(:tag AS text)
+    """,
+    """
+    INSERT INTO sections (name, class_id)
+    SELECT s, c.id
+    FROM classes c
+    JOIN academic_years ay ON ay.id = c.academic_year_id
+    CROSS JOIN unnest(ARRAY['A', 'B']) s
+    WHERE ay.year = CAST(:tag AS text)
+    """,
+    """
+    INSERT INTO subjects (name, code, class_id)
+    SELECT 'Subject ' || g, CAST(:tag AS text) || '-' || c.id || '-' || g, c.id
+    FROM classes c
+    JOIN academic_years ay ON ay.id = c.academic_year_id
+    CROSS JOIN generate_series(1, 5) g
+    WHERE ay.year = CAST(:tag AS text)
+    """,
+    """
+    INSERT INTO users (email, username, hashed_password, first_name, last_name, role, is_active)
+    SELECT 'plan-' || CAST(:tag AS text) || '-' || g || '@example.com', 'plan-' || CAST(:tag AS text) || '-' || g,
+           '!', 'First' || g, 'Last' || g, 'STUDENT', true
+    FROM generate_series(1, :students) g
+    """,
+    """
+    WITH new_users AS (
+        SELECT id, row_number() OVER (ORDER BY id) - 1 AS n
+        FROM users WHERE username LIKE 'plan-' || CAST(:tag AS text) || '-%'
+    ), new_sections AS (
+        SELECT s.id, s.class_id, row_number() OVER (ORDER BY s.id) - 1 AS n, count(*) OVER () AS total
+        FROM sections s
+        JOIN classes c ON c.id = s.class_id
+        JOIN academic_years ay ON ay.id = c.academic_year_id
+        WHERE ay.year = CAST(:tag AS text)
+    )
+    INSERT INTO students (user_id, admission_number, date_of_birth, gender, admission_date, class_id, section_id, status)
+    SELECT u.id, 'P' || CAST(:tag AS text) || u.id, DATE '2010-01-01', 'OTHER', DATE '2020-06-01', s.class_id, s.id, 'active'
+    FROM new_users u
+    JOIN new_sections s ON s.n = u.n % s.total
+    """,
+    """
+    INSERT INTO attendance (student_id, date, status)
+    SELECT st.id, CAST(:start AS date) + d, 'PRESENT'
+    FROM students st
+    JOIN classes c ON c.id = st.class_id
+    JOIN academic_years ay ON ay.id = c.academic_year_id
+    CROSS JOIN generate_series(0, :days - 1) d
+    WHERE ay.year = CAST(:tag AS text)
+    """,
+    """
+    INSERT INTO assessments (title, subject_id, teacher_id, assessment_type, total_marks, date, is_published)
+    SELECT 'Test ' || g, sub.id, t.id, 'TEST', 100, CAST(:start AS date) + g * 7, true
+    FROM subjects sub
+    JOIN classes c ON c.id = sub.class_id
+    JOIN academic_years ay ON ay.id = c.academic_year_id
+    JOIN teachers t ON t.employee_id = 'PLAN-' || CAST(:tag AS text)
+    CROSS JOIN generate_series(1, 4) g
+    WHERE ay.year = CAST(:tag AS text)
+    """,
+    """
+    INSERT INTO grades (student_id, assessment_id, subject_id, teacher_id, marks_obtained, percentage, is_absent)
+    SELECT st.id, a.id, a.subject_id, a.teacher_id, 50, 50, false
+    FROM assessments a
+    JOIN teachers t ON t.id = a.teacher_id
+    JOIN subjects sub ON sub.id = a.subject_id
+    JOIN students st ON st.class_id = sub.class_id
+    WHERE t.employee_id = 'PLAN-' || CAST(:tag AS text)
+    """,
+]
+
+ANALYZED_TABLES = [
+    "users", "teachers", "students", "classes", "sections", "subjects",
+    "attendance", "attendance_reports", "assessments", "grades",
+]
+
+
+async def seed(conn: AsyncConnection, students: int, days: int) -> dict:
+    """Seed the dataset and return ids to plug into the queries."""
+    tag = uuid4().hex[:8]
+    params = {"tag": tag, "classes": 10, "students": students, "days": days, "start": START_DATE}
+    for statement in SEED_STATEMENTS:
+        bound = {name: value for name, value in params.items() if f":{name}" in statement}
+        await conn.execute(text(statement), bound)
+    # The summary reads whole months from the rollups, so fill them for the
+    # seeded days as the attendance writes would have
+    await rebuild_rollups(conn, START_DATE, START_DATE + timedelta(days=days - 1))
+    for table in ANALYZED_TABLES:
+        await conn.exec_driver_sql(f"ANALYZE {table}")
+
+    row = (await conn.execute(
+        select(
+            Student.id.label("student_id"),
+            Student.user_id,
+            Student.class_id,
+            Student.section_id,
+            Teacher.id.label("teacher_id"),
+            Assessment.id.label("assessment_id"),
+            Assessment.subject_id,
+        )
+        .join(Grade, Grade.student_id == Student.id)
+        .join(Assessment, Assessment.id == Grade.assessment_id)
+        .join(Teacher, Teacher.id == Assessment.teacher_id)
+        .where(Student.admission_number.like(f"P{tag}%"))
+        .limit(1)
+    )).one()
+    return dict(row._mapping)
+
+
+def endpoint_queries(ids: dict) -> list:
+    """(name, statement) for every query shape the endpoints send."""
+    day = START_DATE + timedelta(days=3)
+    student_ids = [ids["student_id"]]
+    search = "first12"
+    rank = search_rank(search)
+
+    return [
+        ("auth: load principal", select(User, Teacher.id, Student.id)
+            .outerjoin(Teacher, Teacher.user_id == User.id)
+            .outerjoin(Student, Student.user_id == User.id)
+            .where(User.id == ids["user_id"])),
+        ("students: list by section", keyset_paginate(
+            student_list_query().where(
+                Student.class_id == ids["class_id"],
+                Student.section_id == ids["section_id"],
+                Student.status == "active",
+            ),
+            [Student.id], None, 20)),
+        ("students: list next page", keyset_paginate(
+            student_list_query().where(Student.status == "active"),
+            [Student.id], encode_cursor([ids["student_id"]]), 20)),
+        ("students: search", keyset_paginate(
+            student_list_query().where(Student.id.in_(matching_student_ids(search))).add_columns(rank),
+            [rank, Student.id], None, 20, descending=True)),
+        ("attendance: duplicate check", select(Attendance).where(
+            Attendance.student_id == ids["student_id"],
+            Attendance.date == day,
+            Attendance.period_number == None,  # noqa: E711
+        )),
+        ("attendance: bulk prefetch", select(Attendance.student_id, Attendance.id, Attendance.status).where(
+            Attendance.date == day,
+            Attendance.period_number == None,  # noqa: E711
+            Attendance.student_id.in_(student_ids),
+        )),
+        ("attendance: by date and class", select(Attendance)
+            .where(Attendance.date == day)
+            .join(Student).where(Student.class_id == ids["class_id"])),
+        ("attendance: student history", keyset_paginate(
+            select(Attendance).where(
+                Attendance.student_id == ids["student_id"],
+                Attendance.date >= START_DATE,
+            ),
+            [Attendance.date, Attendance.id], None, 100, descending=True)),
+        ("attendance: summary", attendance_summary_query(
+            START_DATE, START_DATE + timedelta(days=30), ids["class_id"], ids["section_id"])),
+        ("attendance: stats", attendance_stats_query(day, ids["class_id"])),
+        ("attendance: stats by section", attendance_stats_query(day, breakdown="section")),
+        ("grades: duplicate check", select(Grade).where(
+            Grade.student_id == ids["student_id"],
+            Grade.assessment_id == ids["assessment_id"],
+        )),
+        ("grades: bulk lookup", select(Student.id, Grade.id.label("grade_id"))
+            .outerjoin(Grade, and_(Grade.student_id == Student.id, Grade.assessment_id == ids["assessment_id"]))
+            .where(Student.id.in_(student_ids))),
+        ("grades: by student", keyset_paginate(
+            select(Grade).where(Grade.student_id == ids["student_id"]),
+            [Grade.id], None, 100, descending=True)),
+        ("grades: by student and subject", keyset_paginate(
+            select(Grade).where(Grade.student_id == ids["student_id"], Grade.subject_id == ids["subject_id"]),
+            [Grade.id], None, 100, descending=True)),
+        ("grades: by assessment", keyset_paginate(
+            select(Grade).where(Grade.assessment_id == ids["assessment_id"]),
+            [Grade.id], None, 500)),
+        ("assessments: list", keyset_paginate(
+            select(Assessment), [Assessment.date, Assessment.id], None, 100, descending=True)),
+        ("assessments: list by teacher", keyset_paginate(
+            select(Assessment).where(Assessment.teacher_id == ids["teacher_id"]),
+            [Assessment.date, Assessment.id], None, 100, descending=True)),
+        ("assessments: list by subject", keyset_paginate(
+            select(Assessment).where(Assessment.subject_id == ids["subject_id"]),
+            [Assessment.date, Assessment.id], None, 100, descending=True)),
+    ]
+
+
+def seq_scans(plan: dict) -> list[str]:
+    """Relations read by a sequential scan anywhere in the plan tree."""
+    found = []
+    if plan.get("Node Type") == "Seq Scan":
+        found.append(plan.get("Relation Name", "?"))
+    for child in plan.get("Plans", []):
+        found.extend(seq_scans(child))
+    return found
+
+
+async def explain(conn: AsyncConnection, statement) -> dict:
+    sql = str(statement.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}))
+    result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--students", type=int, default=5000)
+    parser.add_argument("--days", type=int, default=60, help="attendance days per student")
+    args = parser.parse_args()
+
+    failures = 0
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        try:
+            ids = await seed(conn, args.students, args.days)
+            await conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+            for name, statement in endpoint_queries(ids):
+                plan = await explain(conn, statement)
+                scanned = seq_scans(plan)
+                if scanned:
+                    failures += 1
+                    print(f"FAIL  {name}: Seq Scan on {', '.join(sorted(set(scanned)))}")
+                else:
+                    print(f"ok    {name}: {plan['Node Type']}")
+        finally:
+            await trans.rollback()
+    await engine.dispose()
+
+    print(f"\n{failures} quer{'y' if failures == 1 else 'ies'} with sequential scans")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,45 @@
+"""Render a term's report cards to PDF files on disk.
+
+Run from the ``backend`` directory::
+
+    python -m scripts.export_report_cards --academic-year-id 1 --term "Term 1" \\
+        --output report-cards.zip [--class-id 3 --class-id 4] [--format pdf]
+
+``zip`` writes one PDF per student; ``pdf`` writes one merged PDF per class
+section (a single section is written as a plain PDF). Rendering uses one
+process per CPU unless ``REPORT_CARD_PDF_WORKERS`` is set.
+"""
+import argparse
+import asyncio
+import time
+from pathlib import Path
+
+from app.core.database import engine
+from app.services.report_card_export import EXPORT_FORMATS, export_report_cards, pdf_executor
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--academic-year-id", type=int, required=True)
+    parser.add_argument("--term", required=True)
+    parser.add_argument("--output", type=Path, required=True, help="file to write")
+    parser.add_argument("--class-id", type=int, action="append", dest="class_ids", help="limit to these classes")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="zip")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    media_type = await export_report_cards(
+        args.academic_year_id, args.term, args.output, args.class_ids, args.format
+    )
+    await engine.dispose()
+    pdf_executor().shutdown()
+
+    if media_type is None:
+        print("No report cards found")
+        return
+    size = args.output.stat().st_size
+    print(f"Wrote {args.output} ({media_type}, {size / 1024:.0f} KiB) in {time.perf_counter() - started:.1f} s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,55 @@
+"""Generate report cards for a term, or resume an interrupted run.
+
+Run from the ``backend`` directory::
+
+    python -m scripts.generate_report_cards --academic-year-id 1 --term "Term 1" \\
+        --start 2026-06-01 --end 2026-09-30 [--class-id 3 --class-id 4] [--workers 8]
+    python -m scripts.generate_report_cards --resume 12
+
+Every class is computed with one set-based upsert in its own transaction, so
+an interrupted run can be resumed and only the missing classes are redone.
+"""
+import argparse
+import asyncio
+from datetime import date
+
+from app.core.database import AsyncSessionLocal, engine
+from app.services.report_cards import create_run, execute_run
+
+
+def print_progress(run, completed: int, total: int):
+    print(f"  [{completed}/{total}] run {run.id}", flush=True)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resume", type=int, metavar="RUN_ID", help="resume an existing run")
+    parser.add_argument("--academic-year-id", type=int)
+    parser.add_argument("--term")
+    parser.add_argument("--start", type=date.fromisoformat, help="first day of the term, YYYY-MM-DD")
+    parser.add_argument("--end", type=date.fromisoformat, help="last day of the term, YYYY-MM-DD")
+    parser.add_argument("--class-id", type=int, action="append", dest="class_ids", help="limit to these classes")
+    parser.add_argument("--workers", type=int, help="classes computed concurrently")
+    args = parser.parse_args()
+
+    if args.resume:
+        run_id = args.resume
+    else:
+        if not (args.academic_year_id and args.term and args.start and args.end):
+            parser.error("--academic-year-id, --term, --start and --end are required unless --resume is given")
+        async with AsyncSessionLocal() as db:
+            run = await create_run(db, args.academic_year_id, args.term, args.start, args.end, args.class_ids)
+        run_id = run.id
+
+    print(f"Report card run {run_id}")
+    run = await execute_run(run_id, workers=args.workers, on_progress=print_progress)
+    await engine.dispose()
+
+    print(f"Run {run.id} {run.status}: {run.completed_classes}/{run.total_classes} classes")
+    if run.error:
+        print(run.error)
+        print(f"Resume with: python -m scripts.generate_report_cards --resume {run.id}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
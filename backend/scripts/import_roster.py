@@ -0,0 +1,53 @@
+"""Import a roster of students from a CSV or XLSX file.
+
+Run from the ``backend`` directory::
+
+    python -m scripts.import_roster students.xlsx --dry-run
+    python -m scripts.import_roster students.xlsx [--skip-invalid]
+
+Columns are the ``StudentCreate`` fields (admission_number, email, username,
+password, first_name, last_name, date_of_birth, gender, admission_date, ...).
+The whole file is validated first; with errors nothing is imported unless
+``--skip-invalid`` is given.
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+from app.core.database import AsyncSessionLocal, engine
+from app.services.roster_import import hash_executor, import_roster, read_roster
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", type=Path, help=".csv or .xlsx roster")
+    parser.add_argument("--dry-run", action="store_true", help="validate only")
+    parser.add_argument("--skip-invalid", action="store_true", help="import the valid rows even if others fail")
+    args = parser.parse_args()
+
+    try:
+        rows = read_roster(args.path.read_bytes(), args.path.name)
+    except ValueError as exc:
+        sys.exit(str(exc))
+
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        summary = await import_roster(db, rows, dry_run=args.dry_run, skip_invalid=args.skip_invalid)
+    await engine.dispose()
+    hash_executor().shutdown()
+
+    for error in summary["errors"]:
+        row = f"row {error['row']}" if error["row"] else "file"
+        print(f"{row} ({error.get('admission_number') or '-'}): {error['detail']}")
+    print(
+        f"{summary['total_rows']} rows, {summary['valid_rows']} valid, {summary['created']} created"
+        f"{' (dry run)' if args.dry_run else ''} in {time.perf_counter() - started:.1f} s"
+    )
+    if summary["errors"] and not summary["created"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,59 @@
+"""Create upcoming and retire old monthly partitions of ``attendance``.
+
+Run from the ``backend`` directory, e.g. from a daily cron job::
+
+    python -m scripts.manage_attendance_partitions create --months-ahead 3
+    python -m scripts.manage_attendance_partitions detach --keep-months 36 --archive-schema archive
+    python -m scripts.manage_attendance_partitions list
+
+``create`` is idempotent. ``detach`` leaves the old months as standalone
+tables (moved into ``--archive-schema`` when given, dropped with ``--drop``),
+so they can be dumped and removed without touching the live table.
+"""
+import argparse
+import asyncio
+from datetime import date
+
+from app.core.database import engine
+from app.services.attendance_partitions import (
+    add_months,
+    create_partitions,
+    detach_partitions,
+    month_start,
+    monthly_partitions,
+)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    create = commands.add_parser("create", help="create partitions up to N months ahead")
+    create.add_argument("--months-ahead", type=int, default=3)
+
+    detach = commands.add_parser("detach", help="detach partitions older than the retention window")
+    detach.add_argument("--keep-months", type=int, required=True, help="months to keep, current month included")
+    target = detach.add_mutually_exclusive_group()
+    target.add_argument("--archive-schema", help="move detached partitions into this schema")
+    target.add_argument("--drop", action="store_true", help="drop detached partitions")
+
+    commands.add_parser("list", help="list attached monthly partitions")
+    args = parser.parse_args()
+
+    this_month = month_start(date.today())
+    async with engine.begin() as conn:
+        if args.command == "create":
+            names = await create_partitions(conn, through=add_months(this_month, args.months_ahead))
+            print(f"Created {len(names)} partition(s): {', '.join(names) or '-'}")
+        elif args.command == "detach":
+            before = add_months(this_month, 1 - args.keep_months)
+            names = await detach_partitions(conn, before, args.archive_schema, args.drop)
+            print(f"Detached {len(names)} partition(s) before {before}: {', '.join(names) or '-'}")
+        else:
+            for name, month in await monthly_partitions(conn):
+                print(f"{name}  {month} .. {add_months(month, 1)}")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
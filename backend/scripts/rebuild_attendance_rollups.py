@@ -0,0 +1,37 @@
+"""Rebuild the monthly ``attendance_reports`` rollups from raw attendance.
+
+Run from the ``backend`` directory::
+
+    python -m scripts.rebuild_attendance_rollups                      # every month
+    python -m scripts.rebuild_attendance_rollups --from 2025-06 --to 2026-03
+
+The rollups are maintained on every attendance write; use this to backfill
+history or repair months after manual data fixes. Attendance writes wait
+while the selected months are recounted.
+"""
+import argparse
+import asyncio
+from datetime import date, datetime
+
+from app.core.database import engine
+from app.services.attendance_rollups import rebuild_rollups
+
+
+def month(value: str) -> date:
+    return datetime.strptime(value, "%Y-%m").date()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--from", dest="first_month", type=month, help="first month, YYYY-MM")
+    parser.add_argument("--to", dest="last_month", type=month, help="last month, YYYY-MM")
+    args = parser.parse_args()
+
+    async with engine.begin() as conn:
+        rows = await rebuild_rollups(conn, args.first_month, args.last_month)
+    await engine.dispose()
+    print(f"Rebuilt {rows} rollup row(s)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
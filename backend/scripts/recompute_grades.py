@@ -0,0 +1,45 @@
+"""Re-grade existing grades with the current grading scales.
+
+Run from the ``backend`` directory::
+
+    python -m scripts.recompute_grades                  # every class
+    python -m scripts.recompute_grades --class-id 3 --class-id 4
+    python -m scripts.recompute_grades --assessment-id 42
+
+Percentages are re-derived from marks and total marks and letters from each
+student's class scale (else the school default, else the built-in scale),
+one set-based UPDATE and commit per class.
+"""
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import select
+
+from app.core.database import AsyncSessionLocal, engine
+from app.models.academic import Class
+from app.services.grading_scales import recompute_assessment_grades, recompute_class_grades
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--class-id", type=int, action="append", help="limit to these classes (repeatable)")
+    parser.add_argument("--assessment-id", type=int, help="only this assessment's grades")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    if args.assessment_id:
+        updated = await recompute_assessment_grades(args.assessment_id)
+    else:
+        class_ids = args.class_id
+        if not class_ids:
+            async with AsyncSessionLocal() as db:
+                class_ids = [None, *(await db.execute(select(Class.id).order_by(Class.id))).scalars()]
+        updated = await recompute_class_grades(class_ids)
+    await engine.dispose()
+
+    print(f"{updated} grades recomputed in {time.perf_counter() - started:.1f} s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
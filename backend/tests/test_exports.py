@@ -0,0 +1,45 @@
+import csv
+import io
+from datetime import date
+
+import pytest
+from openpyxl import load_workbook
+from sqlalchemy import column, select
+
+from app.services import exports
+
+MALICIOUS = ["=HYPERLINK(\"http://evil\",\"x\")", "@SUM(A1:A2)", "+1+1", "-2+3", "\tcmd", "\rcmd"]
+QUERY = select(column("admission_number"), column("marks_obtained"), column("remarks"))
+
+
+@pytest.fixture(autouse=True)
+def rows(monkeypatch) -> list:
+    rows = [("A-1", -3.5, remark) for remark in MALICIOUS] + [("A-2", 40, "Good work")]
+
+    async def iter_partitions(query):
+        yield rows
+
+    monkeypatch.setattr(exports, "iter_partitions", iter_partitions)
+    return rows
+
+
+async def test_csv_cells_cannot_run_formulas():
+    text = "".join([piece async for piece in exports.stream_csv(QUERY)])
+    header, *records = list(csv.reader(io.StringIO(text, newline="")))
+
+    assert header == ["admission_number", "marks_obtained", "remarks"]
+    assert [record[2] for record in records] == ["'" + remark for remark in MALICIOUS] + ["Good work"]
+    assert records[0][1] == "-3.5"  # numbers are left alone
+
+
+async def test_xlsx_cells_cannot_run_formulas(tmp_path):
+    path = tmp_path / "grades.xlsx"
+    await exports.write_xlsx(QUERY, path, f"grades-{date.today()}")
+
+    sheet = load_workbook(path).active
+    cells = [row[2] for row in sheet.iter_rows(min_row=2)]
+    assert cells[0].value == "'" + MALICIOUS[0]
+    assert all(cell.value.startswith("'") for cell in cells[:-1])
+    assert cells[-1].value == "Good work"
+    assert all(cell.data_type == "s" for cell in cells)
+    assert sheet.cell(row=2, column=2).value == -3.5
@@ -0,0 +1,74 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.core.response_cache import response_cache
+from app.services import gradebook
+
+
+async def stream(text: str):
+    for line in text.split("\n"):
+        yield line
+
+
+@pytest.fixture
+def ingested(monkeypatch) -> list:
+    """Records handed to ``ingest_grades``; student 2 already has a grade."""
+    records = []
+
+    async def ingest_grades(db, assessment, subject_id, teacher_id, chunk):
+        records.extend(chunk)
+        return [
+            {"student_id": r.student_id, "result": "skipped" if r.student_id == 2 else "created"}
+            for r in chunk
+        ]
+
+    monkeypatch.setattr(gradebook, "ingest_grades", ingest_grades)
+    monkeypatch.setattr(response_cache, "backend", None)
+    return records
+
+
+async def test_csv_quoted_fields_span_lines(ingested):
+    text = 'student_id,marks_obtained,remarks\n1,45,"first\n\nthen ""quoted"", done"\n\n2,30,\nx,1,\n'
+    summary = await gradebook.ingest_grade_stream(AsyncMock(), None, 5, 1, stream(text), csv_format=True)
+
+    assert [r.remarks for r in ingested] == ['first\n\nthen "quoted", done', None]
+    assert (summary["created"], summary["skipped"], summary["invalid"]) == (1, 1, 1)
+    assert [error["line"] for error in summary["errors"]] == [7]
+
+
+async def test_errors_are_capped_and_skip_skipped_rows(ingested, monkeypatch):
+    monkeypatch.setattr(gradebook, "STREAM_ERROR_LIMIT", 2)
+    text = '{"student_id": 1}\n{"student_id": 2}\nnot json\n[1]\n{"student_id": "x"}'
+    summary = await gradebook.ingest_grade_stream(AsyncMock(), None, 5, 1, stream(text))
+
+    assert (summary["created"], summary["skipped"], summary["invalid"]) == (1, 1, 3)
+    assert [error["line"] for error in summary["errors"]] == [3, 4]
+    assert summary["errors_truncated"] is True
+
+
+async def chunked(body: bytes, size: int):
+    for start in range(0, len(body), size):
+        yield body[start:start + size]
+
+
+async def test_iter_lines_drops_oversized_lines(monkeypatch):
+    monkeypatch.setattr(gradebook, "MAX_LINE_BYTES", 16)
+    body = b"short\r\n" + b"x" * 100 + b"\n" + b"y" * 20 + b"\nlast"
+
+    lines = [line async for line in gradebook.iter_lines(chunked(body, 7))]
+
+    assert lines == ["short", None, None, "last"]
+
+
+async def test_oversized_line_is_an_invalid_row(ingested, monkeypatch):
+    monkeypatch.setattr(gradebook, "MAX_LINE_BYTES", 32)
+    body = b'{"student_id": 1}\n{"student_id": 3, "remarks": "' + b"z" * 200 + b'"}\n{"student_id": 4}'
+    lines = gradebook.iter_lines(chunked(body, 10))
+
+    summary = await gradebook.ingest_grade_stream(AsyncMock(), None, 5, 1, lines)
+
+    assert [r.student_id for r in ingested] == [1, 4]
+    assert summary["invalid"] == 1
+    assert summary["errors"][0]["line"] == 2
+    assert "longer than" in summary["errors"][0]["detail"]
@@ -0,0 +1,40 @@
+from datetime import date
+
+import pytest
+
+from app.services.gradebook_matrix import build_gradebook_matrix
+
+QUIZ = (10, "Quiz 1", date(2024, 7, 5), 20.0, 1.0, None)
+MID_TERM = (11, "Mid Term", date(2024, 8, 20), 100.0, 2.0, None)
+
+
+def grade_row(student_id: int, assessment: tuple, marks, is_absent: bool = False) -> tuple:
+    return (student_id, f"Student{student_id}", "Test", str(student_id), *assessment, marks, is_absent)
+
+
+def test_percentage_is_weighted_mean_of_assessment_percentages():
+    rows = [
+        grade_row(1, QUIZ, 18.0),
+        grade_row(1, MID_TERM, 75.0),
+        grade_row(2, QUIZ, None, is_absent=True),
+        grade_row(2, MID_TERM, 35.0),
+    ]
+    students = build_gradebook_matrix(rows, 5, "Mathematics")["students"]
+
+    # (1 * 18/20 + 2 * 75/100) / 3: total_marks does not add to the weight
+    assert students["percentage"] == [80.0, pytest.approx(23.33)]
+    assert students["marks_obtained"] == [93.0, 35.0]
+    assert students["total_marks"] == [120.0, 120.0]
+
+
+def test_ungraded_assessments_and_students_are_left_out():
+    rows = [
+        grade_row(1, QUIZ, 10.0),
+        grade_row(2, QUIZ, None),
+        grade_row(2, MID_TERM, 50.0),
+        (3, "New", "Student", "3", *([None] * 8)),
+    ]
+    students = build_gradebook_matrix(rows, 5, "Mathematics")["students"]
+
+    assert students["percentage"] == [50.0, 50.0, None]
+    assert students["rank"] == [1, 1, None]
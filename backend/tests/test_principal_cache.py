@@ -0,0 +1,51 @@
+import time
+from types import SimpleNamespace
+
+from app.core.security import PrincipalCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_cache(monkeypatch, ttl: float = 60) -> tuple[PrincipalCache, Clock]:
+    clock = Clock()
+    monkeypatch.setattr(time, "monotonic", clock)  # used by TTLCache too
+    return PrincipalCache(maxsize=10, ttl=ttl), clock
+
+
+def test_invalidate_makes_cached_principal_unreachable(monkeypatch):
+    cache, _ = make_cache(monkeypatch)
+    key = cache.key(7, "token")
+    cache.set(key, SimpleNamespace(id=7))
+    assert cache.get(cache.key(7, "token")) is not None
+
+    cache.invalidate_user(7)
+    assert cache.get(cache.key(7, "token")) is None
+
+
+def test_principal_loaded_across_invalidation_is_not_stored(monkeypatch):
+    cache, _ = make_cache(monkeypatch)
+    key = cache.key(7, "token")
+    cache.invalidate_user(7)  # while the principal was being loaded
+    cache.set(key, SimpleNamespace(id=7))
+    assert cache.get(key) is None and cache.get(cache.key(7, "token")) is None
+
+
+def test_generations_are_forgotten_after_one_ttl(monkeypatch):
+    cache, clock = make_cache(monkeypatch, ttl=60)
+    old_key = cache.key(7, "token")
+    cache.set(old_key, SimpleNamespace(id=7))
+    for user_id in range(100):
+        cache.invalidate_user(user_id)
+    assert len(cache._generations) == 100
+
+    clock.now += 61
+    cache.invalidate_user(500)
+    assert list(cache._generations) == [500]
+    # Entries from before the forgotten invalidation have expired as well
+    assert cache.get(cache.key(7, "token")) is None
@@ -0,0 +1,234 @@
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import Request, Response
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.api import attendance as attendance_api
+from app.api import gradebook as gradebook_api
+from app.core.response_cache import (
+    GRADES_TAG,
+    MemoryBackend,
+    ResponseCache,
+    attendance_date_tag,
+    create_backend,
+    response_cache,
+    student_attendance_tag,
+    student_grades_tag,
+)
+from app.models.attendance import AttendanceStatus
+from app.schemas.attendance import AttendanceBulkCreate
+
+BACKENDS = ["memory", "fakeredis"]
+
+
+def make_request(path: str, query: str = "") -> Request:
+    return Request({"type": "http", "method": "GET", "path": path, "query_string": query.encode(), "headers": []})
+
+
+@pytest.fixture(params=BACKENDS)
+def cache(request) -> ResponseCache:
+    return ResponseCache(create_backend(request.param), ttl=60)
+
+
+class FakeSession:
+    """Just enough of ``AsyncSession`` for a handler that loads one row and writes it."""
+
+    def __init__(self, row):
+        self.row = row
+        self.deleted = []
+        self.commits = 0
+
+    async def execute(self, statement):
+        return SimpleNamespace(scalar_one_or_none=lambda: self.row)
+
+    async def delete(self, row):
+        self.deleted.append(row)
+
+    async def commit(self):
+        self.commits += 1
+
+
+@pytest.fixture
+def shared_cache(monkeypatch) -> ResponseCache:
+    """The app's ``response_cache`` on a fresh fakeredis backend, with version bumps stubbed."""
+    monkeypatch.setattr(response_cache, "backend", create_backend("fakeredis"))
+    for module in (gradebook_api, attendance_api):
+        monkeypatch.setattr(module, "bump_versions", AsyncMock())
+    monkeypatch.setattr(attendance_api, "apply_attendance_changes", AsyncMock())
+    return response_cache
+
+
+async def cache_entry(cache: ResponseCache, path: str, tags: list[str]) -> str:
+    """Store a response under ``tags`` and return its key."""
+    key, cached = await cache.lookup(make_request(path), "admin", tags)
+    assert cached is None
+    await cache.store(key, [{"id": 1}])
+    return key
+
+
+async def is_cached(cache: ResponseCache, path: str, tags: list[str]) -> bool:
+    _, cached = await cache.lookup(make_request(path), "admin", tags)
+    return cached is not None
+
+
+# ========== Store and Lookup ==========
+
+async def test_store_then_lookup_returns_body_and_headers(cache):
+    request = make_request("/api/v1/gradebook/grades/student/7", "limit=50")
+    key, cached = await cache.lookup(request, "admin", [student_grades_tag(7)])
+    assert key is not None and cached is None
+
+    response = Response()
+    response.headers["X-Next-Cursor"] = "abc"
+    await cache.store(key, [{"id": 1, "grade": "A"}], response)
+
+    _, cached = await cache.lookup(request, "admin", [student_grades_tag(7)])
+    assert cached is not None
+    assert cached.body == b'[{"id":1,"grade":"A"}]'
+    assert cached.headers["X-Next-Cursor"] == "abc"
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+async def test_key_covers_query_and_scope(cache):
+    key, _ = await cache.lookup(make_request("/students/7", "limit=50"), "admin", ["t"])
+    await cache.store(key, [])
+
+    _, other_query = await cache.lookup(make_request("/students/7", "limit=10"), "admin", ["t"])
+    _, other_scope = await cache.lookup(make_request("/students/7", "limit=50"), "teacher", ["t"])
+    assert other_query is None and other_scope is None
+
+
+async def test_no_backend_renders_without_caching():
+    cache = ResponseCache(None, ttl=60)
+    key, cached = await cache.lookup(make_request("/students/7"), "admin", ["t"])
+    assert key is None and cached is None
+
+    rendered = await cache.store(key, {"ok": True})
+    assert rendered.body == b'{"ok":true}'
+    assert cache.stats()["backend"] == "none"
+
+
+async def test_redis_errors_are_misses(monkeypatch):
+    cache = ResponseCache(create_backend("fakeredis"), ttl=60)
+    monkeypatch.setattr(cache.backend, "versions", AsyncMock(side_effect=RedisConnectionError))
+    monkeypatch.setattr(cache.backend, "bump", AsyncMock(side_effect=RedisConnectionError))
+
+    assert await cache.lookup(make_request("/students/7"), "admin", ["t"]) == (None, None)
+    await cache.invalidate("t")
+    assert cache.stats()["errors"] == 2
+
+
+# ========== Invalidation ==========
+
+async def test_invalidate_drops_only_tagged_entries(cache):
+    await cache_entry(cache, "/grades/student/7", [GRADES_TAG, student_grades_tag(7)])
+    await cache_entry(cache, "/grades/student/8", [GRADES_TAG, student_grades_tag(8)])
+
+    await cache.invalidate(student_grades_tag(7))
+    assert not await is_cached(cache, "/grades/student/7", [GRADES_TAG, student_grades_tag(7)])
+    assert await is_cached(cache, "/grades/student/8", [GRADES_TAG, student_grades_tag(8)])
+
+    await cache.invalidate(GRADES_TAG)
+    assert not await is_cached(cache, "/grades/student/8", [GRADES_TAG, student_grades_tag(8)])
+
+
+async def test_redis_invalidation_reaches_other_workers():
+    first = ResponseCache(create_backend("fakeredis"), ttl=60)
+    second = ResponseCache(first.backend, ttl=60)  # another worker on the same Redis
+    await cache_entry(first, "/grades/student/7", [student_grades_tag(7)])
+    assert await is_cached(second, "/grades/student/7", [student_grades_tag(7)])
+
+    await second.invalidate(student_grades_tag(7))
+    assert not await is_cached(first, "/grades/student/7", [student_grades_tag(7)])
+
+
+def test_memory_backend_refused_with_several_workers(monkeypatch):
+    monkeypatch.setenv("WEB_CONCURRENCY", "4")
+    with pytest.raises(ValueError):
+        create_backend("memory")
+
+    monkeypatch.setenv("WEB_CONCURRENCY", "1")
+    assert isinstance(create_backend("memory"), MemoryBackend)
+
+
+# ========== Write Handlers ==========
+
+async def test_delete_grade_invalidates_student_grades(shared_cache):
+    tags = [GRADES_TAG, student_grades_tag(7)]
+    await cache_entry(shared_cache, "/grades/student/7", tags)
+    db = FakeSession(SimpleNamespace(id=3, student_id=7))
+
+    await gradebook_api.delete_grade(3, current_user=None, db=db)
+
+    assert db.deleted and db.commits == 1
+    gradebook_api.bump_versions.assert_awaited_once_with(db, "grades", [7])
+    assert not await is_cached(shared_cache, "/grades/student/7", tags)
+
+
+async def test_delete_attendance_invalidates_student_and_date(shared_cache):
+    day = date(2026, 10, 16)
+    await cache_entry(shared_cache, "/attendance/student/7", [student_attendance_tag(7)])
+    await cache_entry(shared_cache, "/attendance/date/2026-10-16", [attendance_date_tag(day)])
+    await cache_entry(shared_cache, "/attendance/student/8", [student_attendance_tag(8)])
+    db = FakeSession(SimpleNamespace(id=3, student_id=7, date=day, status=AttendanceStatus.PRESENT))
+
+    await attendance_api.delete_attendance(3, current_user=None, db=db)
+
+    assert not await is_cached(shared_cache, "/attendance/student/7", [student_attendance_tag(7)])
+    assert not await is_cached(shared_cache, "/attendance/date/2026-10-16", [attendance_date_tag(day)])
+    assert await is_cached(shared_cache, "/attendance/student/8", [student_attendance_tag(8)])
+
+
+async def test_bulk_attendance_invalidates_created_students(shared_cache, monkeypatch):
+    day = date(2026, 10, 16)
+    monkeypatch.setattr(attendance_api, "bulk_mark_attendance", AsyncMock(return_value=[
+        {"student_id": 7, "result": "created", "attendance_id": 1},
+        {"student_id": 8, "result": "skipped", "attendance_id": None},
+    ]))
+    await cache_entry(shared_cache, "/attendance/student/7", [student_attendance_tag(7)])
+    await cache_entry(shared_cache, "/attendance/student/8", [student_attendance_tag(8)])
+    await cache_entry(shared_cache, "/attendance/date/2026-10-16", [attendance_date_tag(day)])
+    payload = AttendanceBulkCreate(date=day, attendance_records=[])
+
+    summary = await attendance_api.mark_bulk_attendance(
+        payload,
+        current_user=SimpleNamespace(role="admin"),
+        principal=SimpleNamespace(teacher_id=None),
+        db=FakeSession(None),
+    )
+
+    assert (summary["created"], summary["skipped"]) == (1, 1)
+    assert not await is_cached(shared_cache, "/attendance/student/7", [student_attendance_tag(7)])
+    assert not await is_cached(shared_cache, "/attendance/date/2026-10-16", [attendance_date_tag(day)])
+    assert await is_cached(shared_cache, "/attendance/student/8", [student_attendance_tag(8)])
+
+
+# ========== Read Handlers ==========
+
+async def test_student_grades_are_flat_cached_rows(shared_cache, monkeypatch):
+    monkeypatch.setattr(gradebook_api, "student_etag", AsyncMock(return_value='"v1"'))
+    graded = datetime(2026, 10, 16, 9, tzinfo=timezone.utc)
+    row = SimpleNamespace(
+        id=3, student_id=7, assessment_id=10, assessment_title="Unit Test 1", total_marks=50.0,
+        subject_id=5, subject_name="Mathematics", teacher_id=2, marks_obtained=45.0, percentage=90.0,
+        grade="A", is_absent=False, remarks=None, feedback=None, submitted_on=None,
+        graded_on=graded, created_at=graded,
+    )
+    db = SimpleNamespace(execute=AsyncMock(return_value=SimpleNamespace(all=lambda: [row])))
+    request = make_request("/api/v1/gradebook/grades/student/7")
+
+    async def get():
+        return await gradebook_api.get_student_grades(
+            request, 7, Response(), subject_id=None, limit=None, cursor=None,
+            current_user=SimpleNamespace(role="admin"),
+            principal=SimpleNamespace(student_id=None), db=db,
+        )
+
+    first = await get()
+    assert first.headers["ETag"] == '"v1"'
+    assert b'"assessment_title":"Unit Test 1"' in first.body and b'"assessment":' not in first.body
+    second = await get()
+    assert second.body == first.body and db.execute.await_count == 1
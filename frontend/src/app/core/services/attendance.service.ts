@@ -53,11 +53,13 @@ export class AttendanceService {
   getAttendanceStats(
     date: string,
     classId?: number,
-    sectionId?: number
+    sectionId?: number,
+    breakdown?: 'class' | 'section'
   ): Observable<AttendanceStats> {
     let params = new HttpParams();
     if (classId) params = params.set('class_id', classId.toString());
     if (sectionId) params = params.set('section_id', sectionId.toString());
+    if (breakdown) params = params.set('breakdown', breakdown);
 
     return this.http.get<AttendanceStats>(`${this.apiUrl}/stats/${date}`, { params });
   }
@@ -39,7 +39,7 @@ export interface AttendanceBulkCreate {
   attendance_records: { student_id: number; status: string }[];
 }
 
-export interface AttendanceStats {
+export interface AttendanceStatsCounts {
   total_students: number;
   present: number;
   absent: number;
@@ -50,6 +50,15 @@ export interface AttendanceStats {
   attendance_percentage: number;
 }
 
+export interface AttendanceStatsBreakdown extends AttendanceStatsCounts {
+  class_id: number | null;
+  section_id: number | null;
+}
+
+export interface AttendanceStats extends AttendanceStatsCounts {
+  breakdown?: AttendanceStatsBreakdown[] | null;
+}
+
 export interface StudentAttendanceSummary {
   student_id: number;
   student_name: string;